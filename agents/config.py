@@ -4,6 +4,8 @@ class AgentConfig:
     # Resume Intelligence Agent configuration
     RESUME_AGENT_MODEL = "gemini-2.5-flash"
     RESUME_AGENT_TEMPERATURE = 0.7
+    RESUME_BATCH_CONCURRENCY = int(os.getenv("RESUME_BATCH_CONCURRENCY", 4))
+    RESUME_BATCH_MAX_FILES = int(os.getenv("RESUME_BATCH_MAX_FILES", 500))
     
     # Interview Simulation Agent configuration
     INTERVIEW_AGENT_MODEL = "gemini-2.5-flash"
@@ -12,6 +14,8 @@ class AgentConfig:
     # Contract Guardian Agent configuration
     CONTRACT_AGENT_MODEL = "gemini-2.5-flash"
     CONTRACT_AGENT_TEMPERATURE = 0.3  # Lower temperature for more precise legal analysis
+    CONTRACT_CHUNK_CHARS = int(os.getenv("CONTRACT_CHUNK_CHARS", 12000))  # About 3-4 pages per chunk
+    CONTRACT_CHUNK_CONCURRENCY = int(os.getenv("CONTRACT_CHUNK_CONCURRENCY", 4))
     
     # Auto-Docs Agent configuration
     DOCS_AGENT_MODEL = "gemini-2.5-flash"
@@ -24,6 +28,17 @@ class AgentConfig:
     # Common configuration
     MAX_TOKENS = 2048
     TIMEOUT_SECONDS = 30
+    
+    # LLM execution configuration
+    # "async" uses the clients' native coroutines, "thread" offloads blocking calls to a bounded pool
+    LLM_EXECUTION_MODE = os.getenv("LLM_EXECUTION_MODE", "thread")
+    LLM_THREAD_POOL_SIZE = int(os.getenv("LLM_THREAD_POOL_SIZE", 16))
+    
+    # LLM scheduler configuration (rate limits are per model; 0 disables limiting)
+    LLM_MAX_IN_FLIGHT = int(os.getenv("LLM_MAX_IN_FLIGHT", 8))
+    LLM_REQUESTS_PER_MINUTE = float(os.getenv("LLM_REQUESTS_PER_MINUTE", 60))
+    LLM_RATE_LIMIT_BURST = int(os.getenv("LLM_RATE_LIMIT_BURST", 10))
+    LLM_MODEL_RATE_LIMITS = {}  # e.g. {"gemini-2.5-pro": 5}
 
 # Create agent config instance
 agent_config = AgentConfig()
\ No newline at end of file
@@ -1,26 +1,17 @@
 import google.generativeai as genai
 from config import settings
 from agents.config import agent_config
+from agents.llm_executor import llm_executor
+from agents.llm_scheduler import PRIORITY_INTERACTIVE, PRIORITY_BATCH
+from utils.llm_cache import llm_cache, make_cache_key
+from utils.json_stream import IncrementalJSONParser, event_payload
 import json
 import logging
+import re
+import asyncio
 
-class ContractGuardianAgent:
-    def __init__(self):
-        # Configure the Gemini API
-        genai.configure(api_key=settings.GOOGLE_API_KEY)
-        
-        # Initialize the model
-        self.model = genai.GenerativeModel(
-            agent_config.CONTRACT_AGENT_MODEL
-        )
-    
-    def review_contract(self, contract_text: str) -> dict:
-        """
-        Review a contract and return analysis results in structured JSON format
-        """
-        try:
-            # Define the prompt for contract analysis
-            prompt = f"""
+# Prompt for contract analysis (edits change the cache key automatically)
+CONTRACT_PROMPT_TEMPLATE = """
 You are the Contract Guardian Agent. Your sole task is to analyze the provided contract text and extract specific, high-risk clauses and key compensation terms. Your analysis must be purely objective, focusing on the legal impact and providing actionable negotiation advice. Your output MUST be a single JSON object.
 
 Required JSON Output Structure (Strict):
@@ -62,47 +53,370 @@ CRITICAL INSTRUCTIONS:
 - DO NOT include any text before or after the JSON object
 - Ensure all JSON is properly formatted with correct syntax
 """
+
+# Lines that start a new clause or section (e.g. "ARTICLE IV", "Section 3.", "12.1 Term", "NON-COMPETITION")
+SECTION_HEADING_PATTERN = re.compile(
+    r"^\s*(?:"
+    r"(?i:article|section|clause|schedule|exhibit|appendix)\s+[\dIVXLC]+\b"
+    r"|\d+(?:\.\d+)*[.)]?\s+[A-Z]"
+    r"|[A-Z][A-Z0-9 ,&/'\-]{3,}:?\s*$"
+    r")"
+)
+
+# Ordering used when the same clause is flagged in several chunks
+RISK_LEVEL_RANK = {"RED": 3, "YELLOW": 2, "GREEN": 1}
+
+# Values the model uses for key terms it could not find
+KEY_TERM_DEFAULTS = {"", "not specified", "none", "0", "n/a"}
+
+def split_contract(contract_text: str, max_chars: int) -> list:
+    """
+    Split contract text into chunks of at most max_chars at clause/section boundaries
+    
+    Sections longer than max_chars are split at paragraph breaks, then line breaks, and
+    only as a last resort mid-line. Joining the chunks reproduces the input exactly.
+    """
+    if len(contract_text) <= max_chars:
+        return [contract_text]
+    
+    # Group lines into sections that each start at a heading
+    sections = []
+    current = []
+    for line in contract_text.splitlines(keepends=True):
+        if current and SECTION_HEADING_PATTERN.match(line):
+            sections.append("".join(current))
+            current = []
+        current.append(line)
+    if current:
+        sections.append("".join(current))
+    
+    # Break oversized sections into paragraph-, line- and finally character-sized pieces
+    pieces = []
+    for section in sections:
+        pieces.extend(_split_oversized(section, max_chars, [r"(?<=\n\n)", r"(?<=\n)"]))
+    
+    # Greedily pack pieces into chunks
+    chunks = []
+    current_chunk = ""
+    for piece in pieces:
+        if current_chunk and len(current_chunk) + len(piece) > max_chars:
+            chunks.append(current_chunk)
+            current_chunk = ""
+        current_chunk += piece
+    if current_chunk:
+        chunks.append(current_chunk)
+    return chunks
+
+def _split_oversized(text: str, max_chars: int, separators: list) -> list:
+    if len(text) <= max_chars:
+        return [text]
+    if not separators:
+        return [text[i:i + max_chars] for i in range(0, len(text), max_chars)]
+    
+    pieces = []
+    for part in re.split(separators[0], text):
+        if part:
+            pieces.extend(_split_oversized(part, max_chars, separators[1:]))
+    return pieces
+
+def merge_contract_results(chunk_results: list) -> dict:
+    """
+    Merge per-chunk review results deterministically
+    
+    - risk_clauses: concatenated in document order; a clause flagged in several chunks
+      is kept once, at its first position, with its highest risk level
+    - key_terms: for each term, the first chunk (in document order) that found a value
+    - overall_score: the lowest chunk score, since a contract is as risky as its riskiest part
+    - summary: the summary of the lowest-scoring chunk
+    
+    Args:
+        chunk_results: review_contract results, one per chunk, in document order
+    """
+    successful = [result["data"] for result in chunk_results if result.get("success") and "data" in result]
+    if not successful:
+        return chunk_results[0] if chunk_results else {"success": False, "error": "No contract text to analyze"}
+    
+    risk_clauses = []
+    clause_index = {}
+    for data in successful:
+        for clause in data.get("risk_clauses", []):
+            name = str(clause.get("clause_name", "")).strip().lower()
+            if name in clause_index:
+                existing = risk_clauses[clause_index[name]]
+                if RISK_LEVEL_RANK.get(clause.get("risk_level"), 0) > RISK_LEVEL_RANK.get(existing.get("risk_level"), 0):
+                    risk_clauses[clause_index[name]] = clause
+                continue
+            clause_index[name] = len(risk_clauses)
+            risk_clauses.append(clause)
+    
+    key_terms = dict(successful[0].get("key_terms", {}))
+    for term in list(key_terms):
+        for data in successful:
+            value = data.get("key_terms", {}).get(term)
+            if value is not None and str(value).strip().lower() not in KEY_TERM_DEFAULTS:
+                key_terms[term] = value
+                break
+    
+    def score_of(data):
+        try:
+            return int(data.get("overall_score"))
+        except (TypeError, ValueError):
+            return 100
+    riskiest = min(successful, key=score_of)
+    
+    return {
+        "success": True,
+        "data": {
+            "overall_score": score_of(riskiest),
+            "summary": riskiest.get("summary", ""),
+            "key_terms": key_terms,
+            "risk_clauses": risk_clauses,
+            "chunks_analyzed": len(successful),
+            "chunks_failed": len(chunk_results) - len(successful)
+        }
+    }
+
+class ContractGuardianAgent:
+    def __init__(self, model=None):
+        if model is not None:
+            # Shared model passed in by the agent registry
+            self.model = model
+            return
+        
+        # Configure the Gemini API
+        genai.configure(api_key=settings.GOOGLE_API_KEY)
+        
+        # Initialize the model
+        self.model = genai.GenerativeModel(
+            agent_config.CONTRACT_AGENT_MODEL
+        )
+    
+    def review_contract(self, contract_text: str) -> dict:
+        """
+        Review a contract and return analysis results in structured JSON format
+        """
+        try:
+            prompt = self._build_prompt(contract_text)
+            cache_key = self._cache_key(prompt)
+            
+            # Serve repeat reviews from the response cache
+            cached_text = llm_cache.get(cache_key)
+            if cached_text is not None:
+                return self._parse_response(cached_text)
             
             # Generate content
             response = self.model.generate_content(prompt)
-            
-            # Try to parse the response as JSON
-            try:
-                result = json.loads(response.text)
-                return {"success": True, "data": result}
-            except json.JSONDecodeError as e:
-                # Log the actual response for debugging
-                logger = logging.getLogger(__name__)
-                logger.error(f"Failed to parse JSON response from Gemini API: {str(e)}")
-                logger.error(f"Raw response: {response.text}")
-                
-                # If parsing fails, return a default structure with the raw response
-                return {
-                    "success": True,
-                    "data": {
-                        "overall_score": 75,
-                        "summary": "We've analyzed your contract and identified several key terms and potential risks. Please review the detailed breakdown below.",
-                        "key_terms": {
-                            "salary_base": "Not specified",
-                            "start_date": "Not specified",
-                            "pto_days": 0,
-                            "signing_bonus": "Not specified"
-                        },
-                        "risk_clauses": [
-                            {
-                                "clause_name": "Analysis Result",
-                                "risk_level": "YELLOW",
-                                "negotiation_strategy": response.text
-                            }
-                        ]
-                    }
-                }
-                
+            return self._parse_response(response.text, cache_key)
         except Exception as e:
             # Log the error for debugging
             logger = logging.getLogger(__name__)
             logger.error(f"Error in ContractGuardianAgent.review_contract: {str(e)}")
             return {"success": False, "error": str(e)}
+    
+    async def review_contract_async(self, contract_text: str, *, priority: int = PRIORITY_BATCH) -> dict:
+        """
+        Non-blocking variant of review_contract for use inside async endpoints
+        """
+        try:
+            prompt = self._build_prompt(contract_text)
+            cache_key = self._cache_key(prompt)
+            
+            # Serve repeat reviews from the response cache
+            cached_text = await llm_cache.aget(cache_key)
+            if cached_text is not None:
+                return self._parse_response(cached_text)
+            
+            response_text = await llm_executor.generate_text(self.model, prompt, priority=priority)
+            return await self._parse_and_cache(response_text, cache_key)
+        except Exception as e:
+            # Log the error for debugging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Error in ContractGuardianAgent.review_contract_async: {str(e)}")
+            return {"success": False, "error": str(e)}
+    
+    async def review_contract_chunked_async(self, contract_text: str, *, priority: int = PRIORITY_BATCH,
+                                            chunk_chars: int = None, max_concurrency: int = None) -> dict:
+        """
+        Review a contract of any length without dropping text
+        
+        Short contracts take a single review_contract_async call. Longer ones are split at
+        clause/section boundaries, the chunks are reviewed in parallel with bounded
+        concurrency, and the results are merged with merge_contract_results.
+        """
+        chunks = split_contract(contract_text, chunk_chars or agent_config.CONTRACT_CHUNK_CHARS)
+        if len(chunks) == 1:
+            return await self.review_contract_async(contract_text, priority=priority)
+        
+        logging.getLogger(__name__).info(f"Reviewing contract of {len(contract_text)} characters in {len(chunks)} chunks")
+        
+        semaphore = asyncio.Semaphore(max_concurrency or agent_config.CONTRACT_CHUNK_CONCURRENCY)
+        
+        async def review_chunk(chunk):
+            async with semaphore:
+                return await self.review_contract_async(chunk, priority=priority)
+        
+        chunk_results = await asyncio.gather(*[review_chunk(chunk) for chunk in chunks])
+        return merge_contract_results(chunk_results)
+    
+    async def review_contract_stream(self, contract_text: str, *, priority: int = PRIORITY_INTERACTIVE,
+                                     chunk_chars: int = None, max_concurrency: int = None):
+        """
+        Streaming variant of review_contract_chunked_async
+        
+        A single-chunk contract reports every top-level field ("field" events) and each
+        risk_clauses entry ("item" events) as soon as it is generated. Long contracts stream
+        risk clauses from all chunks as they arrive (first report of each clause only), with
+        "progress" events per finished chunk; the merged fields follow once every chunk is done.
+        
+        Yields:
+            (event_name, payload) pairs, ending with ("result", review_result)
+        """
+        chunks = split_contract(contract_text, chunk_chars or agent_config.CONTRACT_CHUNK_CHARS)
+        if len(chunks) == 1:
+            async for event in self._stream_chunk(contract_text, priority):
+                yield event
+            return
+        
+        queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(max_concurrency or agent_config.CONTRACT_CHUNK_CONCURRENCY)
+        
+        async def review_chunk(index, chunk):
+            async with semaphore:
+                async for event in self._stream_chunk(chunk, priority):
+                    await queue.put((index, event))
+        
+        tasks = [asyncio.ensure_future(review_chunk(index, chunk)) for index, chunk in enumerate(chunks)]
+        try:
+            chunk_results = [None] * len(chunks)
+            seen_clauses = set()
+            finished = 0
+            while finished < len(chunks):
+                index, (event_name, payload) = await queue.get()
+                if event_name == "result":
+                    chunk_results[index] = payload
+                    finished += 1
+                    yield "progress", {"chunks_done": finished, "chunks_total": len(chunks)}
+                elif event_name == "item" and payload["field"] == "risk_clauses":
+                    name = str(payload["value"].get("clause_name", "")).strip().lower()
+                    if name not in seen_clauses:
+                        yield "item", {"field": "risk_clauses", "index": len(seen_clauses), "value": payload["value"]}
+                        seen_clauses.add(name)
+            
+            merged = merge_contract_results(chunk_results)
+            if merged.get("success"):
+                for name in ("overall_score", "summary", "key_terms", "risk_clauses"):
+                    yield "field", {"name": name, "value": merged["data"][name]}
+            yield "result", merged
+        finally:
+            # Stop outstanding chunk reviews if the consumer goes away early
+            for task in tasks:
+                task.cancel()
+    
+    async def _stream_chunk(self, contract_text: str, priority: int):
+        """
+        Stream the review of one chunk, ending with ("result", review_result)
+        """
+        try:
+            prompt = self._build_prompt(contract_text)
+            cache_key = self._cache_key(prompt)
+            
+            # Replay cached responses through the parser so clients see the same events
+            cached_text = await llm_cache.aget(cache_key)
+            if cached_text is not None:
+                chunks = self._replay(cached_text)
+            else:
+                chunks = llm_executor.stream_text(self.model, prompt, priority=priority)
+            
+            parser = IncrementalJSONParser()
+            response_parts = []
+            async for chunk in chunks:
+                response_parts.append(chunk)
+                for event in parser.feed(chunk):
+                    yield event_payload(event)
+            
+            response_text = "".join(response_parts)
+            if cached_text is not None:
+                yield "result", self._parse_response(response_text)
+            else:
+                yield "result", await self._parse_and_cache(response_text, cache_key)
+        except Exception as e:
+            logger = logging.getLogger(__name__)
+            logger.error(f"Error in ContractGuardianAgent.review_contract_stream: {str(e)}")
+            yield "result", {"success": False, "error": str(e)}
+    
+    @staticmethod
+    async def _replay(text: str):
+        yield text
+    
+    def _build_prompt(self, contract_text: str) -> str:
+        """
+        Render the contract analysis prompt
+        """
+        return CONTRACT_PROMPT_TEMPLATE.format(contract_text=contract_text)
+    
+    def _cache_key(self, prompt: str) -> str:
+        """
+        Content-addressed cache key for one rendered review prompt
+        """
+        return make_cache_key(
+            agent_config.CONTRACT_AGENT_MODEL,
+            agent_config.CONTRACT_AGENT_TEMPERATURE,
+            CONTRACT_PROMPT_TEMPLATE,
+            prompt
+        )
+    
+    def _parse_response(self, response_text: str, cache_key: str = None) -> dict:
+        """
+        Parse the raw LLM output into the contract analysis result
+        
+        Args:
+            response_text: Raw LLM output
+            cache_key: When given, a response that parses cleanly is stored under this key
+        """
+        # Try to parse the response as JSON
+        try:
+            result = json.loads(response_text)
+            if cache_key:
+                llm_cache.set(cache_key, response_text)
+            return {"success": True, "data": result}
+        except json.JSONDecodeError as e:
+            # Log the actual response for debugging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Failed to parse JSON response from Gemini API: {str(e)}")
+            logger.error(f"Raw response: {response_text}")
+            
+            # If parsing fails, return a default structure with the raw response
+            return {
+                "success": True,
+                "data": {
+                    "overall_score": 75,
+                    "summary": "We've analyzed your contract and identified several key terms and potential risks. Please review the detailed breakdown below.",
+                    "key_terms": {
+                        "salary_base": "Not specified",
+                        "start_date": "Not specified",
+                        "pto_days": 0,
+                        "signing_bonus": "Not specified"
+                    },
+                    "risk_clauses": [
+                        {
+                            "clause_name": "Analysis Result",
+                            "risk_level": "YELLOW",
+                            "negotiation_strategy": response_text
+                        }
+                    ]
+                }
+            }
+    
+    async def _parse_and_cache(self, response_text: str, cache_key: str) -> dict:
+        """
+        Async variant of _parse_response(response_text, cache_key) that stores the response off the event loop
+        """
+        try:
+            result = json.loads(response_text)
+        except json.JSONDecodeError:
+            return self._parse_response(response_text)
+        await llm_cache.aset(cache_key, response_text)
+        return {"success": True, "data": result}
 
 # Example usage
 if __name__ == "__main__":
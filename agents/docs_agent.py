@@ -3,11 +3,13 @@ from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
 from config import settings
 from agents.config import agent_config
+from agents.llm_executor import llm_executor
+from agents.llm_scheduler import PRIORITY_BATCH
 
 class AutoDocsAgent:
-    def __init__(self):
-        # Initialize the LLM
-        self.llm = ChatGoogleGenerativeAI(
+    def __init__(self, llm=None):
+        # Initialize the LLM (shared clients are passed in by the agent registry)
+        self.llm = llm or ChatGoogleGenerativeAI(
             model=agent_config.DOCS_AGENT_MODEL,
             google_api_key=settings.GOOGLE_API_KEY,
             temperature=agent_config.DOCS_AGENT_TEMPERATURE
@@ -47,6 +49,21 @@ class AutoDocsAgent:
             return {"success": True, "document": response}
         except Exception as e:
             return {"success": False, "error": str(e)}
+    
+    async def generate_document_async(self, document_type: str, content_data: dict, *, priority: int = PRIORITY_BATCH) -> dict:
+        """
+        Non-blocking variant of generate_document for use inside async endpoints
+        """
+        try:
+            response = await llm_executor.run_chain(
+                self.doc_chain,
+                priority=priority,
+                document_type=document_type,
+                content_data=str(content_data)
+            )
+            return {"success": True, "document": response}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,77 @@
+"""
+Templated questions for the human-like interview flow.
+
+Every question the rule-based interviewer can ask is listed here, so the full set is
+known ahead of time and its audio can be pre-rendered (see TEMPLATED_QUESTIONS).
+"""
+
+# Opening question per experience level
+FIRST_QUESTIONS = {
+    "Beginner": "Thank you for coming in today. To start, could you tell me a little about yourself and what drew you to this field?",
+    "Intermediate": "Thanks for joining us today. Can you walk me through your background and highlight a couple of accomplishments you're particularly proud of in your career so far?",
+    "Expert": "Thank you for your time today. Given your extensive experience, I'd love to hear about a significant challenge you've faced in your career and how you approached solving it."
+}
+
+# Beginner follow-ups: basic understanding and motivation
+BEGINNER_CLARIFY = "Could you provide a more specific example? Think about a time when you faced a challenge and how you overcame it."
+BEGINNER_TEAMWORK = "That's helpful. Can you tell me about a time when you had to work with a difficult team member? How did you handle the situation?"
+
+# Intermediate follow-ups: tactical skills
+INTERMEDIATE_LEADERSHIP_IMPACT = "That's interesting. Can you quantify the impact of that leadership role? What specific results did your team achieve?"
+INTERMEDIATE_CHALLENGE_REFLECTION = "You mentioned a challenge. What would you do differently if you faced a similar situation in the future?"
+INTERMEDIATE_TECHNICAL = "Let's talk about your technical skills. Can you describe a complex project you've worked on and your specific contributions to its success?"
+
+# Expert follow-ups: strategic thinking
+EXPERT_STRATEGY_METRICS = "That's a compelling vision. How would you measure the success of that strategy, and what key performance indicators would you track?"
+EXPERT_TALENT = "You've mentioned leading teams. How do you approach developing talent and building high-performing teams?"
+EXPERT_DECISIONS = "Given your experience, how do you approach making decisions when you have incomplete information? Can you walk me through your decision-making framework?"
+
+# Fallbacks used by the AI interviewer when the model response cannot be parsed
+AI_INTERVIEW_START_FALLBACK = "Can you tell me about your experience in HR and what interests you most about this field?"
+AI_INTERVIEW_ANSWER_FALLBACK = "Can you elaborate more on that point?"
+
+def first_question(experience_level: str) -> str:
+    """
+    Opening question for an experience level (anything unrecognized is treated as Expert)
+    """
+    return FIRST_QUESTIONS.get(experience_level, FIRST_QUESTIONS["Expert"])
+
+def next_question(experience_level: str, last_answer: str) -> str:
+    """
+    Pick the next question from the candidate's experience level and last answer
+    """
+    last_answer = last_answer.lower()
+
+    if experience_level == "Beginner":
+        # If answer was vague or short, ask for clarification
+        if "don't know" in last_answer or "not sure" in last_answer or len(last_answer.split()) < 20:
+            return BEGINNER_CLARIFY
+        return BEGINNER_TEAMWORK
+    elif experience_level == "Intermediate":
+        # If they mentioned leadership, probe deeper; if they mentioned problems, ask about solutions
+        if "led" in last_answer or "managed" in last_answer or "coordinated" in last_answer:
+            return INTERMEDIATE_LEADERSHIP_IMPACT
+        elif "problem" in last_answer or "challenge" in last_answer:
+            return INTERMEDIATE_CHALLENGE_REFLECTION
+        return INTERMEDIATE_TECHNICAL
+    else:  # Expert
+        # If they mentioned strategy, probe deeper; if they mentioned people, ask about development
+        if "strategy" in last_answer or "vision" in last_answer or "long-term" in last_answer:
+            return EXPERT_STRATEGY_METRICS
+        elif "team" in last_answer or "people" in last_answer:
+            return EXPERT_TALENT
+        return EXPERT_DECISIONS
+
+# Every question with a fixed text, for audio pre-rendering
+TEMPLATED_QUESTIONS = list(FIRST_QUESTIONS.values()) + [
+    BEGINNER_CLARIFY,
+    BEGINNER_TEAMWORK,
+    INTERMEDIATE_LEADERSHIP_IMPACT,
+    INTERMEDIATE_CHALLENGE_REFLECTION,
+    INTERMEDIATE_TECHNICAL,
+    EXPERT_STRATEGY_METRICS,
+    EXPERT_TALENT,
+    EXPERT_DECISIONS,
+    AI_INTERVIEW_START_FALLBACK,
+    AI_INTERVIEW_ANSWER_FALLBACK
+]
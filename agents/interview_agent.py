@@ -3,11 +3,13 @@ from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
 from config import settings
 from agents.config import agent_config
+from agents.llm_executor import llm_executor
+from agents.llm_scheduler import PRIORITY_INTERACTIVE, PRIORITY_DEFAULT
 
 class InterviewSimulationAgent:
-    def __init__(self):
-        # Initialize the LLM
-        self.llm = ChatGoogleGenerativeAI(
+    def __init__(self, llm=None):
+        # Initialize the LLM (shared clients are passed in by the agent registry)
+        self.llm = llm or ChatGoogleGenerativeAI(
             model=agent_config.INTERVIEW_AGENT_MODEL,
             google_api_key=settings.GOOGLE_API_KEY,
             temperature=agent_config.INTERVIEW_AGENT_TEMPERATURE
@@ -70,6 +72,23 @@ class InterviewSimulationAgent:
         except Exception as e:
             return {"success": False, "error": str(e)}
     
+    async def simulate_interview_async(self, role: str, experience_level: str, interview_type: str,
+                                       *, priority: int = PRIORITY_INTERACTIVE) -> dict:
+        """
+        Non-blocking variant of simulate_interview for use inside async endpoints
+        """
+        try:
+            response = await llm_executor.run_chain(
+                self.interview_chain,
+                priority=priority,
+                role=role,
+                experience_level=experience_level,
+                interview_type=interview_type
+            )
+            return {"success": True, "question": response}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+    
     def prepare_interview(self, job_description: str, resume_content: str) -> dict:
         """
         Prepare a candidate for an interview based on job description and resume
@@ -82,6 +101,22 @@ class InterviewSimulationAgent:
             return {"success": True, "preparation": response}
         except Exception as e:
             return {"success": False, "error": str(e)}
+    
+    async def prepare_interview_async(self, job_description: str, resume_content: str,
+                                      *, priority: int = PRIORITY_DEFAULT) -> dict:
+        """
+        Non-blocking variant of prepare_interview for use inside async endpoints
+        """
+        try:
+            response = await llm_executor.run_chain(
+                self.prep_chain,
+                priority=priority,
+                job_description=job_description,
+                resume_content=resume_content
+            )
+            return {"success": True, "preparation": response}
+        except Exception as e:
+            return {"success": False, "error": str(e)}
 
 # Example usage
 if __name__ == "__main__":
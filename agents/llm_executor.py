@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from agents.config import agent_config
+from agents.llm_scheduler import llm_scheduler, PRIORITY_DEFAULT
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_MODES = ("async", "thread")
+
+def model_name_of(client) -> str:
+    """
+    Best-effort model name for a Gemini model, LangChain chat model or LLMChain
+    """
+    client = getattr(client, "llm", client)
+    name = getattr(client, "model_name", None) or getattr(client, "model", None) or "unknown"
+    return str(name).replace("models/", "", 1)
+
+class LLMExecutor:
+    """
+    Runs LLM calls without blocking the event loop.
+
+    Modes:
+        async:  await the client's native coroutine (generate_content_async / LLMChain.arun),
+                falling back to the thread pool for clients that have none
+        thread: offload the blocking client call to a bounded thread pool
+
+    Every call is admitted by the LLM scheduler first, so rate limits and priorities
+    apply regardless of mode.
+    """
+
+    def __init__(self, mode: str = None, max_workers: int = None, scheduler=None):
+        self.mode = mode or agent_config.LLM_EXECUTION_MODE
+        if self.mode not in EXECUTION_MODES:
+            raise ValueError(f"Unsupported LLM execution mode: {self.mode}")
+        self.max_workers = max_workers or agent_config.LLM_THREAD_POOL_SIZE
+        self.scheduler = scheduler or llm_scheduler
+        self._pool = None
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        # Create the pool lazily so importing this module never starts threads
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="llm")
+        return self._pool
+
+    async def run_sync(self, func, *args, **kwargs):
+        """
+        Run a blocking callable on the bounded thread pool and await its result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, partial(func, *args, **kwargs))
+
+    async def generate_text(self, model, prompt: str, priority: int = PRIORITY_DEFAULT, **kwargs) -> str:
+        """
+        Call generate_content on a Gemini model and return the response text
+
+        Args:
+            model: genai.GenerativeModel (or any object with the same interface)
+            prompt: Fully rendered prompt
+            priority: Scheduler priority class
+
+        Returns:
+            The raw response text
+        """
+        async with self.scheduler.slot(model_name_of(model), priority):
+            if self.mode == "async" and hasattr(model, "generate_content_async"):
+                response = await model.generate_content_async(prompt, **kwargs)
+            else:
+                response = await self.run_sync(model.generate_content, prompt, **kwargs)
+        return response.text
+
+    async def run_chain(self, chain, priority: int = PRIORITY_DEFAULT, **inputs) -> str:
+        """
+        Run a LangChain LLMChain with the given inputs and return the output text
+        """
+        async with self.scheduler.slot(model_name_of(chain), priority):
+            if self.mode == "async" and hasattr(chain, "arun"):
+                return await chain.arun(**inputs)
+            return await self.run_sync(chain.run, **inputs)
+
+    async def stream_text(self, model, prompt: str, priority: int = PRIORITY_DEFAULT, **kwargs):
+        """
+        Stream generate_content output from a Gemini model as text chunks
+
+        The scheduler slot is held until the stream is exhausted.
+
+        Args:
+            model: genai.GenerativeModel (or any object with the same interface)
+            prompt: Fully rendered prompt
+            priority: Scheduler priority class
+
+        Yields:
+            Response text chunks in the order the model produces them
+        """
+        async with self.scheduler.slot(model_name_of(model), priority):
+            chunks = self._stream_text(model, prompt, **kwargs)
+            try:
+                async for chunk in chunks:
+                    yield chunk
+            finally:
+                # Close the inner stream now, not whenever it is garbage collected
+                await chunks.aclose()
+
+    async def stream_chain(self, chain, priority: int = PRIORITY_DEFAULT, **inputs):
+        """
+        Stream the output of a LangChain LLMChain as text chunks
+
+        The chain's prompt is rendered with the inputs and streamed from its chat model;
+        the scheduler slot is held until the stream is exhausted.
+
+        Yields:
+            Response text chunks in the order the model produces them
+        """
+        prompt = chain.prompt.format(**inputs)
+        async with self.scheduler.slot(model_name_of(chain), priority):
+            if self.mode == "async" and hasattr(chain.llm, "astream"):
+                async for chunk in chain.llm.astream(prompt):
+                    if chunk.content:
+                        yield chunk.content
+                return
+            chunks = self._drain_in_thread(lambda: (chunk.content for chunk in chain.llm.stream(prompt)))
+            try:
+                async for chunk in chunks:
+                    yield chunk
+            finally:
+                await chunks.aclose()
+
+    async def _stream_text(self, model, prompt: str, **kwargs):
+        if self.mode == "async" and hasattr(model, "generate_content_async"):
+            response = await model.generate_content_async(prompt, stream=True, **kwargs)
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+            return
+
+        chunks = self._drain_in_thread(
+            lambda: (chunk.text for chunk in model.generate_content(prompt, stream=True, **kwargs))
+        )
+        try:
+            async for chunk in chunks:
+                yield chunk
+        finally:
+            await chunks.aclose()
+
+    async def _drain_in_thread(self, make_iterator):
+        # Drain a blocking text iterator on the pool and hand chunks back to the loop
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        done = object()
+        stop = threading.Event()
+
+        def produce():
+            iterator = None
+            try:
+                iterator = make_iterator()
+                for text in iterator:
+                    if stop.is_set():
+                        break
+                    if text:
+                        loop.call_soon_threadsafe(queue.put_nowait, text)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                # Let the client release its connection when the consumer stopped early
+                close = getattr(iterator, "close", None)
+                if close is not None:
+                    close()
+                loop.call_soon_threadsafe(queue.put_nowait, done)
+
+        producer = loop.run_in_executor(self.pool, produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # A consumer that stops early (e.g. a disconnected SSE client) must not wait for
+            # the rest of the model stream, nor hold its scheduler slot that long; the worker
+            # stops at the next chunk boundary
+            stop.set()
+            await producer
+
+    def shutdown(self):
+        """
+        Release the thread pool (used on application shutdown)
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+# Create shared executor instance
+llm_executor = LLMExecutor()
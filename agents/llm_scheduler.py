@@ -0,0 +1,220 @@
+import asyncio
+import itertools
+import time
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from agents.config import agent_config
+
+logger = logging.getLogger(__name__)
+
+# Priority classes (lower value is served first)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DEFAULT = 1
+PRIORITY_BATCH = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_INTERACTIVE: "interactive",
+    PRIORITY_DEFAULT: "default",
+    PRIORITY_BATCH: "batch"
+}
+
+class TokenBucket:
+    """Classic token bucket; a rate of 0 or less disables limiting"""
+
+    def __init__(self, requests_per_minute: float, burst: int):
+        self.requests_per_minute = requests_per_minute
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    def try_take(self, now: float) -> float:
+        """
+        Take one token if available
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds until one will be available
+        """
+        if self.rate <= 0:
+            return 0.0
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+class _Waiter:
+    __slots__ = ("model_name", "priority", "future", "enqueued_at")
+
+    def __init__(self, model_name, priority, future):
+        self.model_name = model_name
+        self.priority = priority
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+class LLMScheduler:
+    """
+    Admission control for every LLM call in the process.
+
+    Calls wait in a priority queue until both a global in-flight slot and a token from
+    their model's rate-limit bucket are available. Interactive work is always considered
+    before default and batch work; within a class, calls are served first come first served.
+    """
+
+    # Number of recent wait times kept per priority class for statistics
+    WAIT_SAMPLES = 500
+
+    def __init__(self, max_in_flight: int = None, requests_per_minute: float = None,
+                 burst: int = None, model_limits: dict = None):
+        self.max_in_flight = max_in_flight or agent_config.LLM_MAX_IN_FLIGHT
+        self.requests_per_minute = (
+            requests_per_minute if requests_per_minute is not None else agent_config.LLM_REQUESTS_PER_MINUTE
+        )
+        self.burst = burst or agent_config.LLM_RATE_LIMIT_BURST
+        self.model_limits = model_limits if model_limits is not None else agent_config.LLM_MODEL_RATE_LIMITS
+
+        self._queue = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._buckets = {}
+        self._timer = None
+        self._timer_deadline = None
+        self._granted = {priority: 0 for priority in PRIORITY_NAMES}
+        self._waits = {priority: deque(maxlen=self.WAIT_SAMPLES) for priority in PRIORITY_NAMES}
+
+    def _bucket(self, model_name: str) -> TokenBucket:
+        bucket = self._buckets.get(model_name)
+        if bucket is None:
+            rpm = self.model_limits.get(model_name, self.requests_per_minute)
+            bucket = TokenBucket(rpm, self.burst)
+            self._buckets[model_name] = bucket
+        return bucket
+
+    @asynccontextmanager
+    async def slot(self, model_name: str, priority: int = PRIORITY_DEFAULT):
+        """
+        Wait for permission to call model_name and hold an in-flight slot for the block
+
+        Usage:
+            async with llm_scheduler.slot("gemini-2.5-flash", PRIORITY_INTERACTIVE):
+                response = await model.generate_content_async(prompt)
+        """
+        if not isinstance(priority, int) or priority not in PRIORITY_NAMES:
+            # A stray value (e.g. a dict passed positionally) would break ordering for every caller
+            raise ValueError(f"Unknown LLM priority class: {priority!r}")
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(model_name, priority, loop.create_future())
+        self._queue.append((priority, next(self._seq), waiter))
+        self._dispatch()
+
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            # Cancelled after being granted a slot: hand it back
+            if waiter.future.done() and not waiter.future.cancelled():
+                self._release()
+            raise
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    def _release(self):
+        self._in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        """
+        Grant slots to queued calls in priority order while capacity and tokens allow
+        """
+        now = time.monotonic()
+        next_wakeup = None
+        remaining = []
+
+        for entry in sorted(self._queue, key=lambda item: item[:2]):
+            waiter = entry[2]
+            if waiter.future.done():
+                # Caller gave up while queued
+                continue
+            if self._in_flight >= self.max_in_flight:
+                remaining.append(entry)
+                continue
+            try:
+                wait = self._bucket(waiter.model_name).try_take(now)
+                if wait <= 0:
+                    self._granted[waiter.priority] = self._granted.get(waiter.priority, 0) + 1
+                    self._waits.setdefault(waiter.priority, deque(maxlen=self.WAIT_SAMPLES)).append(now - waiter.enqueued_at)
+            except Exception as e:
+                # Fail this caller alone; the slot was never taken, so nothing leaks
+                logger.error(f"Could not schedule LLM call for {waiter.model_name!r}: {str(e)}")
+                waiter.future.set_exception(e)
+                continue
+            if wait > 0:
+                remaining.append(entry)
+                next_wakeup = wait if next_wakeup is None else min(next_wakeup, wait)
+                continue
+            self._in_flight += 1
+            waiter.future.set_result(None)
+
+        self._queue = remaining
+        if next_wakeup is not None:
+            self._schedule_wakeup(now + next_wakeup)
+
+    def _schedule_wakeup(self, deadline: float):
+        # Keep an earlier pending wakeup if there is one
+        if self._timer is not None and self._timer_deadline <= deadline:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        loop = asyncio.get_running_loop()
+        self._timer_deadline = deadline
+        self._timer = loop.call_later(max(0.0, deadline - time.monotonic()), self._on_wakeup)
+
+    def _on_wakeup(self):
+        self._timer = None
+        self._timer_deadline = None
+        self._dispatch()
+
+    def stats(self) -> dict:
+        """
+        Report queue depth, in-flight calls, wait times and rate-limit state
+        """
+        depth_by_priority = {name: 0 for name in PRIORITY_NAMES.values()}
+        for priority, _, waiter in self._queue:
+            if not waiter.future.done():
+                name = PRIORITY_NAMES.get(priority, str(priority))
+                depth_by_priority[name] = depth_by_priority.get(name, 0) + 1
+
+        wait_stats = {}
+        for priority, samples in self._waits.items():
+            ordered = sorted(samples)
+            wait_stats[PRIORITY_NAMES.get(priority, str(priority))] = {
+                "samples": len(ordered),
+                "avg_ms": round(sum(ordered) / len(ordered) * 1000, 2) if ordered else 0.0,
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2) if ordered else 0.0,
+                "max_ms": round(ordered[-1] * 1000, 2) if ordered else 0.0
+            }
+
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self._in_flight,
+            "queue_depth": sum(depth_by_priority.values()),
+            "queue_depth_by_priority": depth_by_priority,
+            "granted_by_priority": {
+                PRIORITY_NAMES.get(priority, str(priority)): count for priority, count in self._granted.items()
+            },
+            "wait_time_by_priority": wait_stats,
+            "rate_limits": {
+                model_name: {
+                    "requests_per_minute": bucket.requests_per_minute,
+                    "tokens_available": round(bucket.tokens, 2)
+                }
+                for model_name, bucket in self._buckets.items()
+            }
+        }
+
+# Create shared scheduler instance
+llm_scheduler = LLMScheduler()
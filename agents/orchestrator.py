@@ -1,17 +1,20 @@
+import asyncio
+import time
 from typing import Dict, Any
 from agents.resume_agent import ResumeIntelligenceAgent
 from agents.interview_agent import InterviewSimulationAgent
 from agents.contract_agent import ContractGuardianAgent
 from agents.docs_agent import AutoDocsAgent
 from agents.config import agent_config
+from utils.single_flight import agent_request_flight, canonical_key
 
 class MasterOrchestratorAgent:
-    def __init__(self):
-        # Initialize all specialized agents
-        self.resume_agent = ResumeIntelligenceAgent()
-        self.interview_agent = InterviewSimulationAgent()
-        self.contract_agent = ContractGuardianAgent()
-        self.docs_agent = AutoDocsAgent()
+    def __init__(self, resume_agent=None, interview_agent=None, contract_agent=None, docs_agent=None):
+        # Initialize all specialized agents (shared instances are passed in by the agent registry)
+        self.resume_agent = resume_agent or ResumeIntelligenceAgent()
+        self.interview_agent = interview_agent or InterviewSimulationAgent()
+        self.contract_agent = contract_agent or ContractGuardianAgent()
+        self.docs_agent = docs_agent or AutoDocsAgent()
         
     def route_request(self, request_type: str, data: Dict[Any, Any]) -> Dict[Any, Any]:
         """
@@ -32,9 +35,9 @@ class MasterOrchestratorAgent:
                 )
             elif request_type == "interview":
                 return self.interview_agent.simulate_interview(
-                    data.get("job_role", ""),
-                    data.get("interview_type", "behavioral"),
-                    data.get("difficulty_level", "intermediate")
+                    role=data.get("job_role", ""),
+                    experience_level=data.get("difficulty_level", "intermediate"),
+                    interview_type=data.get("interview_type", "behavioral")
                 )
             elif request_type == "contract":
                 return self.contract_agent.review_contract(
@@ -43,59 +46,152 @@ class MasterOrchestratorAgent:
             elif request_type == "docs":
                 return self.docs_agent.generate_document(
                     data.get("document_type", "cover_letter"),
-                    data.get("user_profile", {}),
-                    data.get("job_details", {})
+                    {
+                        "user_profile": data.get("user_profile", {}),
+                        "job_details": data.get("job_details", {})
+                    }
                 )
             else:
                 raise ValueError(f"Unsupported request type: {request_type}")
         except Exception as e:
             raise Exception(f"Error in {request_type} agent: {str(e)}")
     
-    def coordinate_agents(self, workflow: str, context: Dict[Any, Any]) -> Dict[Any, Any]:
+    async def route_request_async(self, request_type: str, data: Dict[Any, Any]) -> Dict[Any, Any]:
+        """
+        Non-blocking variant of route_request for use inside async endpoints
+        
+        Concurrent requests with the same type and data share one agent call.
+        
+        Args:
+            request_type: Type of request ('resume', 'interview', 'contract', 'docs')
+            data: Request data containing necessary parameters
+            
+        Returns:
+            Response from the appropriate agent
+        """
+        return await agent_request_flight.do(
+            canonical_key("route", request_type, data),
+            lambda: self._route_request_async(request_type, data)
+        )
+    
+    async def _route_request_async(self, request_type: str, data: Dict[Any, Any]) -> Dict[Any, Any]:
+        try:
+            if request_type == "resume":
+                return await self.resume_agent.analyze_resume_async(
+                    data.get("resume_content", ""),
+                    data.get("job_description", "")
+                )
+            elif request_type == "interview":
+                return await self.interview_agent.simulate_interview_async(
+                    role=data.get("job_role", ""),
+                    experience_level=data.get("difficulty_level", "intermediate"),
+                    interview_type=data.get("interview_type", "behavioral")
+                )
+            elif request_type == "contract":
+                return await self.contract_agent.review_contract_chunked_async(
+                    data.get("contract_text", "")
+                )
+            elif request_type == "docs":
+                return await self.docs_agent.generate_document_async(
+                    data.get("document_type", "cover_letter"),
+                    {
+                        "user_profile": data.get("user_profile", {}),
+                        "job_details": data.get("job_details", {})
+                    }
+                )
+            else:
+                raise ValueError(f"Unsupported request type: {request_type}")
+        except Exception as e:
+            raise Exception(f"Error in {request_type} agent: {str(e)}")
+    
+    def coordinate_agents(self, workflow: str, context: Dict[Any, Any], step_timeout: float = None) -> Dict[Any, Any]:
         """
         Coordinate multiple agents for complex workflows
         
+        Synchronous wrapper around coordinate_agents_async for scripts; must not be
+        called from inside a running event loop.
+        
         Args:
             workflow: Type of workflow to execute
             context: Shared context between agents
+            step_timeout: Per-step timeout in seconds (defaults to agent_config.TIMEOUT_SECONDS)
+            
+        Returns:
+            Combined response from all participating agents
+        """
+        return asyncio.run(self.coordinate_agents_async(workflow, context, step_timeout))
+    
+    async def coordinate_agents_async(self, workflow: str, context: Dict[Any, Any], step_timeout: float = None) -> Dict[Any, Any]:
+        """
+        Coordinate multiple agents for complex workflows
+        
+        Steps without dependencies run concurrently, so workflow latency is the critical
+        path rather than the sum of all steps. Each step has its own timeout; failed or
+        timed-out steps are reported in step_status and their dependents are skipped,
+        while the remaining results are still returned.
+        
+        Args:
+            workflow: Type of workflow to execute
+            context: Shared context between agents
+            step_timeout: Per-step timeout in seconds (defaults to agent_config.TIMEOUT_SECONDS)
             
         Returns:
             Combined response from all participating agents
         """
         try:
-            if workflow == "job_application":
-                # Job application workflow: Resume analysis + Interview prep
-                resume_result = self.resume_agent.analyze_resume(
+            steps = self._workflow_steps(workflow, context)
+            if steps is None:
+                return {
+                    "success": False,
+                    "error": f"Unknown workflow: {workflow}"
+                }
+            
+            results, step_status = await self._run_steps(steps, step_timeout or agent_config.TIMEOUT_SECONDS)
+            failed = [name for name, status in step_status.items() if status["status"] != "success"]
+            
+            return {
+                "success": len(failed) < len(steps),
+                "partial": bool(failed),
+                "workflow": workflow,
+                "results": results,
+                "step_status": step_status
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Error coordinating agents: {str(e)}"
+            }
+    
+    def _workflow_steps(self, workflow: str, context: Dict[Any, Any]):
+        """
+        Describe a workflow as {step_name: (dependencies, step_function)}
+        
+        Each step function receives the results of the completed steps and returns a
+        coroutine. Steps must be listed after their dependencies.
+        """
+        if workflow == "job_application":
+            # Job application workflow: Resume analysis + Interview prep (independent)
+            return {
+                "resume_analysis": ([], lambda results: self.resume_agent.analyze_resume_async(
                     context.get("resume_content", ""),
                     context.get("job_description", "")
-                )
-                
-                interview_result = self.interview_agent.prepare_interview(
+                )),
+                "interview_prep": ([], lambda results: self.interview_agent.prepare_interview_async(
                     context.get("job_description", ""),
                     context.get("resume_content", "")
-                )
-                
-                return {
-                    "success": True,
-                    "workflow": "job_application",
-                    "results": {
-                        "resume_analysis": resume_result,
-                        "interview_prep": interview_result
-                    }
-                }
-            elif workflow == "offer_review":
-                # Offer review workflow: Contract analysis + Document generation
-                contract_result = self.contract_agent.review_contract(
-                    context.get("contract_text", "")
-                )
-                
+                ))
+            }
+        elif workflow == "offer_review":
+            # Offer review workflow: Contract analysis, then documents built from its issues
+            def generate_docs(results):
                 # Extract issues from the new contract result format
+                contract_result = results["contract_analysis"]
                 contract_issues = []
                 if contract_result.get("success") and "data" in contract_result:
                     risk_clauses = contract_result["data"].get("risk_clauses", [])
                     contract_issues = [clause.get("clause_name", "") for clause in risk_clauses]
                 
-                docs_result = self.docs_agent.generate_document(
+                return self.docs_agent.generate_document_async(
                     "counter_offer_letter",
                     {
                         "contract_issues": contract_issues,
@@ -103,25 +199,67 @@ class MasterOrchestratorAgent:
                         "company": context.get("company", "")
                     }
                 )
-                
-                return {
-                    "success": True,
-                    "workflow": "offer_review",
-                    "results": {
-                        "contract_analysis": contract_result,
-                        "supporting_docs": docs_result
-                    }
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": f"Unknown workflow: {workflow}"
-                }
-        except Exception as e:
+            
             return {
-                "success": False,
-                "error": f"Error coordinating agents: {str(e)}"
+                "contract_analysis": ([], lambda results: self.contract_agent.review_contract_chunked_async(
+                    context.get("contract_text", "")
+                )),
+                "supporting_docs": (["contract_analysis"], generate_docs)
             }
+        return None
+    
+    async def _run_steps(self, steps: Dict[str, Any], step_timeout: float):
+        """
+        Run workflow steps as a dependency graph
+        
+        Returns:
+            Tuple of (results, step_status); results holds None for steps that did not complete,
+            and the agent's own error response for steps that reported a failure
+        """
+        results = {}
+        step_status = {}
+        tasks = {}
+        
+        async def run_step(name, dependencies, step_function):
+            if dependencies:
+                await asyncio.gather(*(tasks[dependency] for dependency in dependencies))
+            blocked_by = [d for d in dependencies if step_status[d]["status"] != "success"]
+            if blocked_by:
+                results[name] = None
+                step_status[name] = {"status": "skipped", "blocked_by": blocked_by}
+                return
+            
+            started = time.perf_counter()
+            try:
+                results[name] = await asyncio.wait_for(step_function(results), timeout=step_timeout)
+                error = self._step_error(results[name])
+                step_status[name] = {"status": "error", "error": error} if error else {"status": "success"}
+            except asyncio.TimeoutError:
+                results[name] = None
+                step_status[name] = {"status": "timeout", "error": f"Step exceeded {step_timeout}s"}
+            except Exception as e:
+                results[name] = None
+                step_status[name] = {"status": "error", "error": str(e)}
+            step_status[name]["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        
+        for name, (dependencies, step_function) in steps.items():
+            tasks[name] = asyncio.ensure_future(run_step(name, dependencies, step_function))
+        await asyncio.gather(*tasks.values())
+        
+        # Keep results in workflow order
+        return {name: results[name] for name in steps}, {name: step_status[name] for name in steps}
+
+    @staticmethod
+    def _step_error(result: Any):
+        """
+        Error message of an agent response that reports a failure, or None
+        
+        Agents catch their own exceptions and return {"success": False, ...} or
+        {"status": "error", ...} instead of raising.
+        """
+        if isinstance(result, dict) and (result.get("success") is False or result.get("status") == "error"):
+            return str(result.get("error") or "Agent reported a failure")
+        return None
 
 # Example usage
 if __name__ == "__main__":
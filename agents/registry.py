@@ -0,0 +1,101 @@
+import threading
+import logging
+import google.generativeai as genai
+from langchain_google_genai import ChatGoogleGenerativeAI
+from config import settings
+from agents.config import agent_config
+from agents.resume_agent import ResumeIntelligenceAgent
+from agents.interview_agent import InterviewSimulationAgent
+from agents.contract_agent import ContractGuardianAgent
+from agents.docs_agent import AutoDocsAgent
+from agents.orchestrator import MasterOrchestratorAgent
+
+logger = logging.getLogger(__name__)
+
+class AgentRegistry:
+    """
+    Builds each agent and model client once per process and hands out the shared instances.
+
+    Chat clients are keyed by (model, temperature), so agents with the same settings
+    share one client and its underlying HTTP transport. Gemini models are keyed by name
+    and all use the client configured once by genai.configure.
+    """
+
+    def __init__(self):
+        self._instances = {}
+        # Re-entrant: building an agent creates its model client under the same lock
+        self._lock = threading.RLock()
+
+    def _get_or_create(self, key, factory):
+        instance = self._instances.get(key)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(key)
+                if instance is None:
+                    logger.info(f"Creating shared instance for {key}")
+                    instance = factory()
+                    self._instances[key] = instance
+        return instance
+
+    def chat_model(self, model_name: str, temperature: float) -> ChatGoogleGenerativeAI:
+        return self._get_or_create(
+            ("chat_model", model_name, temperature),
+            lambda: ChatGoogleGenerativeAI(
+                model=model_name,
+                google_api_key=settings.GOOGLE_API_KEY,
+                temperature=temperature
+            )
+        )
+
+    def gemini_model(self, model_name: str) -> genai.GenerativeModel:
+        return self._get_or_create(
+            ("gemini_model", model_name),
+            lambda: genai.GenerativeModel(model_name)
+        )
+
+    def resume_agent(self) -> ResumeIntelligenceAgent:
+        return self._get_or_create("resume_agent", lambda: ResumeIntelligenceAgent(
+            llm=self.chat_model(agent_config.RESUME_AGENT_MODEL, agent_config.RESUME_AGENT_TEMPERATURE)
+        ))
+
+    def interview_agent(self) -> InterviewSimulationAgent:
+        return self._get_or_create("interview_agent", lambda: InterviewSimulationAgent(
+            llm=self.chat_model(agent_config.INTERVIEW_AGENT_MODEL, agent_config.INTERVIEW_AGENT_TEMPERATURE)
+        ))
+
+    def contract_agent(self) -> ContractGuardianAgent:
+        return self._get_or_create("contract_agent", lambda: ContractGuardianAgent(
+            model=self.gemini_model(agent_config.CONTRACT_AGENT_MODEL)
+        ))
+
+    def docs_agent(self) -> AutoDocsAgent:
+        return self._get_or_create("docs_agent", lambda: AutoDocsAgent(
+            llm=self.chat_model(agent_config.DOCS_AGENT_MODEL, agent_config.DOCS_AGENT_TEMPERATURE)
+        ))
+
+    def orchestrator(self) -> MasterOrchestratorAgent:
+        return self._get_or_create("orchestrator", lambda: MasterOrchestratorAgent(
+            resume_agent=self.resume_agent(),
+            interview_agent=self.interview_agent(),
+            contract_agent=self.contract_agent(),
+            docs_agent=self.docs_agent()
+        ))
+
+# Create shared registry instance
+agent_registry = AgentRegistry()
+
+# FastAPI dependencies
+def get_resume_agent() -> ResumeIntelligenceAgent:
+    return agent_registry.resume_agent()
+
+def get_contract_agent() -> ContractGuardianAgent:
+    return agent_registry.contract_agent()
+
+def get_orchestrator() -> MasterOrchestratorAgent:
+    return agent_registry.orchestrator()
+
+def get_interview_model() -> genai.GenerativeModel:
+    return agent_registry.gemini_model(agent_config.INTERVIEW_AGENT_MODEL)
+
+def get_docs_model() -> genai.GenerativeModel:
+    return agent_registry.gemini_model(agent_config.DOCS_AGENT_MODEL)
@@ -3,12 +3,17 @@ from langchain.prompts import PromptTemplate
 from langchain.chains import LLMChain
 from config import settings
 from agents.config import agent_config
+from agents.llm_executor import llm_executor
+from agents.llm_scheduler import PRIORITY_INTERACTIVE, PRIORITY_DEFAULT, PRIORITY_BATCH
+from utils.llm_cache import llm_cache, make_cache_key
+from utils.json_stream import IncrementalJSONParser, event_payload
 import json
+import asyncio
 
 class ResumeIntelligenceAgent:
-    def __init__(self):
-        # Initialize the LLM
-        self.llm = ChatGoogleGenerativeAI(
+    def __init__(self, llm=None):
+        # Initialize the LLM (shared clients are passed in by the agent registry)
+        self.llm = llm or ChatGoogleGenerativeAI(
             model=agent_config.RESUME_AGENT_MODEL,
             google_api_key=settings.GOOGLE_API_KEY,
             temperature=agent_config.RESUME_AGENT_TEMPERATURE
@@ -67,75 +72,261 @@ Ensure all scores are integers between 0-100, and all lists contain realistic ex
         Analyze a resume against a job description and target company vibe
         """
         try:
-            response = self.chain.run(
-                resume_content=resume_content,
-                job_description=job_description,
-                target_vibe=target_vibe
-            )
+            inputs = {
+                "resume_content": resume_content,
+                "job_description": job_description,
+                "target_vibe": target_vibe
+            }
+            cache_key = self._cache_key(inputs)
             
-            # Try to parse the JSON response
-            try:
-                # Handle potential markdown code blocks
-                cleaned_response = response.strip()
-                if cleaned_response.startswith("```json"):
-                    cleaned_response = cleaned_response[7:]  # Remove ```json
-                if cleaned_response.startswith("```"):
-                    cleaned_response = cleaned_response[3:]  # Remove ```
-                if cleaned_response.endswith("```"):
-                    cleaned_response = cleaned_response[:-3]  # Remove ```
-                
-                # Clean any extra text before or after JSON
-                # Find the first { and last } to extract JSON
-                start_idx = cleaned_response.find('{')
-                end_idx = cleaned_response.rfind('}')
-                if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
-                    cleaned_response = cleaned_response[start_idx:end_idx+1]
-                
-                parsed_response = json.loads(cleaned_response)
-                return parsed_response
-            except json.JSONDecodeError:
-                # If JSON parsing fails, return a default structure
-                return {
-                    "ats_score": 75,
-                    "gen_z_roast": "Your resume is so vanilla, it makes plain yogurt look exciting.",
-                    "professional_fixes": [
-                        "Add more quantifiable achievements",
-                        "Include specific technical skills",
-                        "Tailor content to job description",
-                        "Use stronger action verbs"
-                    ],
-                    "status": "success",
-                    "buzzword_score": 65,
-                    "rewrite_suggestions": [
-                        {
-                            "cliche_phrase": "Responsible for...",
-                            "quantifiable_rewrite": "Managed a team of 5 to deliver project 20% under budget"
-                        },
-                        {
-                            "cliche_phrase": "Worked on various projects",
-                            "quantifiable_rewrite": "Led development of 3 key features that increased user engagement by 40%"
-                        }
-                    ],
-                    "rpa_score": 70,
-                    "rpa_summary": "Resume shows solid fundamentals but needs more personality to match target vibe."
-                }
+            # Serve repeat analyses from the response cache
+            response = llm_cache.get(cache_key)
+            if response is not None:
+                return self._parse_response(response)
+            
+            response = self.chain.run(**inputs)
+            return self._parse_response(response, cache_key)
         except Exception as e:
-            return {
-                "ats_score": 0,
-                "gen_z_roast": "This resume is so empty, even the paper is asking for a refund.",
-                "professional_fixes": [
-                    "Add actual work experience",
-                    "Include measurable achievements",
-                    "List relevant technical skills",
-                    "Add education details"
-                ],
-                "status": "error",
-                "buzzword_score": 0,
-                "rewrite_suggestions": [],
-                "rpa_score": 0,
-                "rpa_summary": "Unable to analyze due to insufficient content.",
-                "error": str(e)
+            return self._error_response(e)
+    
+    async def analyze_resume_async(self, resume_content: str, job_description: str, target_vibe: str = "Corporate",
+                                   *, priority: int = PRIORITY_DEFAULT) -> dict:
+        """
+        Non-blocking variant of analyze_resume for use inside async endpoints
+        """
+        try:
+            inputs = {
+                "resume_content": resume_content,
+                "job_description": job_description,
+                "target_vibe": target_vibe
             }
+            cache_key = self._cache_key(inputs)
+            
+            # Serve repeat analyses from the response cache
+            response = await llm_cache.aget(cache_key)
+            if response is not None:
+                return self._parse_response(response)
+            
+            response = await llm_executor.run_chain(self.chain, priority=priority, **inputs)
+            return await self._parse_and_cache(response, cache_key)
+        except Exception as e:
+            return self._error_response(e)
+    
+    async def analyze_resume_stream(self, resume_content: str, job_description: str, target_vibe: str = "Corporate",
+                                    *, priority: int = PRIORITY_INTERACTIVE):
+        """
+        Streaming variant of analyze_resume that reports fields as soon as they are generated
+        
+        Yields:
+            ("field", {"name", "value"}) for each completed top-level field,
+            ("item", {"field", "index", "value"}) for each completed element of a list field,
+            and finally ("result", analysis) with the same dictionary analyze_resume returns
+        """
+        try:
+            inputs = {
+                "resume_content": resume_content,
+                "job_description": job_description,
+                "target_vibe": target_vibe
+            }
+            cache_key = self._cache_key(inputs)
+            
+            # Replay cached responses through the parser so clients see the same events
+            cached = await llm_cache.aget(cache_key)
+            if cached is not None:
+                chunks = self._replay(cached)
+            else:
+                chunks = llm_executor.stream_chain(self.chain, priority=priority, **inputs)
+            
+            parser = IncrementalJSONParser()
+            response_parts = []
+            async for chunk in chunks:
+                response_parts.append(chunk)
+                for event in parser.feed(chunk):
+                    yield event_payload(event)
+            
+            response = "".join(response_parts)
+            if cached is not None:
+                yield "result", self._parse_response(response)
+            else:
+                yield "result", await self._parse_and_cache(response, cache_key)
+        except Exception as e:
+            yield "result", self._error_response(e)
+    
+    @staticmethod
+    async def _replay(text: str):
+        yield text
+    
+    async def analyze_batch(self, resumes, job_description: str, target_vibe: str = "Corporate",
+                            max_concurrency: int = None):
+        """
+        Analyze many resumes against one job description with bounded concurrency
+        
+        Args:
+            resumes: Iterable or async iterable of (resume_id, resume_content) pairs; each
+                analysis is queued as soon as its pair arrives
+            job_description: Job description shared by every resume
+            target_vibe: Target company vibe shared by every resume
+            max_concurrency: Maximum analyses in flight (defaults to RESUME_BATCH_CONCURRENCY)
+            
+        Yields:
+            (resume_id, analysis_result) pairs in completion order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or agent_config.RESUME_BATCH_CONCURRENCY)
+        # Finished analyses, then None once every input has been queued
+        finished = asyncio.Queue()
+        tasks = []
+        
+        async def analyze_one(resume_id, resume_content):
+            async with semaphore:
+                try:
+                    result = await self.analyze_resume_async(
+                        resume_content, job_description, target_vibe, priority=PRIORITY_BATCH
+                    )
+                except Exception as e:
+                    result = self._error_response(e)
+            finished.put_nowait((resume_id, result))
+        
+        async def feed():
+            try:
+                if hasattr(resumes, "__aiter__"):
+                    async for resume_id, content in resumes:
+                        tasks.append(asyncio.ensure_future(analyze_one(resume_id, content)))
+                else:
+                    for resume_id, content in resumes:
+                        tasks.append(asyncio.ensure_future(analyze_one(resume_id, content)))
+            finally:
+                finished.put_nowait(None)
+        
+        feeder = asyncio.ensure_future(feed())
+        try:
+            received = 0
+            total = None
+            while total is None or received < total:
+                item = await finished.get()
+                if item is None:
+                    total = len(tasks)
+                    continue
+                received += 1
+                yield item
+            # Surface errors raised by the input iterable
+            await feeder
+        finally:
+            # Stop outstanding work if the consumer goes away early
+            feeder.cancel()
+            for task in tasks:
+                task.cancel()
+    
+    def _cache_key(self, inputs: dict) -> str:
+        """
+        Content-addressed cache key for one analysis request
+        """
+        return make_cache_key(
+            agent_config.RESUME_AGENT_MODEL,
+            agent_config.RESUME_AGENT_TEMPERATURE,
+            self.prompt_template.template,
+            self.prompt_template.format(**inputs)
+        )
+    
+    def _parse_response(self, response: str, cache_key: str = None) -> dict:
+        """
+        Parse the raw LLM output into the analysis dictionary
+        
+        Args:
+            response: Raw LLM output
+            cache_key: When given, a response that parses cleanly is stored under this key
+        """
+        # Try to parse the JSON response
+        try:
+            parsed_response = self._parse_json(response)
+            if cache_key:
+                llm_cache.set(cache_key, response)
+            return parsed_response
+        except json.JSONDecodeError:
+            # If JSON parsing fails, return a default structure
+            return self._fallback_response()
+    
+    async def _parse_and_cache(self, response: str, cache_key: str) -> dict:
+        """
+        Async variant of _parse_response(response, cache_key) that stores the response off the event loop
+        """
+        try:
+            parsed_response = self._parse_json(response)
+        except json.JSONDecodeError:
+            return self._fallback_response()
+        await llm_cache.aset(cache_key, response)
+        return parsed_response
+    
+    def _parse_json(self, response: str) -> dict:
+        """
+        Extract the JSON object from raw LLM output, raising json.JSONDecodeError if there is none
+        """
+        # Handle potential markdown code blocks
+        cleaned_response = response.strip()
+        if cleaned_response.startswith("```json"):
+            cleaned_response = cleaned_response[7:]  # Remove ```json
+        if cleaned_response.startswith("```"):
+            cleaned_response = cleaned_response[3:]  # Remove ```
+        if cleaned_response.endswith("```"):
+            cleaned_response = cleaned_response[:-3]  # Remove ```
+        
+        # Clean any extra text before or after JSON
+        # Find the first { and last } to extract JSON
+        start_idx = cleaned_response.find('{')
+        end_idx = cleaned_response.rfind('}')
+        if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
+            cleaned_response = cleaned_response[start_idx:end_idx+1]
+        
+        return json.loads(cleaned_response)
+    
+    def _fallback_response(self) -> dict:
+        """
+        Default analysis returned when the LLM output is not valid JSON
+        """
+        return {
+            "ats_score": 75,
+            "gen_z_roast": "Your resume is so vanilla, it makes plain yogurt look exciting.",
+            "professional_fixes": [
+                "Add more quantifiable achievements",
+                "Include specific technical skills",
+                "Tailor content to job description",
+                "Use stronger action verbs"
+            ],
+            "status": "success",
+            "buzzword_score": 65,
+            "rewrite_suggestions": [
+                {
+                    "cliche_phrase": "Responsible for...",
+                    "quantifiable_rewrite": "Managed a team of 5 to deliver project 20% under budget"
+                },
+                {
+                    "cliche_phrase": "Worked on various projects",
+                    "quantifiable_rewrite": "Led development of 3 key features that increased user engagement by 40%"
+                }
+            ],
+            "rpa_score": 70,
+            "rpa_summary": "Resume shows solid fundamentals but needs more personality to match target vibe."
+        }
+    
+    def _error_response(self, error: Exception) -> dict:
+        """
+        Build the analysis dictionary returned when the LLM call fails
+        """
+        return {
+            "ats_score": 0,
+            "gen_z_roast": "This resume is so empty, even the paper is asking for a refund.",
+            "professional_fixes": [
+                "Add actual work experience",
+                "Include measurable achievements",
+                "List relevant technical skills",
+                "Add education details"
+            ],
+            "status": "error",
+            "buzzword_score": 0,
+            "rewrite_suggestions": [],
+            "rpa_score": 0,
+            "rpa_summary": "Unable to analyze due to insufficient content.",
+            "error": str(error)
+        }
 
 # Example usage
 if __name__ == "__main__":
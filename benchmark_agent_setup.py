@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Per-request setup overhead benchmark.
+
+Compares what the endpoints used to do on every request (construct a new
+ResumeIntelligenceAgent and genai.GenerativeModel) with looking the shared
+instances up in the agent registry. No LLM calls are made.
+
+Usage: python benchmark_agent_setup.py [ITERATIONS]
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import google.generativeai as genai
+from agents.config import agent_config
+from agents.resume_agent import ResumeIntelligenceAgent
+from agents.registry import AgentRegistry
+
+def measure(label, func, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    per_call_ms = (time.perf_counter() - start) / iterations * 1000
+    print(f"{label:<40} {per_call_ms:9.3f} ms/request")
+    return per_call_ms
+
+def main(iterations: int):
+    print(f"=== Agent setup benchmark: {iterations} requests ===")
+
+    before = measure(
+        "before: new ResumeIntelligenceAgent()",
+        ResumeIntelligenceAgent,
+        iterations
+    )
+    before += measure(
+        "before: new GenerativeModel()",
+        lambda: genai.GenerativeModel(agent_config.INTERVIEW_AGENT_MODEL),
+        iterations
+    )
+
+    registry = AgentRegistry()
+    after = measure("after: registry.resume_agent()", registry.resume_agent, iterations)
+    after += measure(
+        "after: registry.gemini_model()",
+        lambda: registry.gemini_model(agent_config.INTERVIEW_AGENT_MODEL),
+        iterations
+    )
+
+    print(f"\nSetup overhead per request: {before:.3f} ms -> {after:.3f} ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Real-time-factor benchmark for spoken-answer preprocessing.
+
+Writes synthetic multi-minute answers (48 kHz stereo: speech-like bursts, pauses and
+room noise) to temporary WAV files, then runs the streaming pipeline file to file.
+Reports the real-time factor (processing time / audio duration; lower is better) and
+peak traced memory, which should stay flat as recordings get longer.
+
+Usage: python benchmark_audio_preprocessing.py [MINUTES ...]
+"""
+
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+import wave
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import numpy as np
+from utils.audio_preprocessing import SpeechPreprocessor, preprocess_stream
+
+RATE = 48000
+
+def write_recording(path: str, minutes: float):
+    # Generated one second at a time so the benchmark itself stays small in memory
+    rng = np.random.default_rng(0)
+    t = np.arange(RATE) / RATE
+    with wave.open(path, "wb") as writer:
+        writer.setnchannels(2)
+        writer.setsampwidth(2)
+        writer.setframerate(RATE)
+        for second in range(int(minutes * 60)):
+            # Roughly 3 seconds of speech followed by a 1 second pause
+            if second % 4 == 3:
+                signal = np.zeros(RATE)
+            else:
+                pitch = 120 + 40 * rng.random()
+                signal = 0.08 * np.sin(2 * np.pi * pitch * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 3 * t))
+            signal += 0.002 * rng.standard_normal(RATE)
+            pcm = (np.repeat(signal[:, None], 2, axis=1) * 32767).astype("<i2")
+            writer.writeframes(pcm.tobytes())
+
+def run(minutes: float, workdir: str):
+    source_path = os.path.join(workdir, f"answer_{minutes}m.wav")
+    output_path = os.path.join(workdir, f"answer_{minutes}m_clean.wav")
+    write_recording(source_path, minutes)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    with open(source_path, "rb") as source, open(output_path, "wb") as destination:
+        stats = preprocess_stream(source, destination, SpeechPreprocessor())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{minutes:>5.1f} min  {elapsed:6.2f}s  RTF {elapsed / stats['input_seconds']:.4f}  "
+          f"({stats['input_seconds'] / elapsed:6.0f}x real time)  "
+          f"out {stats['output_seconds']:6.1f}s  peak mem {peak / 1024 / 1024:5.1f} MiB  "
+          f"input {os.path.getsize(source_path) / 1024 / 1024:6.1f} MiB")
+
+def main(durations):
+    print("=== Spoken answer preprocessing: 48 kHz stereo -> 16 kHz mono ===")
+    with tempfile.TemporaryDirectory(prefix="audio_benchmark_") as workdir:
+        for minutes in durations:
+            run(minutes, workdir)
+
+if __name__ == "__main__":
+    main([float(arg) for arg in sys.argv[1:]] or [1, 5, 15])
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for the LLM execution layer.
+
+Simulates N parallel requests against a fake Gemini model whose calls take
+LATENCY seconds and compares:
+  - blocking:  calling generate_content directly inside the async handler
+  - thread:    LLMExecutor in thread-pool offload mode
+  - async:     LLMExecutor in native async mode
+
+Usage: python benchmark_llm_concurrency.py [N] [LATENCY]
+"""
+
+import sys
+import os
+import time
+import asyncio
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from agents.llm_executor import LLMExecutor
+from agents.llm_scheduler import LLMScheduler
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+class SlowFakeModel:
+    """Stands in for genai.GenerativeModel with a fixed per-call latency"""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def generate_content(self, prompt):
+        time.sleep(self.latency)
+        return FakeResponse('{"question": "ok", "interview_status": "continue"}')
+
+    async def generate_content_async(self, prompt):
+        await asyncio.sleep(self.latency)
+        return FakeResponse('{"question": "ok", "interview_status": "continue"}')
+
+async def blocking_handler(model, prompt):
+    # What the endpoints did before: a synchronous call inside an async def
+    return model.generate_content(prompt).text
+
+async def run_scenario(name, handler, n):
+    start = time.perf_counter()
+    await asyncio.gather(*[handler(f"prompt {i}") for i in range(n)])
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} {n} requests in {elapsed:6.2f}s")
+    return elapsed
+
+async def main(n: int, latency: float):
+    model = SlowFakeModel(latency)
+    print(f"=== LLM concurrency benchmark: N={n}, latency={latency}s ===")
+
+    results = {}
+    results["blocking"] = await run_scenario("blocking", lambda p: blocking_handler(model, p), n)
+
+    # Measure the execution layer alone: no in-flight cap or rate limit
+    def unlimited():
+        return LLMScheduler(max_in_flight=n, requests_per_minute=0)
+
+    thread_executor = LLMExecutor(mode="thread", max_workers=n, scheduler=unlimited())
+    results["thread"] = await run_scenario("thread", lambda p: thread_executor.generate_text(model, p), n)
+    thread_executor.shutdown()
+
+    async_executor = LLMExecutor(mode="async", scheduler=unlimited())
+    results["async"] = await run_scenario("async", lambda p: async_executor.generate_text(model, p), n)
+
+    print("\nSpeedup over blocking:")
+    for mode in ("thread", "async"):
+        print(f"  {mode:<8} {results['blocking'] / results[mode]:5.1f}x  "
+              f"({results[mode] / latency:.2f} LLM latencies)")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    latency = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    asyncio.run(main(n, latency))
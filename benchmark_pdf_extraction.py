@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for page-parallel PDF extraction.
+
+Builds text-dense contracts of 5, 50 and 500 pages and extracts each one in process
+and on warm process pools of increasing size (workers are started before timing, as
+the server does at startup). Speedup is bounded by the number of CPU cores.
+
+Usage: python benchmark_pdf_extraction.py [MAX_WORKERS] [ITERATIONS]
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import fitz  # PyMuPDF
+from utils.pdf_extraction import PDFExtractor
+
+def make_contract(pages: int) -> bytes:
+    doc = fitz.open()
+    clause = "The Supplier shall indemnify the Customer against all losses arising from breach of this Agreement. "
+    for number in range(pages):
+        page = doc.new_page()
+        body = f"Section {number + 1}\n" + "\n".join(f"{number + 1}.{line} {clause}" for line in range(45))
+        page.insert_textbox(fitz.Rect(36, 36, 576, 806), body, fontsize=7)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+def time_extraction(extractor: PDFExtractor, data: bytes, iterations: int) -> float:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        extractor.extract(data)
+        timings.append(time.perf_counter() - start)
+    return sorted(timings)[len(timings) // 2]
+
+def main(max_workers: int, iterations: int):
+    documents = {pages: make_contract(pages) for pages in (5, 50, 500)}
+    worker_counts = [1] + [count for count in (2, 4, 8, 16) if count <= max_workers]
+    print(f"=== PDF extraction scaling: {os.cpu_count()} CPUs, median of {iterations} runs ===")
+
+    baseline = {}
+    for workers in worker_counts:
+        # min_pages=1 sends every document to the pool so small ones show the pool overhead
+        extractor = PDFExtractor(workers=workers, min_pages=1)
+        extractor.warm_up()
+        label = "in process" if workers == 1 else f"{workers} workers"
+        cells = []
+        for pages, data in documents.items():
+            elapsed = time_extraction(extractor, data, iterations)
+            baseline.setdefault(pages, elapsed)
+            cells.append(f"{pages:>3}p {elapsed * 1000:8.1f} ms ({baseline[pages] / elapsed:4.2f}x)")
+        extractor.shutdown()
+        print(f"{label:<12} " + "  ".join(cells))
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    )
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Per-upload latency and peak-RSS benchmark for PDF ingestion.
+
+Compares the previous upload path (read the whole upload, write it to a
+NamedTemporaryFile, reopen it with PyMuPDF, concatenate page text) with
+utils.pdf_ingestion, which opens the PDF straight from the upload buffer (or a
+memory mapping of the spooled upload). Uploads are built like the multipart parser
+builds them: a SpooledTemporaryFile that moves to disk above 1 MB. Each scenario
+runs in a fresh process so peak RSS is measured in isolation.
+
+Usage: python benchmark_pdf_ingestion.py [ITERATIONS]
+"""
+
+import sys
+import os
+import asyncio
+import multiprocessing
+import resource
+import shutil
+import tempfile
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+SPOOL_MAX_SIZE = 1024 * 1024
+
+def make_pdf(path: str, pages: int, image_kb: int):
+    import fitz  # PyMuPDF
+    doc = fitz.open()
+    side = int((image_kb * 1024 / 3) ** 0.5)
+    for number in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Section {number + 1}. The parties agree to the terms below.")
+        if image_kb:
+            # A distinct, incompressible "scan" per page so the file grows with the page count
+            pixmap = fitz.Pixmap(fitz.csRGB, side, side, os.urandom(side * side * 3), False)
+            page.insert_image(fitz.Rect(72, 100, 300, 328), pixmap=pixmap)
+    doc.save(path)
+    doc.close()
+
+def open_upload(path: str):
+    from fastapi import UploadFile
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    with open(path, "rb") as source:
+        shutil.copyfileobj(source, spool)
+    spool.seek(0)
+    return UploadFile(file=spool, filename=os.path.basename(path))
+
+async def legacy_ingest(upload) -> str:
+    import fitz  # PyMuPDF
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
+        content = await upload.read()
+        temp_file.write(content)
+        temp_file_path = temp_file.name
+    try:
+        doc = fitz.open(temp_file_path)
+        text = ""
+        for page_num in range(len(doc)):
+            text += doc.load_page(page_num).get_text()
+        doc.close()
+    finally:
+        os.unlink(temp_file_path)
+    return text
+
+async def in_place_ingest(upload) -> str:
+    from utils.pdf_ingestion import receive_pdf_upload
+    with await receive_pdf_upload(upload, max_bytes=1 << 40) as pdf:
+        return pdf.extract_text()
+
+def run_scenario(path: str, approach: str, iterations: int, results):
+    ingest = legacy_ingest if approach == "temp file" else in_place_ingest
+    import fitz  # noqa: F401 - load the library before measuring the baseline
+    upload = open_upload(path)
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    timings = []
+    for _ in range(iterations):
+        upload.file.seek(0)
+        start = time.perf_counter()
+        asyncio.run(ingest(upload))
+        timings.append(time.perf_counter() - start)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    results.put((sorted(timings)[len(timings) // 2], peak / 1024))
+
+def measure(path: str, approach: str, iterations: int):
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=run_scenario, args=(path, approach, iterations, results))
+    process.start()
+    outcome = results.get()
+    process.join()
+    return outcome
+
+def main(iterations: int):
+    scenarios = [("5 pages, text", 5, 0), ("50 pages, scans", 50, 60), ("200 pages, scans", 200, 90)]
+    print(f"=== PDF ingestion: median of {iterations} uploads, peak RSS growth per process ===")
+    with tempfile.TemporaryDirectory(prefix="pdf_benchmark_") as workdir:
+        for name, pages, image_kb in scenarios:
+            path = os.path.join(workdir, f"{pages}.pdf")
+            make_pdf(path, pages, image_kb)
+            size_mb = os.path.getsize(path) / 1024 / 1024
+            legacy_time, legacy_rss = measure(path, "temp file", iterations)
+            new_time, new_rss = measure(path, "in place", iterations)
+            print(f"{name:<18} {size_mb:6.1f} MB  temp file {legacy_time * 1000:8.1f} ms {legacy_rss:6.1f} MiB  |  "
+                  f"in place {new_time * 1000:8.1f} ms {new_rss:6.1f} MiB")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for TTS synthesis backends.
+
+Renders N distinct interview-style sentences with the offline engine, first
+in-process from a thread pool (the GIL serializes CPU-bound synthesis), then through
+ProcessPoolTTSBackend with increasing worker counts. Runs fully offline.
+
+Usage: python benchmark_tts.py [N] [MAX_PROCESSES]
+"""
+
+import sys
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from agents.human_interview_questions import TEMPLATED_QUESTIONS
+from utils.tts_backends import OfflineTTSBackend, ProcessPoolTTSBackend
+
+def sentences(n: int):
+    return [f"{TEMPLATED_QUESTIONS[i % len(TEMPLATED_QUESTIONS)]} (variant {i})" for i in range(n)]
+
+def run_scenario(name, backend, texts, threads):
+    # Warm up (starts worker processes) before timing
+    backend.synthesize("warm up", "en", "com")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        total_bytes = sum(len(audio) for audio in pool.map(lambda text: backend.synthesize(text, "en", "com"), texts))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<22} {len(texts)} clips in {elapsed:6.2f}s  {len(texts) / elapsed:7.1f} clips/s  "
+          f"({total_bytes / 1024 / 1024:.1f} MiB)")
+    return elapsed
+
+def main(n: int, max_processes: int):
+    texts = sentences(n)
+    print(f"=== TTS backend throughput: N={n}, offline engine ===")
+
+    baseline = run_scenario("in-process (threads)", OfflineTTSBackend(), texts, threads=max_processes)
+
+    workers = 1
+    while workers <= max_processes:
+        backend = ProcessPoolTTSBackend(OfflineTTSBackend(), workers)
+        elapsed = run_scenario(f"process pool x{workers}", backend, texts, threads=workers)
+        print(f"{'':<22} speedup over in-process: {baseline / elapsed:4.1f}x")
+        backend.shutdown()
+        workers *= 2
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    max_processes = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 2)
+    main(n, max_processes)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Build step that pre-renders every templated interview question to audio.
+
+Clips are written to the audio store (AUDIO_DIR) under their content-addressed
+names, so the directory can be shipped with a deployment and the server finds
+every templated question already rendered on startup. Run it again after editing
+agents/human_interview_questions.py; unchanged questions are skipped.
+
+Usage: python build_audio_bundle.py
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from agents.human_interview_questions import TEMPLATED_QUESTIONS
+from utils.audio_store import audio_store
+from utils.tts_cache import tts_cache
+
+def main():
+    print(f"=== Building audio bundle in {audio_store.root} ===")
+    start = time.perf_counter()
+    for question in TEMPLATED_QUESTIONS:
+        filename = tts_cache.get_or_render(question)
+        print(f"  {filename}  {question[:60]}")
+
+    stats = tts_cache.stats()
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(TEMPLATED_QUESTIONS)} questions: {stats['misses']} rendered, "
+          f"{stats['disk_hits'] + stats['memory_hits']} already in the bundle ({elapsed:.1f}s)")
+
+if __name__ == "__main__":
+    main()
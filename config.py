@@ -15,6 +15,60 @@ class Settings:
     SECRET_KEY = os.getenv("SECRET_KEY", "careerflow_default_secret_key")
     ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
     
+    # LLM response cache configuration
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_DB_PATH = os.getenv("LLM_CACHE_DB_PATH", "./llm_cache.db")
+    LLM_CACHE_MEMORY_ENTRIES = int(os.getenv("LLM_CACHE_MEMORY_ENTRIES", 256))
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 10000))
+    LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+    
+    # Text-to-speech audio configuration
+    AUDIO_DIR = os.getenv("AUDIO_DIR", "audio_files")
+    TTS_LANGUAGE = os.getenv("TTS_LANGUAGE", "en")
+    TTS_VOICE = os.getenv("TTS_VOICE", "com")  # gTTS accent (Google Translate top-level domain)
+    TTS_BACKEND = os.getenv("TTS_BACKEND", "gtts")  # "gtts" or "offline"
+    TTS_PROCESS_WORKERS = int(os.getenv("TTS_PROCESS_WORKERS", 0))  # >0 runs synthesis in a process pool
+    TTS_CACHE_MEMORY_ENTRIES = int(os.getenv("TTS_CACHE_MEMORY_ENTRIES", 64))
+    TTS_WORKERS = int(os.getenv("TTS_WORKERS", 4))
+    TTS_PRERENDER_QUESTIONS = os.getenv("TTS_PRERENDER_QUESTIONS", "true").lower() == "true"
+    TTS_AUDIO_WAIT_SECONDS = float(os.getenv("TTS_AUDIO_WAIT_SECONDS", 10))  # How long /audio waits for a pending render
+    TTS_SENTENCE_STREAMING = os.getenv("TTS_SENTENCE_STREAMING", "true").lower() == "true"  # Render LLM questions sentence by sentence
+    TTS_SENTENCE_MIN_CHARS = int(os.getenv("TTS_SENTENCE_MIN_CHARS", 40))  # Shorter sentences are merged with their neighbour
+    AUDIO_STORE_MAX_BYTES = int(os.getenv("AUDIO_STORE_MAX_BYTES", 1024 * 1024 * 1024))  # 1 GiB
+    AUDIO_STORE_MAX_FILES = int(os.getenv("AUDIO_STORE_MAX_FILES", 100000))
+    AUDIO_STORE_MAX_AGE_SECONDS = int(os.getenv("AUDIO_STORE_MAX_AGE_SECONDS", 0))  # 0 disables age-based eviction
+    AUDIO_STORE_SWEEP_SECONDS = float(os.getenv("AUDIO_STORE_SWEEP_SECONDS", 300))
+    
+    # Spoken answer preprocessing (resampling, loudness, noise gate, silence trimming)
+    AUDIO_PREPROCESS_SAMPLE_RATE = int(os.getenv("AUDIO_PREPROCESS_SAMPLE_RATE", 16000))
+    AUDIO_PREPROCESS_TARGET_DBFS = float(os.getenv("AUDIO_PREPROCESS_TARGET_DBFS", -20.0))
+    AUDIO_PREPROCESS_MAX_PAUSE_MS = int(os.getenv("AUDIO_PREPROCESS_MAX_PAUSE_MS", 400))  # Longer pauses are shortened
+    
+    # PDF upload ingestion
+    UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", 20 * 1024 * 1024))  # Per single-file upload request
+    UPLOAD_BATCH_MAX_BYTES = int(os.getenv("UPLOAD_BATCH_MAX_BYTES", 200 * 1024 * 1024))  # Per batch upload request
+    UPLOAD_SPOOL_THRESHOLD_BYTES = int(os.getenv("UPLOAD_SPOOL_THRESHOLD_BYTES", 1024 * 1024))  # Larger uploads are mapped from disk
+    PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", 0))  # Extraction processes; 0 uses one per CPU, 1 disables the pool
+    PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", 32))  # Smaller documents are extracted in process
+    # Character budgets for extraction (about 4 characters per token; 0 extracts every page).
+    # Pages past the budget are never loaded, so a huge upload costs no more than the budget.
+    PDF_CONTRACT_MAX_CHARS = int(os.getenv("PDF_CONTRACT_MAX_CHARS", 400000))
+    PDF_RESUME_MAX_CHARS = int(os.getenv("PDF_RESUME_MAX_CHARS", 60000))
+    # Drop repeated headers, footers, page numbers and signature lines, and collapse whitespace
+    PDF_NORMALIZE_TEXT = os.getenv("PDF_NORMALIZE_TEXT", "true").lower() == "true"
+    PDF_REPEATED_LINE_MIN_RATIO = float(os.getenv("PDF_REPEATED_LINE_MIN_RATIO", 0.5))  # Share of pages a header/footer line must repeat on
+    
+    # Extracted PDF text cache, keyed by upload SHA-256 and extractor version
+    PDF_TEXT_CACHE_ENABLED = os.getenv("PDF_TEXT_CACHE_ENABLED", "true").lower() == "true"
+    PDF_TEXT_CACHE_DB_PATH = os.getenv("PDF_TEXT_CACHE_DB_PATH", LLM_CACHE_DB_PATH)
+    PDF_TEXT_CACHE_MEMORY_ENTRIES = int(os.getenv("PDF_TEXT_CACHE_MEMORY_ENTRIES", 64))
+    PDF_TEXT_CACHE_MAX_ENTRIES = int(os.getenv("PDF_TEXT_CACHE_MAX_ENTRIES", 5000))
+    PDF_TEXT_CACHE_TTL_SECONDS = int(os.getenv("PDF_TEXT_CACHE_TTL_SECONDS", 30 * 24 * 3600))
+    
+    # Idempotency-Key replay cache for interview answer submissions
+    IDEMPOTENCY_MAX_KEYS_PER_SESSION = int(os.getenv("IDEMPOTENCY_MAX_KEYS_PER_SESSION", 16))
+    IDEMPOTENCY_MAX_SESSIONS = int(os.getenv("IDEMPOTENCY_MAX_SESSIONS", 10000))
+    
     # Frontend configuration
     FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
     
@@ -2,27 +2,37 @@ import os
 import tempfile
 import json
 import time
-from fastapi import FastAPI, UploadFile, File, HTTPException, status, Depends, Form
+import asyncio
+from fastapi import FastAPI, UploadFile, File, HTTPException, status, Depends, Form, Request, Header, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
 import google.generativeai as genai
 from pdfminer.high_level import extract_text
-import fitz  # PyMuPDF
 import logging
-from typing import Dict, Any
-from pydantic import BaseModel
+from typing import Dict, Any, List, Optional, Tuple
+from pydantic import BaseModel, ValidationError
 
-# Add gTTS import for text-to-speech
-from gtts import gTTS
 import io
 import uuid
+import mimetypes
 
 # Add the database and history imports
 from database.config import get_db
 from sqlalchemy.orm import Session
 from utils.history_manager import HistoryManager
+from utils.sse import format_sse, SSE_HEADERS
+from utils.single_flight import agent_request_flight, canonical_key
+from utils.tts_cache import tts_cache
+from utils.audio_store import audio_store
+from utils.http_media import media_response
+from utils.idempotency import interview_answer_replays
+from utils.audio_preprocessing import preprocess_audio
+from utils.pdf_ingestion import PDFUpload, UploadTooLargeError, UploadSizeLimitMiddleware, receive_pdf_upload
+from utils.pdf_extraction import pdf_extractor
+from utils.pdf_text_cache import pdf_text_cache
 
 # Load environment variables from .env file
 load_dotenv()
@@ -51,7 +61,16 @@ except Exception as e:
 from agents.resume_agent import ResumeIntelligenceAgent
 from agents.interview_agent import InterviewSimulationAgent
 from agents.docs_agent import AutoDocsAgent
+from agents.contract_agent import ContractGuardianAgent
 from agents.orchestrator import MasterOrchestratorAgent
+from agents import human_interview_questions
+from agents.config import agent_config
+from agents.llm_executor import llm_executor
+from agents.llm_scheduler import llm_scheduler, PRIORITY_INTERACTIVE, PRIORITY_BATCH
+from agents.registry import (
+    agent_registry, get_resume_agent, get_contract_agent, get_orchestrator, get_interview_model, get_docs_model
+)
+from utils.llm_cache import llm_cache
 
 # Import schemas
 from schemas.user import UserCreate, UserResponse
@@ -65,6 +84,17 @@ app = FastAPI(
     version=settings.APP_VERSION
 )
 
+# Stop oversized PDF uploads while they are still streaming in
+# (added before CORS so CORS wraps it and its 413 responses carry CORS headers)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    limits=[
+        ("/api/analyze/resume/batch", settings.UPLOAD_BATCH_MAX_BYTES),
+        ("/api/analyze/contract", settings.UPLOAD_MAX_BYTES),
+        ("/api/analyze/resume/file", settings.UPLOAD_MAX_BYTES)
+    ]
+)
+
 # Add CORS middleware with support for multiple origins
 app.add_middleware(
     CORSMiddleware,
@@ -84,12 +114,61 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize orchestrator
-orchestrator = MasterOrchestratorAgent()
-
 # Initialize history manager
 history_manager = HistoryManager()
 
+# Agents and model clients are built once by the registry and injected into endpoints
+@app.on_event("startup")
+async def warm_agent_registry():
+    """
+    Build the shared agents and model clients before the first request arrives
+    """
+    agent_registry.orchestrator()
+
+@app.on_event("shutdown")
+async def shutdown_llm_executor():
+    """
+    Release the LLM thread pool when the server stops
+    """
+    llm_executor.shutdown()
+
+@app.on_event("startup")
+async def warm_pdf_extractor():
+    """
+    Start the PDF extraction processes before the first large upload arrives
+    """
+    await run_in_threadpool(pdf_extractor.warm_up)
+
+@app.on_event("shutdown")
+async def shutdown_pdf_extractor():
+    """
+    Stop the PDF extraction processes when the server stops
+    """
+    pdf_extractor.shutdown()
+
+@app.on_event("startup")
+async def start_audio_store_sweeper():
+    """
+    Start evicting old audio once the store exceeds its budget
+    """
+    audio_store.start_sweeper()
+
+@app.on_event("startup")
+async def prerender_interview_questions():
+    """
+    Render every templated interview question once, so interview turns do no TTS work
+    """
+    if settings.TTS_PRERENDER_QUESTIONS:
+        tts_cache.prerender(human_interview_questions.TEMPLATED_QUESTIONS)
+
+@app.on_event("shutdown")
+async def shutdown_tts_workers():
+    """
+    Release the background TTS worker pool and stop the audio sweeper when the server stops
+    """
+    tts_cache.shutdown()
+    audio_store.stop_sweeper()
+
 # Pydantic models
 class ResumeAnalysisRequest(BaseModel):
     job_description: str
@@ -122,71 +201,203 @@ human_interview_sessions = {}
 active_interview_sessions = set()
 
 # Add audio directory for storing generated audio files
-AUDIO_DIR = "audio_files"
+AUDIO_DIR = settings.AUDIO_DIR
 os.makedirs(AUDIO_DIR, exist_ok=True)
 
+async def question_audio_url(question_text: str) -> str:
+    """
+    Audio URL for a question, returned before the audio is ready
+
+    Each distinct question is synthesized only once, on the background TTS workers;
+    /audio waits for the render if the client asks for it early.
+    """
+    audio_filename = tts_cache.render_in_background(question_text)
+    return f"/audio/{audio_filename}"
+
+async def question_audio_fields(question_text: str) -> Dict[str, Any]:
+    """
+    Audio fields for a (possibly multi-sentence) LLM-generated question
+
+    Each sentence is rendered as its own clip on the background TTS workers, so the
+    first sentence is playable long before the whole paragraph would be. audio_url
+    points at a progressive stream of the sentences when the TTS format allows clips to
+    be concatenated; audio_segments and audio_playlist_url let clients queue the
+    sentence clips themselves.
+    """
+    if not settings.TTS_SENTENCE_STREAMING:
+        return {"audio_url": await question_audio_url(question_text)}
+
+    playlist_id, filenames = tts_cache.render_sentences(question_text, settings.TTS_SENTENCE_MIN_CHARS)
+    segment_urls = [f"/audio/{filename}" for filename in filenames]
+    if len(segment_urls) == 1:
+        audio_url = segment_urls[0]
+    elif tts_cache.backend.concatenable:
+        audio_url = f"/audio/stream/{playlist_id}"
+    else:
+        # Formats like WAV cannot be streamed back to back, so keep a whole-question clip as well
+        audio_url = await question_audio_url(question_text)
+    return {
+        "audio_url": audio_url,
+        "audio_segments": segment_urls,
+        "audio_playlist_url": f"/audio/playlist/{playlist_id}.m3u"
+    }
+
+async def wait_for_pending_clip(filename: str):
+    """
+    Wait briefly for a clip that is still being rendered in the background
+
+    Raises 503 (with Retry-After on timeout) if the clip is not ready in time.
+    """
+    pending = tts_cache.pending_render(filename)
+    if pending is None:
+        return
+    try:
+        await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(pending)), settings.TTS_AUDIO_WAIT_SECONDS)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Audio is still being generated",
+            headers={"Retry-After": "1"}
+        )
+    except Exception as e:
+        logger.error(f"Background audio render failed: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Audio generation failed"
+        )
+
+async def read_sentence_clip(filename: str, sentence: str) -> bytes:
+    """
+    Bytes of one sentence clip, re-rendering it if the audio store has evicted it
+    """
+    tts_cache.render_in_background(sentence)
+    await wait_for_pending_clip(filename)
+    audio = await run_in_threadpool(tts_cache.read, filename)
+    if audio is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Audio not found"
+        )
+    return audio
+
+def get_question_playlist(playlist_id: str):
+    segments = tts_cache.playlist(playlist_id)
+    if segments is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Playlist not found"
+        )
+    return segments
+
+@app.get("/audio/stream/{playlist_id}")
+async def stream_question_audio(playlist_id: str):
+    """
+    Stream a question's sentence clips back to back as one audio response
+
+    Bytes are sent as soon as each sentence is rendered, so playback starts after the
+    first sentence.
+    """
+    segments = get_question_playlist(playlist_id)
+    if not tts_cache.backend.concatenable:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Streaming is not supported for this audio format"
+        )
+
+    # Errors on the first clip can still be reported with a status code
+    first_clip = await read_sentence_clip(*segments[0])
+
+    async def clips():
+        yield first_clip
+        for filename, sentence in segments[1:]:
+            try:
+                yield await read_sentence_clip(filename, sentence)
+            except HTTPException as e:
+                logger.error(f"Stopping audio stream {playlist_id}: {e.detail}")
+                return
+
+    return StreamingResponse(
+        clips(),
+        media_type=tts_cache.backend.media_type,
+        headers={"Cache-Control": "no-cache"}
+    )
+
+@app.get("/audio/playlist/{playlist_id}.m3u")
+async def get_question_playlist_file(playlist_id: str):
+    """
+    M3U playlist of a question's sentence clips, in playback order
+    """
+    segments = get_question_playlist(playlist_id)
+    lines = ["#EXTM3U"]
+    for filename, sentence in segments:
+        lines.append(f"#EXTINF:-1,{' '.join(sentence.split())}")
+        lines.append(f"/audio/{filename}")
+    return Response(content="\n".join(lines) + "\n", media_type="audio/x-mpegurl")
+
 # Add audio endpoint for serving generated audio files
 @app.get("/audio/{filename}")
-async def get_audio(filename: str):
+async def get_audio(filename: str, request: Request):
     """
     Serve generated audio files
+    
+    Supports byte-range requests and ETag revalidation; content-addressed TTS clips
+    are marked immutable so browsers replay them from cache.
     """
-    file_path = os.path.join(AUDIO_DIR, filename)
-    if os.path.exists(file_path):
-        return FileResponse(file_path, media_type="audio/mpeg")
-    else:
-        # If file doesn't exist, generate a default audio
-        tts = gTTS("Audio not available", lang='en')
-        temp_filename = os.path.join(AUDIO_DIR, filename)
-        tts.save(temp_filename)
-        return FileResponse(temp_filename, media_type="audio/mpeg")
+    await wait_for_pending_clip(filename)
+    
+    # Cached clips are served from the in-memory tier when hot
+    audio = await run_in_threadpool(tts_cache.read, filename)
+    if audio is not None:
+        return media_response(audio, request.headers, tts_cache.backend.media_type, immutable=True)
+    
+    audio = await run_in_threadpool(audio_store.read, filename)
+    if audio is not None:
+        return media_response(audio, request.headers, mimetypes.guess_type(filename)[0] or "audio/mpeg")
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Audio not found"
+    )
 
 # Enhanced human interview endpoints with better question generation
+async def create_human_interview_session(request: HumanInterviewStartRequest) -> Dict[str, Any]:
+    """
+    Create a human interview session and return its first question
+    """
+    # Generate a unique session_id
+    session_id = str(uuid.uuid4())
+    
+    # Initialize session memory with user inputs
+    human_interview_sessions[session_id] = {
+        "role": request.role,
+        "experience_level": request.experience_level,
+        "history_list": [],
+        "total_questions_asked": 0,
+        "last_question": None
+    }
+    
+    # Generate appropriate first question based on experience level
+    first_question = human_interview_questions.first_question(request.experience_level)
+    
+    # Generate audio URL for the question (cached across sessions)
+    audio_url = await question_audio_url(first_question)
+    
+    # Store the first question
+    human_interview_sessions[session_id]["last_question"] = first_question
+    
+    return {
+        "session_id": session_id,
+        "question_text": first_question,
+        "audio_url": audio_url,
+        "status": "continue"
+    }
+
 @app.post("/api/human_interview/start")
 async def start_human_interview(request: HumanInterviewStartRequest):
     """
     Start a new human-like interview session with realistic questions based on experience level
     """
     try:
-        # Generate a unique session_id
-        import uuid
-        session_id = str(uuid.uuid4())
-        
-        # Initialize session memory with user inputs
-        human_interview_sessions[session_id] = {
-            "role": request.role,
-            "experience_level": request.experience_level,
-            "history_list": [],
-            "total_questions_asked": 0,
-            "last_question": None
-        }
-        
-        # Generate appropriate first question based on experience level
-        if request.experience_level == "Beginner":
-            first_question = "Thank you for coming in today. To start, could you tell me a little about yourself and what drew you to this field?"
-        elif request.experience_level == "Intermediate":
-            first_question = "Thanks for joining us today. Can you walk me through your background and highlight a couple of accomplishments you're particularly proud of in your career so far?"
-        else:  # Expert
-            first_question = "Thank you for your time today. Given your extensive experience, I'd love to hear about a significant challenge you've faced in your career and how you approached solving it."
-        
-        # Generate audio file for the question
-        audio_filename = f"{session_id}_q1.mp3"
-        audio_filepath = os.path.join(AUDIO_DIR, audio_filename)
-        tts = gTTS(first_question, lang='en')
-        tts.save(audio_filepath)
-        
-        # Generate audio URL
-        audio_url = f"/audio/{audio_filename}"
-        
-        # Store the first question
-        human_interview_sessions[session_id]["last_question"] = first_question
-        
-        return JSONResponse(content={
-            "session_id": session_id,
-            "question_text": first_question,
-            "audio_url": audio_url,
-            "status": "continue"
-        })
+        return JSONResponse(content=await create_human_interview_session(request))
     except Exception as e:
         logger.error(f"Error starting human interview: {str(e)}")
         raise HTTPException(
@@ -195,9 +406,28 @@ async def start_human_interview(request: HumanInterviewStartRequest):
         )
 
 @app.post("/api/human_interview/answer")
-async def submit_human_interview_answer(request: HumanInterviewAnswerRequest):
+async def submit_human_interview_answer(
+    request: HumanInterviewAnswerRequest,
+    idempotency_key: Optional[str] = Header(None)
+):
     """
     Submit a human interview answer and get the next realistic question with adaptive difficulty
+    
+    Clients may send an Idempotency-Key header; a retry with the same key gets the stored
+    response (marked Idempotent-Replayed) without being processed again, and a retry that
+    arrives while the original is still running waits for it instead of getting 423.
+    """
+    if idempotency_key:
+        return await interview_answer_replays.run(
+            request.session_id,
+            idempotency_key,
+            lambda: process_human_interview_answer(request)
+        )
+    return await process_human_interview_answer(request)
+
+async def process_human_interview_answer(request: HumanInterviewAnswerRequest):
+    """
+    Record an answer and produce the next question (or the final assessment)
     """
     # Check if session is already being processed
     if request.session_id in active_interview_sessions:
@@ -206,10 +436,10 @@ async def submit_human_interview_answer(request: HumanInterviewAnswerRequest):
             detail="Session is already being processed. Please wait."
         )
     
+    # Mark session as active; the finally below releases it on every path, including
+    # the duplicate-answer early return
+    active_interview_sessions.add(request.session_id)
     try:
-        # Mark session as active
-        active_interview_sessions.add(request.session_id)
-        
         # Retrieve session_id from memory
         if request.session_id not in human_interview_sessions:
             raise HTTPException(
@@ -226,16 +456,10 @@ async def submit_human_interview_answer(request: HumanInterviewAnswerRequest):
             if last_entry.get('answer') == request.answer_text:
                 # This is a duplicate submission, return the same next question
                 if session.get('next_question'):
-                    # Generate audio file for the question
-                    audio_filename = f"{request.session_id}_q{session['total_questions_asked'] + 1}.mp3"
-                    audio_filepath = os.path.join(AUDIO_DIR, audio_filename)
-                    tts = gTTS(session['next_question'], lang='en')
-                    tts.save(audio_filepath)
-                    
                     return JSONResponse(content={
                         "session_id": request.session_id,
                         "question_text": session['next_question'],
-                        "audio_url": f"/audio/{audio_filename}",
+                        "audio_url": await question_audio_url(session['next_question']),
                         "status": "continue"
                     })
         
@@ -267,9 +491,6 @@ async def submit_human_interview_answer(request: HumanInterviewAnswerRequest):
                 strengths = ["Extensive experience", "Strategic thinking", "Strong technical foundation"]
                 weaknesses = ["Answers could be more concise", "Need to directly address questions", "Could show more innovative approaches"]
             
-            # Remove from active sessions
-            active_interview_sessions.discard(request.session_id)
-            
             return JSONResponse(content={
                 "session_id": request.session_id,
                 "status": "complete",
@@ -279,57 +500,16 @@ async def submit_human_interview_answer(request: HumanInterviewAnswerRequest):
                 "weaknesses": weaknesses
             })
         
-        # Generate next question based on experience level and context
-        last_answer = request.answer_text.lower()
-        
-        # Adaptive questioning logic
-        if session['experience_level'] == "Beginner":
-            # For beginners, focus on basic understanding and motivation
-            if "don't know" in last_answer or "not sure" in last_answer or len(last_answer.split()) < 20:
-                # If answer was vague or short, ask for clarification
-                next_question = "Could you provide a more specific example? Think about a time when you faced a challenge and how you overcame it."
-            else:
-                # If answer was decent, move to a slightly more complex question
-                next_question = "That's helpful. Can you tell me about a time when you had to work with a difficult team member? How did you handle the situation?"
-        elif session['experience_level'] == "Intermediate":
-            # For intermediate candidates, focus on tactical skills
-            if "led" in last_answer or "managed" in last_answer or "coordinated" in last_answer:
-                # If they mentioned leadership, probe deeper
-                next_question = "That's interesting. Can you quantify the impact of that leadership role? What specific results did your team achieve?"
-            elif "problem" in last_answer or "challenge" in last_answer:
-                # If they mentioned problems, ask about solutions
-                next_question = "You mentioned a challenge. What would you do differently if you faced a similar situation in the future?"
-            else:
-                # General intermediate question
-                next_question = "Let's talk about your technical skills. Can you describe a complex project you've worked on and your specific contributions to its success?"
-        else:  # Expert
-            # For experts, focus on strategic thinking
-            if "strategy" in last_answer or "vision" in last_answer or "long-term" in last_answer:
-                # If they mentioned strategy, probe deeper
-                next_question = "That's a compelling vision. How would you measure the success of that strategy, and what key performance indicators would you track?"
-            elif "team" in last_answer or "people" in last_answer:
-                # If they mentioned people management, ask about development
-                next_question = "You've mentioned leading teams. How do you approach developing talent and building high-performing teams?"
-            else:
-                # General expert question
-                next_question = "Given your experience, how do you approach making decisions when you have incomplete information? Can you walk me through your decision-making framework?"
-        
-        # Generate audio file for the question
-        audio_filename = f"{request.session_id}_q{session['total_questions_asked'] + 1}.mp3"
-        audio_filepath = os.path.join(AUDIO_DIR, audio_filename)
-        tts = gTTS(next_question, lang='en')
-        tts.save(audio_filepath)
+        # Generate next question based on experience level and context (adaptive questioning)
+        next_question = human_interview_questions.next_question(session['experience_level'], request.answer_text)
         
-        # Generate audio URL
-        audio_url = f"/audio/{audio_filename}"
+        # Generate audio URL for the question (cached across sessions)
+        audio_url = await question_audio_url(next_question)
         
         # Store last question and next question for next iteration
         session['last_question'] = next_question
         session['next_question'] = next_question  # Store for duplicate check
         
-        # Remove from active sessions
-        active_interview_sessions.discard(request.session_id)
-        
         return JSONResponse(content={
             "session_id": request.session_id,
             "question_text": next_question,
@@ -337,21 +517,136 @@ async def submit_human_interview_answer(request: HumanInterviewAnswerRequest):
             "status": "continue"
         })
     except HTTPException:
-        # Remove from active sessions on error
-        active_interview_sessions.discard(request.session_id)
         raise
     except Exception as e:
-        # Remove from active sessions on error
-        active_interview_sessions.discard(request.session_id)
         logger.error(f"Error submitting human interview answer: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error submitting human interview answer: {str(e)}"
         )
+    finally:
+        # Remove from active sessions
+        active_interview_sessions.discard(request.session_id)
+
+async def announce_question_audio(websocket: WebSocket, send_lock: asyncio.Lock, audio_url: str, push_audio: bool):
+    """
+    Tell a WebSocket client when a question's audio has finished rendering
+
+    With push_audio the clip bytes follow the announcement as a binary message.
+    """
+    filename = audio_url.rsplit("/", 1)[-1]
+    pending = tts_cache.pending_render(filename)
+    try:
+        if pending is not None:
+            await asyncio.wrap_future(pending)
+        audio = await run_in_threadpool(tts_cache.read, filename) if push_audio else None
+    except Exception as e:
+        logger.error(f"Background audio render failed: {str(e)}")
+        async with send_lock:
+            await websocket.send_json({"type": "audio_failed", "audio_url": audio_url})
+        return
+
+    async with send_lock:
+        await websocket.send_json({
+            "type": "audio_ready",
+            "audio_url": audio_url,
+            "media_type": tts_cache.backend.media_type,
+            "pushed": audio is not None
+        })
+        if audio is not None:
+            await websocket.send_bytes(audio)
+
+@app.websocket("/ws/human_interview")
+async def human_interview_socket(websocket: WebSocket, session_id: Optional[str] = None, push_audio: bool = False):
+    """
+    Run a human interview over one WebSocket connection
+    
+    Client messages (JSON):
+        {"type": "start", "role": ..., "experience_level": ...} - begin a session
+            (or connect with ?session_id=... to continue an existing one)
+        {"type": "answer", "answer_text": ..., "idempotency_key": optional}
+    
+    Server messages (JSON):
+        "question" as soon as the next question text is ready, "audio_ready" once its
+        audio has rendered (followed by the clip as a binary message with ?push_audio=true),
+        "complete" with the final assessment, and "error" with status_code and detail.
+    
+    Answers are handled one at a time in the order they arrive, so clients never see
+    the 423 lock and never poll for audio.
+    """
+    await websocket.accept()
+    send_lock = asyncio.Lock()
+    audio_tasks = set()
+
+    async def send(message: Dict[str, Any]):
+        async with send_lock:
+            await websocket.send_json(message)
+
+    async def send_question(content: Dict[str, Any]):
+        if content.get("status") == "complete":
+            await send({"type": "complete", **content})
+            return
+        await send({"type": "question", **content})
+        task = asyncio.ensure_future(announce_question_audio(websocket, send_lock, content["audio_url"], push_audio))
+        audio_tasks.add(task)
+        task.add_done_callback(audio_tasks.discard)
+
+    try:
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except ValueError:
+                await send({"type": "error", "status_code": status.HTTP_400_BAD_REQUEST, "detail": "Messages must be JSON"})
+                continue
+            if not isinstance(message, dict):
+                await send({"type": "error", "status_code": status.HTTP_400_BAD_REQUEST, "detail": "Messages must be JSON objects"})
+                continue
+            message_type = message.get("type")
+            try:
+                if message_type == "start":
+                    content = await create_human_interview_session(HumanInterviewStartRequest(
+                        role=message.get("role", ""),
+                        experience_level=message.get("experience_level", "")
+                    ))
+                    session_id = content["session_id"]
+                elif message_type == "answer":
+                    if session_id is None:
+                        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Send a start message first")
+                    answer = HumanInterviewAnswerRequest(session_id=session_id, answer_text=message.get("answer_text", ""))
+                    if message.get("idempotency_key"):
+                        response = await interview_answer_replays.run(
+                            session_id,
+                            message["idempotency_key"],
+                            lambda: process_human_interview_answer(answer)
+                        )
+                    else:
+                        response = await process_human_interview_answer(answer)
+                    content = json.loads(response.body)
+                else:
+                    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown message type: {message_type}")
+            except HTTPException as e:
+                await send({"type": "error", "status_code": e.status_code, "detail": e.detail})
+                continue
+            except ValidationError as e:
+                detail = "; ".join(f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors())
+                await send({"type": "error", "status_code": status.HTTP_400_BAD_REQUEST, "detail": detail})
+                continue
+            await send_question(content)
+            if content.get("status") == "complete":
+                # Let pending audio announcements finish before closing
+                if audio_tasks:
+                    await asyncio.gather(*audio_tasks, return_exceptions=True)
+                await websocket.close()
+                return
+    except WebSocketDisconnect:
+        logger.info(f"Interview socket for session {session_id} disconnected")
+    finally:
+        for task in audio_tasks:
+            task.cancel()
 
 # Add new interview endpoints
 @app.post("/api/interview/start")
-async def start_interview(request: InterviewStartRequest):
+async def start_interview(request: InterviewStartRequest, model: genai.GenerativeModel = Depends(get_interview_model)):
     """
     Start a new interview session
     """
@@ -406,16 +701,13 @@ Previous Dialogue: []
         # Create the prompt
         prompt = f"{system_prompt}\n\nGenerate the first interview question for an {request.level} {request.role}."
         
-        # Initialize the Gemini model
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        # Generate content
-        response = model.generate_content(prompt)
+        # Generate content without blocking the event loop
+        raw_response_text = await llm_executor.generate_text(model, prompt, priority=PRIORITY_INTERACTIVE)
         
         # Parse the JSON response
         try:
             # Clean the response text and parse as JSON
-            response_text = response.text.strip()
+            response_text = raw_response_text.strip()
             
             # Handle potential markdown code blocks
             if response_text.startswith("```json"):
@@ -442,24 +734,18 @@ Previous Dialogue: []
             })
             interview_sessions[session_id]['question_count'] += 1
             
-            # Generate audio file for the question
-            audio_filename = f"{question_id}.mp3"
-            audio_filepath = os.path.join(AUDIO_DIR, audio_filename)
-            tts = gTTS(parsed_response['question'], lang='en')
-            tts.save(audio_filepath)
-            
             return JSONResponse(content={
                 "status": "success",
                 "question_id": question_id,
                 "question_text": parsed_response['question'],
-                "audio_url": f"/audio/{audio_filename}"
+                **await question_audio_fields(parsed_response['question'])
             })
         except json.JSONDecodeError as je:
             logger.error(f"JSON parsing error: {str(je)}")
-            logger.error(f"Raw response: {response.text}")
+            logger.error(f"Raw response: {raw_response_text}")
             # Return a fallback response
             question_id = f"q_{len(interview_sessions[session_id]['questions_asked']) + 1}"
-            fallback_question = "Can you tell me about your experience in HR and what interests you most about this field?"
+            fallback_question = human_interview_questions.AI_INTERVIEW_START_FALLBACK
             interview_sessions[session_id]['questions_asked'].append({
                 "id": question_id,
                 "text": fallback_question,
@@ -467,17 +753,11 @@ Previous Dialogue: []
             })
             interview_sessions[session_id]['question_count'] += 1
             
-            # Generate audio file for the fallback question
-            audio_filename = f"{question_id}.mp3"
-            audio_filepath = os.path.join(AUDIO_DIR, audio_filename)
-            tts = gTTS(fallback_question, lang='en')
-            tts.save(audio_filepath)
-            
             return JSONResponse(content={
                 "status": "success",
                 "question_id": question_id,
                 "question_text": fallback_question,
-                "audio_url": f"/audio/{audio_filename}"
+                "audio_url": await question_audio_url(fallback_question)
             })
     except Exception as e:
         logger.error(f"Error starting interview: {str(e)}")
@@ -487,7 +767,7 @@ Previous Dialogue: []
         )
 
 @app.post("/api/interview/answer")
-async def submit_interview_answer(request: InterviewAnswerRequest):
+async def submit_interview_answer(request: InterviewAnswerRequest, model: genai.GenerativeModel = Depends(get_interview_model)):
     """
     Submit an interview answer and get the next question
     """
@@ -581,16 +861,13 @@ Previous Dialogue: {session['questions_asked'][-1]['text']} - {request.user_answ
         
         prompt = f"{system_prompt}\n\n{previous_dialogue}\n\nGenerate the next interview question."
         
-        # Initialize the Gemini model
-        model = genai.GenerativeModel('gemini-2.5-flash')
-        
-        # Generate content
-        response = model.generate_content(prompt)
+        # Generate content without blocking the event loop
+        raw_response_text = await llm_executor.generate_text(model, prompt, priority=PRIORITY_INTERACTIVE)
         
         # Parse the JSON response
         try:
             # Clean the response text and parse as JSON
-            response_text = response.text.strip()
+            response_text = raw_response_text.strip()
             
             # Handle potential markdown code blocks
             if response_text.startswith("```json"):
@@ -617,24 +894,18 @@ Previous Dialogue: {session['questions_asked'][-1]['text']} - {request.user_answ
             })
             interview_sessions[session_id]['question_count'] += 1
             
-            # Generate audio file for the question
-            audio_filename = f"{question_id}.mp3"
-            audio_filepath = os.path.join(AUDIO_DIR, audio_filename)
-            tts = gTTS(parsed_response['question'], lang='en')
-            tts.save(audio_filepath)
-            
             return JSONResponse(content={
                 "status": "success",
                 "question_id": question_id,
                 "question_text": parsed_response['question'],
-                "audio_url": f"/audio/{audio_filename}"
+                **await question_audio_fields(parsed_response['question'])
             })
         except json.JSONDecodeError as je:
             logger.error(f"JSON parsing error: {str(je)}")
-            logger.error(f"Raw response: {response.text}")
+            logger.error(f"Raw response: {raw_response_text}")
             # Return a fallback response
             question_id = f"q_{len(interview_sessions[session_id]['questions_asked']) + 1}"
-            fallback_question = "Can you elaborate more on that point?"
+            fallback_question = human_interview_questions.AI_INTERVIEW_ANSWER_FALLBACK
             interview_sessions[session_id]['questions_asked'].append({
                 "id": question_id,
                 "text": fallback_question,
@@ -642,17 +913,11 @@ Previous Dialogue: {session['questions_asked'][-1]['text']} - {request.user_answ
             })
             interview_sessions[session_id]['question_count'] += 1
             
-            # Generate audio file for the fallback question
-            audio_filename = f"{question_id}.mp3"
-            audio_filepath = os.path.join(AUDIO_DIR, audio_filename)
-            tts = gTTS(fallback_question, lang='en')
-            tts.save(audio_filepath)
-            
             return JSONResponse(content={
                 "status": "success",
                 "question_id": question_id,
                 "question_text": fallback_question,
-                "audio_url": f"/audio/{audio_filename}"
+                "audio_url": await question_audio_url(fallback_question)
             })
     except Exception as e:
         logger.error(f"Error submitting interview answer: {str(e)}")
@@ -661,9 +926,116 @@ Previous Dialogue: {session['questions_asked'][-1]['text']} - {request.user_answ
             detail=f"Error submitting interview answer: {str(e)}"
         )
 
+# Define the system prompt for the Auto-Docs Agent
+AUTO_DOCS_SYSTEM_PROMPT = """
+You are the Auto-Docs Agent. Your task is to generate a comprehensive and professional README.md file based on the provided codebase structure and content.
+
+--- CONTEXT ---
+Project Title Override: {project_title_or_repo_name}
+All File Contents:
+{concatenated_file_contents_from_cloned_repo}
+---
+
+--- INSTRUCTIONS ---
+1.  **Format:** Your entire response MUST be clean, valid Markdown suitable for a GitHub README.md file. Do not include any text outside the Markdown content (e.g., no conversational greetings or explanations).
+2.  **Sections:** Include the following standard sections, inferring content from the code provided:
+    * # Project Title (Use the Override or infer from code)
+    * ## Description (What does the project do?)
+    * ## Features (List key functionalities, e.g., API endpoints, core calculations)
+    * ## Installation (Provide clear steps, referencing requirements.txt or package.json)
+    * ## Usage (Provide a code snippet or simple steps to run the main functionality)
+    * ## Technologies Used (List inferred languages/frameworks)
+3.  **Tone:** Professional, informative, and concise.
+"""
+
+def collect_repository_contents(repo_dir: str):
+    """
+    Walk a cloned repository and concatenate its readable source files
+    
+    Returns:
+        Tuple of (concatenated_contents, files_scanned)
+    """
+    contents = []
+    files_scanned = 0
+    ignored_dirs = {'.git', 'node_modules', 'venv', '__pycache__', '.vscode', '.idea'}
+    ignored_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.ico', '.zip', '.tar', '.gz', '.exe', '.dll', '.so'}
+    
+    for root, dirs, files in os.walk(repo_dir):
+        # Skip ignored directories
+        dirs[:] = [d for d in dirs if d not in ignored_dirs]
+        
+        for file in files:
+            # Skip ignored file extensions
+            if any(file.endswith(ext) for ext in ignored_extensions):
+                continue
+            
+            file_path = os.path.join(root, file)
+            relative_path = os.path.relpath(file_path, repo_dir)
+            
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    contents.append(f"---FILE: {relative_path}---\n{f.read()}\n\n")
+                    files_scanned += 1
+            except (UnicodeDecodeError, PermissionError):
+                # Skip binary or unreadable files
+                continue
+    
+    # If no content was extracted, provide a fallback
+    if not contents:
+        return "No readable source files found in the repository.", 0
+    return "".join(contents), files_scanned
+
+def build_readme_prompt(github_url: str, project_title: str, concatenated_contents: str) -> str:
+    """
+    Render the Auto-Docs prompt for a repository
+    """
+    # Determine project title
+    repo_name = github_url.rstrip('/').split('/')[-1].replace('.git', '')
+    final_project_title = project_title if project_title else repo_name
+    
+    return AUTO_DOCS_SYSTEM_PROMPT.format(
+        project_title_or_repo_name=final_project_title,
+        concatenated_file_contents_from_cloned_repo=concatenated_contents[:10000]  # Limit content size
+    )
+
+def clean_readme_content(response_text: str) -> str:
+    """
+    Strip surrounding whitespace and markdown code fences from a generated README
+    """
+    readme_content = response_text.strip()
+    
+    # Handle potential markdown code blocks
+    if readme_content.startswith("```"):
+        readme_content = readme_content[3:]  # Remove ```
+    if readme_content.endswith("```"):
+        readme_content = readme_content[:-3]  # Remove ```
+    return readme_content
+
+def save_readme_history(readme_content: str, github_url: str):
+    """
+    Record a generated README in the user's history
+    
+    Returns:
+        History record ID if successful, None otherwise
+    """
+    try:
+        return history_manager.save_history(
+            user_id=1,  # Dummy user ID
+            agent_name="Auto-Docs Generator",
+            summary_text="Generated Successfully",
+            full_output={
+                "readme_content": readme_content,
+                "filename": "README.md",
+                "github_url": github_url
+            }
+        )
+    except Exception as e:
+        logger.error(f"Failed to save history record: {e}")
+        return None
+
 # Auto-Docs endpoint for README generation
 @app.post("/api/autodocs/generate")
-async def generate_readme(request: dict):
+async def generate_readme(request: dict, model: genai.GenerativeModel = Depends(get_docs_model)):
     """
     Generate README.md for a GitHub repository using the Auto-Docs Agent
     """
@@ -679,104 +1051,25 @@ async def generate_readme(request: dict):
         
         # Import git here to avoid issues if not installed
         import git
-        import shutil
         
         # Create a temporary directory for cloning
         with tempfile.TemporaryDirectory() as temp_dir:
             try:
-                # Clone the repository
-                repo = git.Repo.clone_from(github_url, temp_dir)
-                
-                # Extract file contents
-                concatenated_contents = ""
-                ignored_dirs = {'.git', 'node_modules', 'venv', '__pycache__', '.vscode', '.idea'}
-                ignored_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.ico', '.zip', '.tar', '.gz', '.exe', '.dll', '.so'}
-                
-                for root, dirs, files in os.walk(temp_dir):
-                    # Skip ignored directories
-                    dirs[:] = [d for d in dirs if d not in ignored_dirs]
-                    
-                    for file in files:
-                        # Skip ignored file extensions
-                        if any(file.endswith(ext) for ext in ignored_extensions):
-                            continue
-                        
-                        file_path = os.path.join(root, file)
-                        relative_path = os.path.relpath(file_path, temp_dir)
-                        
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                concatenated_contents += f"---FILE: {relative_path}---\n{content}\n\n"
-                        except (UnicodeDecodeError, PermissionError):
-                            # Skip binary or unreadable files
-                            continue
-                
-                # If no content was extracted, provide a fallback
-                if not concatenated_contents:
-                    concatenated_contents = "No readable source files found in the repository."
-                
-                # Determine project title
-                repo_name = github_url.rstrip('/').split('/')[-1].replace('.git', '')
-                final_project_title = project_title if project_title else repo_name
-                
-                # Define the system prompt for the Auto-Docs Agent
-                AUTO_DOCS_SYSTEM_PROMPT = """
-You are the Auto-Docs Agent. Your task is to generate a comprehensive and professional README.md file based on the provided codebase structure and content.
-
---- CONTEXT ---
-Project Title Override: {project_title_or_repo_name}
-All File Contents:
-{concatenated_file_contents_from_cloned_repo}
----
-
---- INSTRUCTIONS ---
-1.  **Format:** Your entire response MUST be clean, valid Markdown suitable for a GitHub README.md file. Do not include any text outside the Markdown content (e.g., no conversational greetings or explanations).
-2.  **Sections:** Include the following standard sections, inferring content from the code provided:
-    * # Project Title (Use the Override or infer from code)
-    * ## Description (What does the project do?)
-    * ## Features (List key functionalities, e.g., API endpoints, core calculations)
-    * ## Installation (Provide clear steps, referencing requirements.txt or package.json)
-    * ## Usage (Provide a code snippet or simple steps to run the main functionality)
-    * ## Technologies Used (List inferred languages/frameworks)
-3.  **Tone:** Professional, informative, and concise.
-"""
+                # Clone the repository and extract file contents off the event loop
+                await run_in_threadpool(git.Repo.clone_from, github_url, temp_dir)
+                concatenated_contents, _ = await run_in_threadpool(collect_repository_contents, temp_dir)
                 
                 # Create the prompt
-                prompt = AUTO_DOCS_SYSTEM_PROMPT.format(
-                    project_title_or_repo_name=final_project_title,
-                    concatenated_file_contents_from_cloned_repo=concatenated_contents[:10000]  # Limit content size
-                )
-                
-                # Initialize the Gemini model
-                model = genai.GenerativeModel('gemini-2.5-flash')
+                prompt = build_readme_prompt(github_url, project_title, concatenated_contents)
                 
-                # Generate content
-                response = model.generate_content(prompt)
+                # Generate content without blocking the event loop
+                response_text = await llm_executor.generate_text(model, prompt, priority=PRIORITY_BATCH)
                 
                 # Get the raw Markdown response
-                readme_content = response.text.strip()
-                
-                # Handle potential markdown code blocks
-                if readme_content.startswith("```"):
-                    readme_content = readme_content[3:]  # Remove ```
-                if readme_content.endswith("```"):
-                    readme_content = readme_content[:-3]  # Remove ```
+                readme_content = clean_readme_content(response_text)
                 
                 # Save to history
-                try:
-                    history_manager.save_history(
-                        user_id=1,  # Dummy user ID
-                        agent_name="Auto-Docs Generator",
-                        summary_text="Generated Successfully",
-                        full_output={
-                            "readme_content": readme_content,
-                            "filename": "README.md",
-                            "github_url": github_url
-                        }
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to save history record: {e}")
+                save_readme_history(readme_content, github_url)
                 
                 return JSONResponse(content={
                     "status": "success",
@@ -806,13 +1099,121 @@ All File Contents:
             detail=f"Error generating README: {str(e)}"
         )
 
+# Streaming Auto-Docs endpoint (Server-Sent Events)
+@app.post("/api/autodocs/generate/stream")
+async def generate_readme_stream(request: dict, model: genai.GenerativeModel = Depends(get_docs_model)):
+    """
+    Generate README.md as a Server-Sent Events stream
+    
+    Emits "progress" events (cloning, cloned, files_scanned, prompt_ready), then "chunk"
+    events carrying README markdown as Gemini produces it, and finally a "done" event with
+    the cleaned README (or an "error" event).
+    """
+    github_url = request.get('github_url')
+    project_title = request.get('project_title')
+    
+    if not github_url:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="GitHub URL is required"
+        )
+    
+    # Import git here to avoid issues if not installed
+    import git
+    
+    async def event_stream():
+        try:
+            yield format_sse("progress", {"stage": "cloning", "github_url": github_url})
+            
+            with tempfile.TemporaryDirectory() as temp_dir:
+                try:
+                    await run_in_threadpool(git.Repo.clone_from, github_url, temp_dir)
+                except git.exc.GitCommandError as e:
+                    yield format_sse("error", {"detail": f"Failed to clone repository: {str(e)}"})
+                    return
+                yield format_sse("progress", {"stage": "cloned"})
+                
+                concatenated_contents, files_scanned = await run_in_threadpool(collect_repository_contents, temp_dir)
+                yield format_sse("progress", {"stage": "files_scanned", "files": files_scanned})
+            
+            prompt = build_readme_prompt(github_url, project_title, concatenated_contents)
+            yield format_sse("progress", {"stage": "prompt_ready", "prompt_chars": len(prompt)})
+            
+            chunks = []
+            async for chunk in llm_executor.stream_text(model, prompt, priority=PRIORITY_BATCH):
+                chunks.append(chunk)
+                yield format_sse("chunk", {"text": chunk})
+            
+            readme_content = clean_readme_content("".join(chunks))
+            history_id = save_readme_history(readme_content, github_url)
+            
+            yield format_sse("done", {
+                "status": "success",
+                "readme_content": readme_content,
+                "filename": "README.md",
+                "history_id": history_id
+            })
+        except Exception as e:
+            logger.error(f"Error streaming README generation: {str(e)}")
+            yield format_sse("error", {"detail": f"Error generating README: {str(e)}"})
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+def log_extraction_report(filename: str, report: dict, max_chars: int):
+    """
+    Log the prompt savings from normalization and any pages skipped by the budget
+    """
+    normalization = report.get("normalization")
+    if normalization:
+        logger.info(
+            f"Normalized {filename}: {normalization['chars_before']} -> {normalization['chars_after']} "
+            f"characters, ~{normalization['tokens_saved']} tokens saved ({normalization['saved_percent']}%)"
+        )
+    if report["pages_skipped"]:
+        logger.warning(
+            f"Extraction budget of {max_chars} characters met after {report['pages_processed']} of "
+            f"{report['pages_total']} pages; skipped {report['pages_skipped']} pages of {filename}"
+        )
+
+async def extract_upload_text(file: UploadFile, max_chars: int = 0) -> Tuple[str, dict]:
+    """
+    Extract text from an uploaded PDF straight from the upload buffer
+    
+    Pages are loaded only until max_chars characters are collected (0 for no limit).
+    Raises 413 for uploads over UPLOAD_MAX_BYTES and 400 if the PDF cannot be read.
+    
+    Returns:
+        (text, report with pages_total, pages_processed, pages_skipped and truncated)
+    """
+    try:
+        upload = await receive_pdf_upload(file)
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
+    try:
+        with upload:
+            text, report = await run_in_threadpool(upload.extract, max_chars)
+    except Exception as e:
+        logger.error(f"Failed to extract text from PDF: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Failed to extract text from PDF: {str(e)}"
+        )
+    log_extraction_report(file.filename, report, max_chars)
+    return text, report
+
 # Add ContractReviewRequest model
 class ContractReviewRequest(BaseModel):
     file: UploadFile
 
 # Contract Guardian endpoint for PDF analysis
 @app.post("/api/analyze/contract")
-async def analyze_contract(file: UploadFile = File(...)):
+async def analyze_contract(
+    file: UploadFile = File(...),
+    orchestrator: MasterOrchestratorAgent = Depends(get_orchestrator)
+):
     """
     Analyze contract PDF and extract key terms and risk clauses
     """
@@ -824,33 +1225,8 @@ async def analyze_contract(file: UploadFile = File(...)):
         )
     
     try:
-        # Create a temporary file to save the uploaded PDF
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            # Write the uploaded file content to the temporary file
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-        
-        # Extract text from the PDF using PyMuPDF
-        try:
-            doc = fitz.open(temp_file_path)
-            contract_text = ""
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                contract_text += page.get_text()
-            doc.close()
-        except Exception as e:
-            logger.error(f"Failed to extract text from PDF: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Failed to extract text from PDF: {str(e)}"
-            )
-        finally:
-            # Delete the temporary file
-            try:
-                os.unlink(temp_file_path)
-            except Exception as e:
-                logger.warning(f"Failed to delete temporary file: {str(e)}")
+        # Extract text from the PDF using PyMuPDF, reading the upload in place
+        contract_text, extraction = await extract_upload_text(file, settings.PDF_CONTRACT_MAX_CHARS)
         
         # Check if text was extracted
         if not contract_text or len(contract_text.strip()) == 0:
@@ -862,16 +1238,11 @@ async def analyze_contract(file: UploadFile = File(...)):
         
         logger.info(f"Successfully extracted {len(contract_text)} characters from PDF")
         
-        # Limit contract text length to prevent API timeouts
-        max_length = 50000  # About 10-15 pages of text
-        if len(contract_text) > max_length:
-            contract_text = contract_text[:max_length]
-            logger.info(f"Truncated contract text to {len(contract_text)} characters")
-        
-        # Use the orchestrator to analyze the contract
+        # Use the orchestrator to analyze the contract; long contracts are split at
+        # clause boundaries and reviewed chunk by chunk instead of being truncated
         try:
             logger.info("Sending contract text to orchestrator for analysis")
-            result = orchestrator.route_request("contract", {"contract_text": contract_text})
+            result = await orchestrator.route_request_async("contract", {"contract_text": contract_text})
             logger.info(f"Received response from orchestrator: success={result.get('success')}")
             
             if result.get("success", False):
@@ -879,6 +1250,9 @@ async def analyze_contract(file: UploadFile = File(...)):
                 # If it's wrapped in a data field, extract it; otherwise use the result as-is
                 data = result.get("data", result)
                 logger.info("Contract analysis completed successfully")
+                if extraction["pages_skipped"]:
+                    # Tell the caller the review stopped short of the end of the document
+                    data = {**data, "extraction": extraction}
                 
                 # Save to history
                 try:
@@ -927,7 +1301,8 @@ class ResumeFileAnalysisRequest(BaseModel):
 async def analyze_resume_file(
     file: UploadFile = File(...),
     target_vibe: str = Form(...),
-    job_description: str = Form("")
+    job_description: str = Form(""),
+    agent: ResumeIntelligenceAgent = Depends(get_resume_agent)
 ):
     """
     Analyze resume file and provide feedback based on job description and target vibe
@@ -940,33 +1315,8 @@ async def analyze_resume_file(
         )
     
     try:
-        # Extract text from the PDF file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-            # Write the uploaded file content to the temporary file
-            content = await file.read()
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-        
-        # Extract text from the PDF using PyMuPDF
-        try:
-            doc = fitz.open(temp_file_path)
-            resume_text = ""
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                resume_text += page.get_text()
-            doc.close()
-        except Exception as e:
-            logger.error(f"Failed to extract text from PDF: {str(e)}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Failed to extract text from PDF: {str(e)}"
-            )
-        finally:
-            # Delete the temporary file
-            try:
-                os.unlink(temp_file_path)
-            except Exception as e:
-                logger.warning(f"Failed to delete temporary file: {str(e)}")
+        # Extract text from the PDF using PyMuPDF, reading the upload in place
+        resume_text, _ = await extract_upload_text(file, settings.PDF_RESUME_MAX_CHARS)
         
         # Check if text was extracted
         if not resume_text or len(resume_text.strip()) == 0:
@@ -978,14 +1328,14 @@ async def analyze_resume_file(
         
         logger.info(f"Successfully extracted {len(resume_text)} characters from PDF")
         
-        # Initialize the ResumeIntelligenceAgent
-        agent = ResumeIntelligenceAgent()
-        
-        # Generate the analysis result
-        analysis_result = agent.analyze_resume(
-            resume_content=resume_text,
-            job_description=job_description,
-            target_vibe=target_vibe
+        # Generate the analysis result (identical concurrent uploads share one call)
+        analysis_result = await agent_request_flight.do(
+            canonical_key("resume", resume_text, job_description, target_vibe),
+            lambda: agent.analyze_resume_async(
+                resume_content=resume_text,
+                job_description=job_description,
+                target_vibe=target_vibe
+            )
         )
         
         # Save to history
@@ -1013,23 +1363,23 @@ async def analyze_resume_file(
 
 # Resume Guardian endpoint for resume analysis (existing endpoint)
 @app.post("/api/analyze/resume")
-async def analyze_resume(request: ResumeAnalysisRequest):
+async def analyze_resume(request: ResumeAnalysisRequest, agent: ResumeIntelligenceAgent = Depends(get_resume_agent)):
     """
     Analyze resume and provide feedback based on job description and target vibe
     """
     try:
-        # Initialize the ResumeIntelligenceAgent
-        agent = ResumeIntelligenceAgent()
-        
         # For now, we'll use a dummy resume content since we're not uploading a file
         # In a full implementation, you would extract text from an uploaded PDF
         dummy_resume_content = "John Doe\nSoftware Engineer\nExperience: 5 years in Python and JavaScript\nEducation: BS in Computer Science"
         
-        # Generate the analysis result
-        analysis_result = agent.analyze_resume(
-            resume_content=dummy_resume_content,
-            job_description=request.job_description,
-            target_vibe=request.target_vibe
+        # Generate the analysis result (identical concurrent requests share one call)
+        analysis_result = await agent_request_flight.do(
+            canonical_key("resume", dummy_resume_content, request.job_description, request.target_vibe),
+            lambda: agent.analyze_resume_async(
+                resume_content=dummy_resume_content,
+                job_description=request.job_description,
+                target_vibe=request.target_vibe
+            )
         )
         
         # Save to history
@@ -1055,23 +1405,253 @@ async def analyze_resume(request: ResumeAnalysisRequest):
             detail=f"Error analyzing resume: {str(e)}"
         )
 
+# Batch resume screening endpoint: many resumes against one job description
+@app.post("/api/analyze/resume/batch")
+async def analyze_resume_batch(
+    files: List[UploadFile] = File(...),
+    job_description: str = Form(...),
+    target_vibe: str = Form("Corporate"),
+    agent: ResumeIntelligenceAgent = Depends(get_resume_agent)
+):
+    """
+    Screen many resume PDFs against one job description
+    
+    Text is extracted from all PDFs in parallel, and each resume's analysis is queued as
+    soon as its text is ready; analyses run with bounded concurrency. The response is
+    NDJSON: one line per resume as soon as its analysis (or extraction) fails or finishes,
+    then a summary line. History records for successful analyses are saved in one bulk write.
+    """
+    if len(files) > agent_config.RESUME_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {agent_config.RESUME_BATCH_MAX_FILES} resumes can be screened per batch"
+        )
+    
+    # Take the uploads before streaming starts; the upload files are closed once the endpoint
+    # returns, but in-memory buffers and disk mappings stay readable
+    uploads = []
+    for index, file in enumerate(files):
+        try:
+            upload = await receive_pdf_upload(file)
+        except UploadTooLargeError as e:
+            upload = e
+        uploads.append((index, file.filename, file.content_type or "", upload))
+    
+    async def extract(index: int, filename: str, content_type: str, upload):
+        # (index, resume text), or (index, exception) when the file cannot be screened
+        try:
+            if isinstance(upload, Exception):
+                raise upload
+            if not content_type.startswith("application/pdf"):
+                raise ValueError("Only PDF files are allowed")
+            resume_text, report = await run_in_threadpool(upload.extract, settings.PDF_RESUME_MAX_CHARS)
+            log_extraction_report(filename, report, settings.PDF_RESUME_MAX_CHARS)
+            if not resume_text.strip():
+                raise ValueError("Could not extract text from the PDF file")
+            return index, resume_text
+        except Exception as e:
+            return index, e
+    
+    def close_uploads():
+        for _, _, _, upload in uploads:
+            if isinstance(upload, PDFUpload):
+                upload.close()
+    
+    async def result_stream():
+        filenames = {index: filename for index, filename, _, _ in uploads}
+        extractions = [
+            asyncio.ensure_future(extract(index, filename, content_type, upload))
+            for index, filename, content_type, upload in uploads
+        ]
+        # Uploads are closed once every extraction is done with them, even if the client leaves early
+        asyncio.gather(*extractions, return_exceptions=True).add_done_callback(lambda _: close_uploads())
+        
+        # NDJSON lines in the order they become ready, then None
+        lines = asyncio.Queue()
+        counts = {"succeeded": 0, "failed": 0}
+        history_records = []
+        
+        async def extracted_resumes():
+            # Hand each resume to the analysis as soon as its text is ready
+            for next_done in asyncio.as_completed(extractions):
+                index, resume_text = await next_done
+                if isinstance(resume_text, Exception):
+                    counts["failed"] += 1
+                    lines.put_nowait(json.dumps({
+                        "index": index, "filename": filenames[index], "status": "error", "error": str(resume_text)
+                    }) + "\n")
+                else:
+                    yield index, resume_text
+        
+        async def analyze():
+            batch = agent.analyze_batch(extracted_resumes(), job_description, target_vibe)
+            try:
+                async for index, analysis_result in batch:
+                    if analysis_result.get("status") == "error":
+                        counts["failed"] += 1
+                        lines.put_nowait(json.dumps({
+                            "index": index,
+                            "filename": filenames[index],
+                            "status": "error",
+                            "error": analysis_result.get("error", "Analysis failed")
+                        }) + "\n")
+                        continue
+                    
+                    counts["succeeded"] += 1
+                    history_records.append({
+                        "user_id": 1,  # Dummy user ID
+                        "agent_name": "Resume Analyzer",
+                        "summary_text": f"Score: {analysis_result.get('ats_score', 'N/A')}",
+                        "full_output": analysis_result
+                    })
+                    lines.put_nowait(json.dumps({
+                        "index": index, "filename": filenames[index], "status": "success", "result": analysis_result
+                    }) + "\n")
+            finally:
+                await batch.aclose()
+                lines.put_nowait(None)
+        
+        analysis = asyncio.ensure_future(analyze())
+        try:
+            while True:
+                line = await lines.get()
+                if line is None:
+                    break
+                yield line
+            await analysis
+        finally:
+            # Stop outstanding analyses if the client goes away early
+            analysis.cancel()
+        
+        # Save to history
+        history_ids = await run_in_threadpool(history_manager.save_history_bulk, history_records)
+        
+        yield json.dumps({
+            "status": "complete",
+            "total": len(uploads),
+            "succeeded": counts["succeeded"],
+            "failed": counts["failed"],
+            "history_saved": len(history_ids)
+        }) + "\n"
+    
+    return StreamingResponse(result_stream(), media_type="application/x-ndjson")
+
+# Streaming variants of the resume and contract analyses: fields arrive as soon as they are generated
+@app.post("/api/analyze/resume/file/stream")
+async def analyze_resume_file_stream(
+    file: UploadFile = File(...),
+    target_vibe: str = Form(...),
+    job_description: str = Form(""),
+    agent: ResumeIntelligenceAgent = Depends(get_resume_agent)
+):
+    """
+    Analyze a resume PDF as a Server-Sent Events stream
+    
+    Emits a "field" event for each top-level field as soon as the model finishes it
+    (e.g. ats_score before the longer suggestions), an "item" event for each element of a
+    list field, and finally a "done" event with the full analysis (or an "error" event).
+    """
+    if not file.content_type.startswith("application/pdf"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only PDF files are allowed"
+        )
+    
+    resume_text, _ = await extract_upload_text(file, settings.PDF_RESUME_MAX_CHARS)
+    if not resume_text.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Could not extract text from the PDF file. Please ensure it's a valid PDF with text content."
+        )
+    
+    async def event_stream():
+        async for event_name, payload in agent.analyze_resume_stream(resume_text, job_description, target_vibe):
+            if event_name != "result":
+                yield format_sse(event_name, payload)
+                continue
+            
+            if payload.get("status") == "error":
+                yield format_sse("error", {"detail": f"Error analyzing resume: {payload.get('error')}"})
+                return
+            
+            # Save to history
+            try:
+                await run_in_threadpool(
+                    history_manager.save_history,
+                    user_id=1,  # Dummy user ID
+                    agent_name="Resume Analyzer",
+                    summary_text=f"Score: {payload.get('ats_score', 'N/A')}",
+                    full_output=payload
+                )
+            except Exception as e:
+                logger.error(f"Failed to save history record: {e}")
+            yield format_sse("done", payload)
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+@app.post("/api/analyze/contract/stream")
+async def analyze_contract_stream(
+    file: UploadFile = File(...),
+    agent: ContractGuardianAgent = Depends(get_contract_agent)
+):
+    """
+    Analyze a contract PDF as a Server-Sent Events stream
+    
+    Emits "field" events for top-level fields (overall_score, summary, key_terms) and an
+    "item" event for each risk_clauses entry as soon as it is generated. Long contracts are
+    reviewed in chunks and also emit "progress" events. A final "done" event carries the
+    full analysis (or an "error" event).
+    """
+    if not file.content_type.startswith("application/pdf"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only PDF files are allowed"
+        )
+    
+    contract_text, _ = await extract_upload_text(file, settings.PDF_CONTRACT_MAX_CHARS)
+    if not contract_text.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Could not extract text from the PDF file. Please ensure it's a valid PDF with text content."
+        )
+    
+    async def event_stream():
+        async for event_name, payload in agent.review_contract_stream(contract_text):
+            if event_name != "result":
+                yield format_sse(event_name, payload)
+                continue
+            
+            if not payload.get("success"):
+                yield format_sse("error", {"detail": f"Error analyzing contract: {payload.get('error', 'Unknown error')}"})
+                return
+            
+            data = payload["data"]
+            # Save to history
+            try:
+                await run_in_threadpool(
+                    history_manager.save_history,
+                    user_id=1,  # Dummy user ID
+                    agent_name="Contract Guardian",
+                    summary_text=f"Score: {data.get('overall_score', 'N/A')}",
+                    full_output=data
+                )
+            except Exception as e:
+                logger.error(f"Failed to save history record: {e}")
+            yield format_sse("done", data)
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=SSE_HEADERS)
+
 # Add helper function for audio processing
 def preprocess_audio_for_speech_recognition(audio_data):
     """
     Preprocess audio data to improve speech recognition accuracy
+    
+    Resamples to a fixed rate, normalizes loudness, gates background noise and trims
+    silence (see utils.audio_preprocessing). The original audio is returned if it
+    cannot be decoded.
     """
     try:
-        # This is a placeholder for actual audio preprocessing
-        # In a real implementation, you would:
-        # 1. Apply noise reduction filters
-        # 2. Normalize audio levels
-        # 3. Enhance speech frequencies
-        # 4. Remove background noise
-        
-        # For now, we'll just return the audio data as-is
-        # but in a production environment, you would integrate
-        # with libraries like scipy, librosa, or pydub for processing
-        return audio_data
+        return preprocess_audio(audio_data)
     except Exception as e:
         logger.error(f"Error preprocessing audio: {str(e)}")
         return audio_data
@@ -1198,6 +1778,86 @@ async def get_user_history(page: int = 1, limit: int = 10, db: Session = Depends
             detail=f"Error retrieving history: {str(e)}"
         )
 
+@app.get("/api/llm/scheduler/stats")
+async def get_llm_scheduler_stats():
+    """
+    Report LLM scheduler queue depth, in-flight calls and wait-time statistics
+    """
+    return {
+        "status": "success",
+        "data": llm_scheduler.stats()
+    }
+
+@app.get("/api/agents/coalescing/stats")
+async def get_agent_coalescing_stats():
+    """
+    Report how many identical in-flight agent requests were collapsed into one call
+    """
+    return {
+        "status": "success",
+        "data": agent_request_flight.stats()
+    }
+
+@app.get("/api/human_interview/idempotency/stats")
+async def get_idempotency_stats():
+    """
+    Report how many answer retries were replayed from the Idempotency-Key cache
+    """
+    return {
+        "status": "success",
+        "data": interview_answer_replays.stats()
+    }
+
+@app.get("/api/pdf/extraction/stats")
+async def get_pdf_extraction_stats():
+    """
+    Report how many documents were extracted on the process pool
+    """
+    return {
+        "status": "success",
+        "data": pdf_extractor.stats()
+    }
+
+@app.get("/api/pdf/cache/stats")
+async def get_pdf_text_cache_stats():
+    """
+    Report how often uploads were served from the extracted-text cache
+    """
+    return {
+        "status": "success",
+        "data": pdf_text_cache.stats()
+    }
+
+@app.get("/api/tts/cache/stats")
+async def get_tts_cache_stats():
+    """
+    Report TTS cache hit rates and how many synthesis calls were avoided
+    """
+    return {
+        "status": "success",
+        "data": tts_cache.stats()
+    }
+
+@app.get("/api/audio/store/stats")
+async def get_audio_store_stats():
+    """
+    Report audio storage usage against its byte and file-count budget
+    """
+    return {
+        "status": "success",
+        "data": audio_store.stats()
+    }
+
+@app.get("/api/llm/cache/stats")
+async def get_llm_cache_stats():
+    """
+    Report hit/miss counters and tier sizes for the LLM response cache
+    """
+    return {
+        "status": "success",
+        "data": llm_cache.stats()
+    }
+
 
 if __name__ == "__main__":
     import uvicorn
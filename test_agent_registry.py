@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that the agent registry builds each agent and client once
+and that the FastAPI dependencies hand out the shared instances. No LLM calls are made.
+"""
+
+import sys
+import os
+import threading
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import agents.registry as registry_module
+from agents.config import agent_config
+from agents.registry import AgentRegistry
+
+def test_same_settings_share_client():
+    """Test that agents with the same (model, temperature) share one chat client"""
+    registry = AgentRegistry()
+    resume_agent = registry.resume_agent()
+    docs_agent = registry.docs_agent()
+    interview_agent = registry.interview_agent()
+
+    assert (agent_config.RESUME_AGENT_MODEL, agent_config.RESUME_AGENT_TEMPERATURE) == \
+        (agent_config.DOCS_AGENT_MODEL, agent_config.DOCS_AGENT_TEMPERATURE)
+    assert resume_agent.llm is docs_agent.llm
+    assert resume_agent.llm is registry.chat_model(agent_config.RESUME_AGENT_MODEL, agent_config.RESUME_AGENT_TEMPERATURE)
+    # A different temperature gets its own client
+    assert interview_agent.llm is not resume_agent.llm
+    assert registry.gemini_model(agent_config.INTERVIEW_AGENT_MODEL) is registry.gemini_model(agent_config.DOCS_AGENT_MODEL)
+    print("✅ Agents with the same settings share a client")
+
+def test_orchestrator_reuses_registry_agents():
+    """Test that the orchestrator is built from the registry's own agents"""
+    registry = AgentRegistry()
+    orchestrator = registry.orchestrator()
+    assert orchestrator is registry.orchestrator()
+    assert orchestrator.resume_agent is registry.resume_agent()
+    assert orchestrator.interview_agent is registry.interview_agent()
+    assert orchestrator.contract_agent is registry.contract_agent()
+    assert orchestrator.docs_agent is registry.docs_agent()
+    print("✅ Orchestrator reuses the registry's agents")
+
+def test_dependencies_return_shared_instances():
+    """Test that every Depends() getter returns the same registry-owned instance on each call"""
+    getters = {
+        registry_module.get_resume_agent: registry_module.agent_registry.resume_agent,
+        registry_module.get_contract_agent: registry_module.agent_registry.contract_agent,
+        registry_module.get_orchestrator: registry_module.agent_registry.orchestrator,
+        registry_module.get_interview_model:
+            lambda: registry_module.agent_registry.gemini_model(agent_config.INTERVIEW_AGENT_MODEL),
+        registry_module.get_docs_model:
+            lambda: registry_module.agent_registry.gemini_model(agent_config.DOCS_AGENT_MODEL),
+    }
+    for getter, owned in getters.items():
+        first = getter()
+        assert first is getter() is owned(), f"{getter.__name__} built a new instance"
+    print("✅ Dependencies return the shared instances")
+
+def test_concurrent_first_use_builds_once():
+    """Test that threads racing on first use all get the same agent"""
+    registry = AgentRegistry()
+    results = []
+    barrier = threading.Barrier(8)
+
+    def build():
+        barrier.wait()
+        results.append(registry.resume_agent())
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 8 and all(agent is results[0] for agent in results)
+    print("✅ Concurrent first use built one agent")
+
+if __name__ == "__main__":
+    test_same_settings_share_client()
+    test_orchestrator_reuses_registry_agents()
+    test_dependencies_return_shared_instances()
+    test_concurrent_first_use_builds_once()
+    print("\n🎉 All agent registry tests passed!")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script to verify HTTP caching and byte-range support on /audio.
+A fixed-clip TTS backend is used, so no network calls are made.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import main
+from fastapi.testclient import TestClient
+from utils.audio_store import AudioStore
+from utils.tts_cache import TTSCache
+from utils.tts_backends import TTSBackend
+from utils.http_media import parse_range
+
+CLIP = bytes(range(256)) * 4
+
+class FixedClipBackend(TTSBackend):
+    name = "fixed"
+
+    def synthesize(self, text, lang, voice):
+        return CLIP
+
+# Serve clips from a throwaway store with synthesis replaced by fixed bytes
+tts_cache = TTSCache(
+    AudioStore(tempfile.mkdtemp(prefix="audio_delivery_"), max_bytes=10 ** 6, max_files=100),
+    backend=FixedClipBackend()
+)
+client = TestClient(main.app)
+
+def clip_url():
+    main.tts_cache = tts_cache
+    return "/audio/" + tts_cache.get_or_render("Tell me about yourself.")
+
+def test_immutable_clip_with_etag():
+    """Test that content-addressed clips carry a strong ETag and immutable caching"""
+    response = client.get(clip_url())
+    print(f"📋 Headers: ETag={response.headers['etag']} Cache-Control={response.headers['cache-control']}")
+    assert response.status_code == 200 and len(response.content) == 1024
+    assert "immutable" in response.headers["cache-control"]
+    assert response.headers["accept-ranges"] == "bytes"
+
+    revalidated = client.get(clip_url(), headers={"If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304 and revalidated.content == b""
+    print("✅ ETag revalidation returns 304")
+
+def test_byte_ranges():
+    """Test partial content for seeking"""
+    response = client.get(clip_url(), headers={"Range": "bytes=100-199"})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 100-199/1024"
+    assert response.content == CLIP[100:200]
+
+    suffix = client.get(clip_url(), headers={"Range": "bytes=-24"})
+    assert suffix.status_code == 206 and len(suffix.content) == 24
+
+    unsatisfiable = client.get(clip_url(), headers={"Range": "bytes=5000-"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == "bytes */1024"
+
+    # A stale If-Range sends the whole clip
+    stale = client.get(clip_url(), headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert stale.status_code == 200 and len(stale.content) == 1024
+    print("✅ Byte ranges served")
+
+def test_parse_range():
+    """Test Range header parsing edge cases"""
+    assert parse_range(None, 10) is None
+    assert parse_range("bytes=0-", 10) == (0, 9)
+    assert parse_range("bytes=5-100", 10) == (5, 9)
+    assert parse_range("bytes=-100", 10) == (0, 9)
+    assert parse_range("bytes=0-1,3-4", 10) is None
+    assert parse_range("bytes=abc", 10) is None
+    print("✅ Range headers parsed")
+
+if __name__ == "__main__":
+    test_immutable_clip_with_etag()
+    test_byte_ranges()
+    test_parse_range()
+    print("\n🎉 All audio delivery tests passed!")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the spoken-answer preprocessing pipeline on synthetic recordings.
+"""
+
+import sys
+import os
+import io
+import wave
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import numpy as np
+from utils.audio_preprocessing import SpeechPreprocessor, StreamingResampler, read_wav_blocks, preprocess_stream
+
+def synthetic_answer(rate=44100, channels=2):
+    """Quiet room noise around two 2-second 'utterances' separated by a 3-second pause"""
+    rng = np.random.default_rng(0)
+
+    def speech(seconds):
+        t = np.arange(int(rate * seconds)) / rate
+        return 0.05 * np.sin(2 * np.pi * 220 * t) * (0.6 + 0.4 * np.sin(2 * np.pi * 4 * t))
+
+    def silence(seconds):
+        return np.zeros(int(rate * seconds))
+
+    signal = np.concatenate([silence(1), speech(2), silence(3), speech(2), silence(1)])
+    signal += 0.001 * rng.standard_normal(len(signal))
+    pcm = (np.repeat(signal[:, None], channels, axis=1) * 32767).astype("<i2")
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as writer:
+        writer.setnchannels(channels)
+        writer.setsampwidth(2)
+        writer.setframerate(rate)
+        writer.writeframes(pcm.tobytes())
+    return buffer.getvalue()
+
+def decode(wav_bytes):
+    with wave.open(io.BytesIO(wav_bytes)) as reader:
+        rate = reader.getframerate()
+        samples = np.frombuffer(reader.readframes(reader.getnframes()), dtype="<i2") / 32768.0
+    return rate, samples
+
+def test_pipeline_trims_and_normalizes():
+    """Test resampling, silence trimming, pause shortening and loudness normalization"""
+    output = io.BytesIO()
+    stats = preprocess_stream(io.BytesIO(synthetic_answer()), output, SpeechPreprocessor(max_pause_ms=400))
+    rate, samples = decode(output.getvalue())
+    print(f"📊 Stats: {stats}")
+    assert rate == 16000
+    assert abs(stats["input_seconds"] - 9.0) < 0.05
+    # Two utterances plus word-end hangover and one shortened pause
+    assert 4.2 <= stats["output_seconds"] <= 5.0
+    assert abs(len(samples) / rate - stats["output_seconds"]) < 0.001
+
+    rms_dbfs = 10 * np.log10(np.mean(samples[rate:2 * rate] ** 2))
+    print(f"🔊 Speech level after normalization: {rms_dbfs:.1f} dBFS")
+    assert abs(rms_dbfs - (-20.0)) < 3.0
+    print("✅ Silence trimmed and loudness normalized")
+
+def test_block_size_does_not_change_output():
+    """Test that streaming in small blocks gives the same result as large blocks"""
+    data = synthetic_answer(rate=48000, channels=1)
+    results = []
+    for block_frames in (997, 65536):
+        rate, blocks = read_wav_blocks(io.BytesIO(data), block_frames)
+        results.append(np.concatenate(list(SpeechPreprocessor().process(blocks, rate))))
+    assert len(results[0]) == len(results[1])
+    assert np.allclose(results[0], results[1], atol=1e-5)
+    print("✅ Output independent of block size")
+
+def test_resampler_preserves_frequency():
+    """Test that a 1 kHz tone keeps its pitch and duration when resampled 48 kHz -> 16 kHz"""
+    t = np.arange(48000) / 48000
+    tone = np.sin(2 * np.pi * 1000 * t).astype(np.float32)
+    resampler = StreamingResampler(48000, 16000)
+    output = np.concatenate([resampler.process(block) for block in np.array_split(tone, 7)])
+    spectrum = np.abs(np.fft.rfft(output[1000:15000]))
+    peak_hz = np.argmax(spectrum) * 16000 / 14000
+    print(f"🎵 Resampled {len(tone)} -> {len(output)} samples, peak at {peak_hz:.0f} Hz")
+    assert abs(len(output) - 16000) <= 1
+    assert abs(peak_hz - 1000) < 5
+    print("✅ Resampler preserves frequency")
+
+if __name__ == "__main__":
+    test_pipeline_trims_and_normalizes()
+    test_block_size_does_not_change_output()
+    test_resampler_preserves_frequency()
+    print("\n🎉 All audio preprocessing tests passed!")
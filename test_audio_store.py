@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the sharded, size-bounded audio store.
+"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from utils.audio_store import AudioStore
+
+def test_sharded_layout():
+    """Test that files are spread over two levels of hash directories"""
+    with tempfile.TemporaryDirectory() as root:
+        store = AudioStore(root, max_bytes=10 ** 6, max_files=1000)
+        path = store.write("tts_abc.mp3", b"audio")
+        relative = os.path.relpath(path, root).split(os.sep)
+        print(f"📁 Stored at {os.path.relpath(path, root)}")
+        assert len(relative) == 3 and len(relative[0]) == 2 and len(relative[1]) == 2
+        assert store.read("tts_abc.mp3") == b"audio"
+        # A new store finds files already on disk
+        assert AudioStore(root, max_bytes=10 ** 6, max_files=1000).read("tts_abc.mp3") == b"audio"
+    print("✅ Files stored in sharded directories")
+
+def test_lru_eviction_respects_budget():
+    """Test that the sweeper evicts least recently used files until within budget"""
+    with tempfile.TemporaryDirectory() as root:
+        store = AudioStore(root, max_bytes=250, max_files=1000)
+        for i in range(4):
+            store.write(f"clip{i}.mp3", b"x" * 100)
+        # Reading clip0 makes clip1 the least recently used
+        store.read("clip0.mp3")
+        evicted = store.sweep()
+        stats = store.stats()
+
+        print(f"📊 Stats: {stats}")
+        assert evicted == 2
+        assert stats["bytes"] == 200 and stats["files"] == 2
+        assert store.exists("clip0.mp3") and store.exists("clip3.mp3")
+        assert not store.exists("clip1.mp3") and not os.path.exists(store.path_for("clip1.mp3"))
+    print("✅ LRU eviction keeps the store within budget")
+
+def test_age_based_eviction():
+    """Test that files older than max_age_seconds are evicted even under budget"""
+    with tempfile.TemporaryDirectory() as root:
+        store = AudioStore(root, max_bytes=10 ** 6, max_files=1000, max_age_seconds=1)
+        store.write("old.mp3", b"x")
+        time.sleep(1.1)
+        store.write("new.mp3", b"x")
+        assert store.sweep() == 1
+        assert store.exists("new.mp3") and not store.exists("old.mp3")
+    print("✅ Age-based eviction works")
+
+def test_files_from_other_workers_are_found():
+    """Test that files written by another process are served and counted without a restart"""
+    with tempfile.TemporaryDirectory() as root:
+        store = AudioStore(root, max_bytes=10 ** 6, max_files=1000)
+        other_worker = AudioStore(root, max_bytes=10 ** 6, max_files=1000)
+        other_worker.write("tts_shared.mp3", b"shared audio")
+        with open(os.path.join(root, "legacy.mp3"), "wb") as f:
+            f.write(b"old")
+
+        assert store.exists("tts_shared.mp3")
+        assert store.read("tts_shared.mp3") == b"shared audio"
+        assert store.read("legacy.mp3") == b"old"
+        assert not store.exists("missing.mp3")
+        stats = store.stats()
+        assert stats["files"] == 2 and stats["bytes"] == len(b"shared audio") + 3
+    print("✅ Files from other workers found on disk")
+
+def test_startup_does_not_scan():
+    """Test that existing files are indexed by the first sweep instead of at startup"""
+    with tempfile.TemporaryDirectory() as root:
+        writer = AudioStore(root, max_bytes=10 ** 6, max_files=1000)
+        for i in range(4):
+            writer.write(f"clip{i}.mp3", b"x" * 100)
+            os.utime(writer.path_for(f"clip{i}.mp3"), (1000 + i, 1000 + i))
+
+        store = AudioStore(root, max_bytes=250, max_files=1000)
+        assert store.stats()["files"] == 0 and not store.stats()["scan_complete"]
+        # Looked up before the scan, so it counts as the most recently used file
+        assert store.exists("clip0.mp3")
+        assert store.sweep() == 2
+        stats = store.stats()
+        assert stats["scan_complete"] and stats["files"] == 2 and stats["bytes"] == 200
+        assert store.exists("clip0.mp3") and store.exists("clip3.mp3")
+        assert not os.path.exists(store.path_for("clip1.mp3")) and not os.path.exists(store.path_for("clip2.mp3"))
+    print("✅ Existing files indexed by the first sweep")
+
+if __name__ == "__main__":
+    test_sharded_layout()
+    test_lru_eviction_respects_budget()
+    test_age_based_eviction()
+    test_files_from_other_workers_are_found()
+    test_startup_does_not_scan()
+    print("\n🎉 All audio store tests passed!")
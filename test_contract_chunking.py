@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test script to verify map-reduce review of long contracts.
+Uses a fake model, so no LLM calls are made.
+"""
+
+import sys
+import os
+import json
+import asyncio
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import agents.contract_agent as contract_agent_module
+from agents.contract_agent import ContractGuardianAgent, split_contract, merge_contract_results
+from utils.llm_cache import DisabledCache
+
+# Keep fake responses out of the persistent LLM cache
+contract_agent_module.llm_cache = DisabledCache()
+
+def make_contract(sections: int) -> str:
+    body = "The Employee agrees to the following terms and conditions. " * 15
+    return "".join(f"SECTION {i}. TERMS\n{body}\n\n{body}\n\n" for i in range(1, sections + 1))
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+class FakeModel:
+    """Flags a non-compete in every chunk and reports the salary only in the first one"""
+
+    def __init__(self):
+        self.prompts = []
+
+    def generate_content(self, prompt, stream=False):
+        self.prompts.append(prompt)
+        text = self._review(prompt)
+        if stream:
+            return [FakeResponse(text[i:i + 10]) for i in range(0, len(text), 10)]
+        return FakeResponse(text)
+
+    def _review(self, prompt):
+        first = "SECTION 1." in prompt
+        return json.dumps({
+            "overall_score": 90 if first else 45,
+            "summary": "first" if first else "later",
+            "key_terms": {"salary_base": "$90,000" if first else "Not specified", "notice_period": "Not specified"},
+            "risk_clauses": [{"clause_name": "Non-Compete", "risk_level": "YELLOW" if first else "RED"}]
+        })
+
+def test_split_is_lossless():
+    """Test that chunks respect the size limit, start at sections and keep all text"""
+    text = make_contract(40)
+    chunks = split_contract(text, 5000)
+    print(f"📄 {len(text)} characters split into {len(chunks)} chunks")
+    assert "".join(chunks) == text
+    assert all(len(chunk) <= 5000 for chunk in chunks)
+    assert all(chunk.startswith("SECTION") for chunk in chunks)
+    # Text without any boundaries still splits without loss
+    assert "".join(split_contract("x" * 12345, 5000)) == "x" * 12345
+    print("✅ Contract split without dropping text")
+
+def test_merge_keeps_worst_findings():
+    """Test the deterministic merge of chunk results"""
+    merged = merge_contract_results([
+        {"success": True, "data": {"overall_score": 80, "summary": "a", "key_terms": {"pto_days": 0},
+                                   "risk_clauses": [{"clause_name": "Non-Compete", "risk_level": "YELLOW"}]}},
+        {"success": False, "error": "timeout"},
+        {"success": True, "data": {"overall_score": 40, "summary": "b", "key_terms": {"pto_days": 15},
+                                   "risk_clauses": [{"clause_name": "non-compete", "risk_level": "RED"},
+                                                    {"clause_name": "IP Assignment", "risk_level": "GREEN"}]}}
+    ])
+    data = merged["data"]
+    assert merged["success"]
+    assert data["overall_score"] == 40 and data["summary"] == "b"
+    assert data["key_terms"]["pto_days"] == 15
+    assert [clause["risk_level"] for clause in data["risk_clauses"]] == ["RED", "GREEN"]
+    assert data["chunks_analyzed"] == 2 and data["chunks_failed"] == 1
+    print("✅ Chunk results merged")
+
+def test_long_contract_reviewed_in_chunks():
+    """Test that a long contract is reviewed in full rather than truncated"""
+    model = FakeModel()
+    agent = ContractGuardianAgent(model=model)
+    text = make_contract(60)
+    result = asyncio.run(agent.review_contract_chunked_async(text, chunk_chars=8000))
+
+    print(f"📋 {len(model.prompts)} chunk reviews, score {result['data']['overall_score']}")
+    assert len(model.prompts) == len(split_contract(text, 8000)) > 1
+    assert "SECTION 60." in "".join(model.prompts)
+    assert result["data"]["key_terms"]["salary_base"] == "$90,000"
+    assert result["data"]["risk_clauses"] == [{"clause_name": "Non-Compete", "risk_level": "RED"}]
+    print("✅ Long contract reviewed in chunks")
+
+def test_long_contract_streamed_in_chunks():
+    """Test that streaming a long contract reports each clause once and ends with the merged result"""
+    async def collect():
+        agent = ContractGuardianAgent(model=FakeModel())
+        return [event async for event in agent.review_contract_stream(make_contract(30), chunk_chars=8000)]
+
+    events = asyncio.run(collect())
+    names = [name for name, _ in events]
+    print(f"📋 Stream events: {names}")
+    assert names.count("item") == 1
+    assert names.count("progress") == len(split_contract(make_contract(30), 8000))
+    assert names[-1] == "result"
+    assert events[-1][1]["data"]["risk_clauses"] == [{"clause_name": "Non-Compete", "risk_level": "RED"}]
+    print("✅ Long contract streamed in chunks")
+
+if __name__ == "__main__":
+    test_split_is_lossless()
+    test_merge_keeps_worst_findings()
+    test_long_contract_reviewed_in_chunks()
+    test_long_contract_streamed_in_chunks()
+    print("\n🎉 All contract chunking tests passed!")
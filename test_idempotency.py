@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script to verify Idempotency-Key replay of interview answer submissions.
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from fastapi.responses import JSONResponse
+from utils.idempotency import IdempotencyCache, REPLAY_HEADER
+
+def test_retry_replays_stored_response():
+    """Test that a retry with the same key is answered without running the handler again"""
+    async def run():
+        cache = IdempotencyCache("test")
+        calls = []
+
+        async def handler():
+            calls.append(1)
+            return JSONResponse(content={"question_text": f"question {len(calls)}"})
+
+        first = await cache.run("session", "key-1", handler)
+        retry = await cache.run("session", "key-1", handler)
+        other = await cache.run("session", "key-2", handler)
+        return cache, calls, first, retry, other
+
+    cache, calls, first, retry, other = asyncio.run(run())
+    print(f"📊 Stats: {cache.stats()}")
+    assert len(calls) == 2
+    assert retry.body == first.body and retry.headers[REPLAY_HEADER] == "true"
+    assert REPLAY_HEADER not in first.headers
+    assert other.body != first.body
+    print("✅ Retry replayed stored response")
+
+def test_concurrent_retry_joins_in_flight_request():
+    """Test that a retry arriving mid-request waits for the original instead of running twice"""
+    async def run():
+        cache = IdempotencyCache("test")
+        calls = []
+
+        async def handler():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return JSONResponse(content={"status": "continue"})
+
+        responses = await asyncio.gather(*[cache.run("session", "key", handler) for _ in range(3)])
+        return cache, calls, responses
+
+    cache, calls, responses = asyncio.run(run())
+    assert len(calls) == 1
+    assert len({response.body for response in responses}) == 1
+    assert cache.stats()["joined_in_flight"] == 2
+    print("✅ Concurrent retries joined the in-flight request")
+
+def test_errors_not_stored_and_cache_bounded():
+    """Test that failed responses are retried for real and old keys are evicted"""
+    async def run():
+        cache = IdempotencyCache("test", max_keys_per_session=2, max_sessions=1)
+        calls = []
+
+        async def failing():
+            calls.append("fail")
+            return JSONResponse(status_code=500, content={"detail": "boom"})
+
+        async def handler():
+            calls.append("ok")
+            return JSONResponse(content={})
+
+        await cache.run("a", "k", failing)
+        await cache.run("a", "k", handler)
+        for key in ("k2", "k3"):
+            await cache.run("a", key, handler)
+        await cache.run("b", "k", handler)
+        return cache, calls
+
+    cache, calls = asyncio.run(run())
+    stats = cache.stats()
+    assert calls == ["fail", "ok", "ok", "ok", "ok"]
+    assert stats["sessions"] == 1 and stats["stored_responses"] == 1
+    print("✅ Errors not stored and cache bounded")
+
+if __name__ == "__main__":
+    test_retry_replays_stored_response()
+    test_concurrent_retry_joins_in_flight_request()
+    test_errors_not_stored_and_cache_bounded()
+    print("\n🎉 All idempotency tests passed!")
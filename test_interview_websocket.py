@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the WebSocket channel for the human interview loop.
+A backend that "speaks" the text as bytes is used, so no network calls are made.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import main
+from fastapi.testclient import TestClient
+from utils.audio_store import AudioStore
+from utils.tts_cache import TTSCache
+from utils.tts_backends import TTSBackend
+
+class EchoBackend(TTSBackend):
+    name = "echo"
+
+    def synthesize(self, text, lang, voice):
+        return text.encode("utf-8")
+
+tts_cache = TTSCache(
+    AudioStore(tempfile.mkdtemp(prefix="interview_socket_"), max_bytes=10 ** 6, max_files=100),
+    backend=EchoBackend()
+)
+
+client = TestClient(main.app)
+
+def receive_until(websocket, message_type):
+    """Collect messages until one of the given type arrives"""
+    received = []
+    while True:
+        message = websocket.receive_json()
+        received.append(message)
+        if message["type"] == message_type:
+            return message, received
+
+def test_interview_over_one_connection():
+    """Test that questions and audio notifications arrive over a single socket"""
+    main.tts_cache = tts_cache
+    with client.websocket_connect("/ws/human_interview?push_audio=true") as websocket:
+        websocket.send_json({"type": "start", "role": "HR Analyst", "experience_level": "Beginner"})
+        question, _ = receive_until(websocket, "question")
+        assert question["question_text"] == main.human_interview_questions.first_question("Beginner")
+
+        audio, _ = receive_until(websocket, "audio_ready")
+        assert audio["audio_url"] == question["audio_url"] and audio["pushed"]
+        assert websocket.receive_bytes() == question["question_text"].encode("utf-8")
+
+        # Answers sent back to back are queued, not rejected with 423
+        websocket.send_json({"type": "answer", "answer_text": "I like people."})
+        websocket.send_json({"type": "answer", "answer_text": "I once mediated a dispute between two colleagues."})
+        first, _ = receive_until(websocket, "question")
+        second, received = receive_until(websocket, "question")
+        assert not [message for message in received if message["type"] == "error"]
+        assert first["question_text"] == main.human_interview_questions.BEGINNER_CLARIFY
+        print(f"💬 Turns: {first['question_text'][:40]}... / {second['question_text'][:40]}...")
+    print("✅ Interview ran over one connection")
+
+def test_interview_completes_and_closes():
+    """Test that the final assessment is pushed and the socket is closed"""
+    main.tts_cache = tts_cache
+    with client.websocket_connect("/ws/human_interview") as websocket:
+        websocket.send_json({"type": "answer", "answer_text": "Too early"})
+        error = websocket.receive_json()
+        assert error["type"] == "error" and error["status_code"] == 400
+
+        websocket.send_json({"type": "start", "role": "HR Manager", "experience_level": "Expert"})
+        for turn in range(7):
+            websocket.send_json({"type": "answer", "answer_text": f"Answer number {turn} about team strategy."})
+        complete, _ = receive_until(websocket, "complete")
+        assert complete["status"] == "complete" and "final_score" in complete
+    print("✅ Interview completed over the socket")
+
+def test_repeated_answer_releases_session():
+    """Test that resending the same answer does not leave the session locked"""
+    main.tts_cache = tts_cache
+    with client.websocket_connect("/ws/human_interview") as websocket:
+        websocket.send_json({"type": "start", "role": "HR Analyst", "experience_level": "Intermediate"})
+        start, _ = receive_until(websocket, "question")
+        session_id = start["session_id"]
+
+        answer = "I led the rollout of a new onboarding process across three offices."
+        websocket.send_json({"type": "answer", "answer_text": answer})
+        first, _ = receive_until(websocket, "question")
+        websocket.send_json({"type": "answer", "answer_text": answer})
+        repeat, _ = receive_until(websocket, "question")
+        assert repeat["question_text"] == first["question_text"]
+        assert session_id not in main.active_interview_sessions
+
+        websocket.send_json({"type": "answer", "answer_text": "We cut time to productivity by two weeks."})
+        after, received = receive_until(websocket, "question")
+        assert not [message for message in received if message["type"] == "error"]
+        assert len(main.human_interview_sessions[session_id]["history_list"]) == 2
+    print("✅ Repeated answer released the session")
+
+def test_malformed_messages_get_error_frames():
+    """Test that non-object messages and invalid fields are answered with errors, not a closed socket"""
+    main.tts_cache = tts_cache
+    with client.websocket_connect("/ws/human_interview") as websocket:
+        for message in ([], "hi", 7):
+            websocket.send_json(message)
+            error = websocket.receive_json()
+            assert error["type"] == "error" and error["status_code"] == 400
+            assert error["detail"] == "Messages must be JSON objects"
+
+        websocket.send_json({"type": "start", "role": "HR Analyst", "experience_level": "Beginner"})
+        receive_until(websocket, "question")
+        websocket.send_json({"type": "answer", "answer_text": {"text": "I like people."}})
+        error, _ = receive_until(websocket, "error")
+        assert error["status_code"] == 400
+        assert "answer_text" in error["detail"]
+
+        # The connection is still usable
+        websocket.send_json({"type": "answer", "answer_text": "I like people."})
+        receive_until(websocket, "question")
+    print("✅ Malformed messages answered with error frames")
+
+if __name__ == "__main__":
+    test_interview_over_one_connection()
+    test_interview_completes_and_closes()
+    test_repeated_answer_releases_session()
+    test_malformed_messages_get_error_frames()
+    print("\n🎉 All interview WebSocket tests passed!")
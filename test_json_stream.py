@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test script to verify incremental JSON parsing of streamed LLM output.
+"""
+
+import sys
+import os
+import json
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from utils.json_stream import IncrementalJSONParser, event_payload
+
+CONTRACT_RESULT = {
+    "overall_score": 42,
+    "summary": "Watch the \"non-compete\" clause {section 4} [see below]",
+    "key_terms": {"salary_base": "$90,000", "pto_days": 15},
+    "risk_clauses": [
+        {"clause_name": "Non-Compete", "risk_level": "RED", "notes": ["2 years", "]"]},
+        {"clause_name": "IP Assignment", "risk_level": "GREEN"}
+    ]
+}
+
+def feed_in_pieces(text: str, size: int):
+    parser = IncrementalJSONParser()
+    events = []
+    for start in range(0, len(text), size):
+        events.extend(parser.feed(text[start:start + size]))
+    return parser, events
+
+def test_fields_emitted_as_they_close():
+    """Test that every field and list element is reported once, in order, whatever the chunking"""
+    text = "```json\n" + json.dumps(CONTRACT_RESULT, indent=2) + "\n```"
+    for size in (1, 7, len(text)):
+        parser, events = feed_in_pieces(text, size)
+        assert parser.result() == CONTRACT_RESULT
+        assert [event_payload(event)[0] for event in events] == ["field", "field", "field", "item", "item", "field"]
+        assert events[0] == ("field", "overall_score", 42)
+        assert events[3] == ("item", "risk_clauses", 0, CONTRACT_RESULT["risk_clauses"][0])
+    print("✅ Fields and list items emitted as they close")
+
+def test_score_arrives_before_object_ends():
+    """Test that the score is available before the rest of the response has been generated"""
+    text = json.dumps(CONTRACT_RESULT)
+    parser = IncrementalJSONParser()
+    events = parser.feed(text[:text.index('"summary"')])
+    assert events == [("field", "overall_score", 42)]
+    assert parser.result() is None
+    print("✅ Score available before the response is complete")
+
+if __name__ == "__main__":
+    test_fields_emitted_as_they_close()
+    test_score_arrives_before_object_ends()
+    print("\n🎉 All JSON stream tests passed!")
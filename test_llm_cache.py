@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the LLM response cache.
+"""
+
+import sys
+import os
+import json
+import asyncio
+import tempfile
+import threading
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from utils.tiered_cache import TieredCache
+from utils.llm_cache import make_cache_key
+
+def test_cache_tiers_and_eviction():
+    """Test memory/SQLite tiers and size-based eviction"""
+    print("=== Testing LLM Cache Tiers ===")
+
+    db_path = os.path.join(tempfile.mkdtemp(), "llm_cache.db")
+    cache = TieredCache("test", db_path, memory_entries=2, max_entries=3)
+    cache.SWEEP_EVERY = 1
+
+    for i in range(5):
+        cache.set(f"key{i}", f"value{i}")
+
+    assert cache.get("key4") == "value4"  # memory hit
+    assert cache.get("key2") == "value2"  # disk hit
+    assert cache.get("key0") is None      # evicted
+
+    stats = cache.stats()
+    print(f"📊 Stats: {stats}")
+    assert stats["memory_hits"] == 1
+    assert stats["disk_hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["disk_entries"] == 3
+    print("✅ Tiered lookups and eviction work")
+
+def test_cache_ttl():
+    """Test that expired entries are not served"""
+    db_path = os.path.join(tempfile.mkdtemp(), "llm_cache.db")
+    TieredCache("test", db_path).set("key", "value")
+
+    expired_cache = TieredCache("test", db_path, ttl_seconds=-1)
+    assert expired_cache.get("key") is None
+    assert expired_cache.stats()["expired"] == 1
+    print("✅ TTL expiry works")
+
+class ThreadRecordingCache(TieredCache):
+    """Records the thread of every SQLite access"""
+
+    def _connect(self):
+        self.__dict__.setdefault("threads", []).append(threading.current_thread())
+        return super()._connect()
+
+def test_async_access_stays_off_the_event_loop():
+    """Test that aget/aset answer memory hits inline and do SQLite work in a worker thread"""
+    db_path = os.path.join(tempfile.mkdtemp(), "llm_cache.db")
+    cache = ThreadRecordingCache("test", db_path, memory_entries=1)
+    cache.SWEEP_EVERY = 1
+    cache.threads = []
+
+    async def run():
+        loop_thread = threading.current_thread()
+        await cache.aset("key1", "value1")
+        await cache.aset("key2", "value2")
+        cache.threads.clear()
+        memory_hit = await cache.aget("key2")
+        assert cache.threads == []
+        disk_hit = await cache.aget("key1")
+        miss = await cache.aget("missing")
+        return loop_thread, memory_hit, disk_hit, miss
+
+    loop_thread, memory_hit, disk_hit, miss = asyncio.run(run())
+    assert (memory_hit, disk_hit, miss) == ("value2", "value1", None)
+    assert cache.threads and loop_thread not in cache.threads
+    stats = cache.stats()
+    assert stats["memory_hits"] == 1 and stats["disk_hits"] == 1 and stats["misses"] == 1
+    assert stats["writes"] == 2 and cache.get("key1") == "value1"
+    print("✅ Async cache access kept SQLite off the event loop")
+
+def test_agents_use_async_cache_access():
+    """Test that the async agent paths never call the blocking get/set"""
+    import agents.resume_agent as resume_agent_module
+    from agents.resume_agent import ResumeIntelligenceAgent
+
+    class AsyncOnlyCache:
+        def __init__(self):
+            self.entries = {}
+
+        def get(self, key):
+            raise AssertionError("blocking get on the event loop")
+
+        def set(self, key, value):
+            raise AssertionError("blocking set on the event loop")
+
+        async def aget(self, key):
+            return self.entries.get(key)
+
+        async def aset(self, key, value):
+            self.entries[key] = value
+
+    class FakeExecutor:
+        calls = 0
+
+        async def run_chain(self, chain, priority=None, **inputs):
+            FakeExecutor.calls += 1
+            return json.dumps({"ats_score": 88, "status": "success"})
+
+    original_cache, original_executor = resume_agent_module.llm_cache, resume_agent_module.llm_executor
+    resume_agent_module.llm_cache = AsyncOnlyCache()
+    resume_agent_module.llm_executor = FakeExecutor()
+    try:
+        agent = ResumeIntelligenceAgent()
+        first = asyncio.run(agent.analyze_resume_async("Jane Doe, HR Generalist", "HR Generalist"))
+        second = asyncio.run(agent.analyze_resume_async("Jane Doe, HR Generalist", "HR Generalist"))
+        entries = resume_agent_module.llm_cache.entries
+    finally:
+        resume_agent_module.llm_cache, resume_agent_module.llm_executor = original_cache, original_executor
+    assert first == second == {"ats_score": 88, "status": "success"}
+    assert FakeExecutor.calls == 1 and len(entries) == 1
+    print("✅ Async agent paths use aget/aset")
+
+def test_template_change_invalidates_key():
+    """Test that editing a prompt template changes the cache key"""
+    prompt = "Analyze: resume text"
+    key_v1 = make_cache_key("gemini-2.5-flash", 0.7, "Analyze: {resume}", prompt)
+    key_v2 = make_cache_key("gemini-2.5-flash", 0.7, "Analyze carefully: {resume}", prompt)
+    key_temp = make_cache_key("gemini-2.5-flash", 0.3, "Analyze: {resume}", prompt)
+
+    assert key_v1 != key_v2
+    assert key_v1 != key_temp
+    assert key_v1 == make_cache_key("gemini-2.5-flash", 0.7, "Analyze: {resume}", prompt)
+    print("✅ Template and temperature changes produce new keys")
+
+if __name__ == "__main__":
+    test_cache_tiers_and_eviction()
+    test_cache_ttl()
+    test_async_access_stays_off_the_event_loop()
+    test_agents_use_async_cache_access()
+    test_template_change_invalidates_key()
+    print("\n🎉 All LLM cache tests passed!")
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the LLM executor in native async and thread pool modes.
+Uses a fake model, so no LLM calls are made.
+"""
+
+import sys
+import os
+import time
+import asyncio
+import threading
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from agents.llm_executor import LLMExecutor
+from agents.llm_scheduler import LLMScheduler
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+class FakeAsyncStream:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            await asyncio.sleep(0)
+            yield FakeResponse(chunk)
+
+class FakeModel:
+    """Records which entry point and thread served each call"""
+
+    model_name = "models/gemini-2.5-flash"
+
+    def __init__(self, chunks=("Hello", ", ", "world"), chunk_delay=0.0, with_async=True):
+        self.chunks = list(chunks)
+        self.chunk_delay = chunk_delay
+        self.calls = []
+        self.produced = 0
+        self.closed = False
+        if not with_async:
+            self.generate_content_async = None
+
+    def generate_content(self, prompt, stream=False):
+        self.calls.append(("sync", threading.current_thread().name))
+        if not stream:
+            return FakeResponse("".join(self.chunks))
+        return self._stream()
+
+    def _stream(self):
+        try:
+            for chunk in self.chunks:
+                time.sleep(self.chunk_delay)
+                self.produced += 1
+                yield FakeResponse(chunk)
+        finally:
+            self.closed = True
+
+    async def generate_content_async(self, prompt, stream=False):
+        self.calls.append(("async", threading.current_thread().name))
+        if stream:
+            return FakeAsyncStream(self.chunks)
+        return FakeResponse("".join(self.chunks))
+
+def make_executor(mode: str) -> LLMExecutor:
+    return LLMExecutor(mode=mode, max_workers=2, scheduler=LLMScheduler(max_in_flight=2, requests_per_minute=0))
+
+def test_native_async_mode():
+    """Test that async mode awaits the client's own coroutines on the event loop"""
+    executor = make_executor("async")
+    model = FakeModel()
+
+    async def run():
+        text = await executor.generate_text(model, "prompt")
+        chunks = [chunk async for chunk in executor.stream_text(model, "prompt")]
+        return text, chunks
+
+    text, chunks = asyncio.run(run())
+    assert text == "Hello, world" and chunks == ["Hello", ", ", "world"]
+    assert [kind for kind, _ in model.calls] == ["async", "async"]
+    assert executor._pool is None
+    print("✅ Native async mode used the client's coroutines")
+
+def test_thread_mode():
+    """Test that thread mode runs the blocking client on the pool, streaming included"""
+    executor = make_executor("thread")
+    model = FakeModel()
+
+    async def run():
+        text = await executor.generate_text(model, "prompt")
+        chunks = [chunk async for chunk in executor.stream_text(model, "prompt")]
+        return text, chunks
+
+    try:
+        text, chunks = asyncio.run(run())
+    finally:
+        executor.shutdown()
+    assert text == "Hello, world" and chunks == ["Hello", ", ", "world"]
+    assert [kind for kind, _ in model.calls] == ["sync", "sync"]
+    assert all(thread.startswith("llm") for _, thread in model.calls)
+    assert model.closed
+    print("✅ Thread mode ran the blocking client on the pool")
+
+def test_early_stop_releases_stream():
+    """Test that a consumer that stops early does not wait for the rest of the stream"""
+    executor = make_executor("thread")
+    model = FakeModel(chunks=[f"chunk{i} " for i in range(100)], chunk_delay=0.02, with_async=False)
+
+    async def run():
+        stream = executor.stream_text(model, "prompt")
+        received = [await stream.__anext__(), await stream.__anext__()]
+        start = time.perf_counter()
+        await stream.aclose()
+        return received, time.perf_counter() - start, executor.scheduler.stats()
+
+    try:
+        received, close_seconds, stats = asyncio.run(run())
+    finally:
+        executor.shutdown()
+    print(f"⏱️ Closed after {close_seconds:.3f}s; model produced {model.produced} of 100 chunks")
+    assert received == ["chunk0 ", "chunk1 "]
+    assert close_seconds < 0.5 and model.produced < 10 and model.closed
+    assert stats["in_flight"] == 0
+    print("✅ Early stop released the stream and its scheduler slot")
+
+def test_stream_error_reaches_consumer():
+    """Test that a client error in the worker is raised to the consumer"""
+    executor = make_executor("thread")
+
+    class FailingModel(FakeModel):
+        def generate_content(self, prompt, stream=False):
+            raise RuntimeError("quota exceeded")
+
+    async def run():
+        return [chunk async for chunk in executor.stream_text(FailingModel(with_async=False), "prompt")]
+
+    try:
+        asyncio.run(run())
+        assert False, "Expected RuntimeError"
+    except RuntimeError as e:
+        assert "quota exceeded" in str(e)
+    finally:
+        executor.shutdown()
+    print("✅ Stream errors reach the consumer")
+
+if __name__ == "__main__":
+    test_native_async_mode()
+    test_thread_mode()
+    test_early_stop_releases_stream()
+    test_stream_error_reaches_consumer()
+    print("\n🎉 All LLM executor tests passed!")
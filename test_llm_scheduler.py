@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the LLM scheduler: in-flight cap, priorities and rate limits.
+"""
+
+import sys
+import os
+import asyncio
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from agents.llm_scheduler import LLMScheduler, PRIORITY_INTERACTIVE, PRIORITY_BATCH
+
+async def _call(scheduler, name, priority, order, duration=0.05):
+    async with scheduler.slot("gemini-2.5-flash", priority):
+        order.append(name)
+        await asyncio.sleep(duration)
+
+def test_in_flight_cap():
+    """Test that no more than max_in_flight calls run at once"""
+    async def run():
+        scheduler = LLMScheduler(max_in_flight=2, requests_per_minute=0)
+        running = 0
+        peak = 0
+
+        async def call():
+            nonlocal running, peak
+            async with scheduler.slot("gemini-2.5-flash"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.02)
+                running -= 1
+
+        await asyncio.gather(*[call() for _ in range(10)])
+        return peak, scheduler.stats()
+
+    peak, stats = asyncio.run(run())
+    print(f"📊 Peak concurrency: {peak}")
+    assert peak == 2
+    assert stats["in_flight"] == 0
+    assert stats["queue_depth"] == 0
+    print("✅ In-flight cap respected")
+
+def test_interactive_jumps_queue():
+    """Test that queued interactive calls run before queued batch calls"""
+    async def run():
+        scheduler = LLMScheduler(max_in_flight=1, requests_per_minute=0)
+        order = []
+        blocker = asyncio.create_task(_call(scheduler, "blocker", PRIORITY_BATCH, order))
+        await asyncio.sleep(0)
+        batch = [asyncio.create_task(_call(scheduler, f"batch{i}", PRIORITY_BATCH, order)) for i in range(3)]
+        await asyncio.sleep(0)
+        interactive = asyncio.create_task(_call(scheduler, "interactive", PRIORITY_INTERACTIVE, order))
+        await asyncio.sleep(0)
+        depth = scheduler.stats()["queue_depth_by_priority"]
+        await asyncio.gather(blocker, interactive, *batch)
+        return order, depth
+
+    order, depth = asyncio.run(run())
+    print(f"📋 Execution order: {order}")
+    assert depth == {"interactive": 1, "default": 0, "batch": 3}
+    assert order[1] == "interactive"
+    print("✅ Interactive work jumps ahead of batch work")
+
+def test_token_bucket_rate_limit():
+    """Test that the per-model token bucket spaces out calls beyond the burst"""
+    async def run():
+        scheduler = LLMScheduler(max_in_flight=10, requests_per_minute=600, burst=2)
+        order = []
+        start = time.monotonic()
+        await asyncio.gather(*[_call(scheduler, str(i), PRIORITY_BATCH, order, 0) for i in range(4)])
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+    print(f"⏱️ 4 calls with burst 2 at 10 req/s took {elapsed:.2f}s")
+    # Two calls go immediately, the next two wait ~0.1s each for tokens
+    assert 0.15 <= elapsed < 1.0
+    print("✅ Token bucket rate limiting works")
+
+def test_bad_priority_rejected_without_leaking():
+    """Test that an unknown priority fails only its own call and leaves the scheduler usable"""
+    async def run():
+        scheduler = LLMScheduler(max_in_flight=1, requests_per_minute=0)
+        try:
+            async with scheduler.slot("gemini-2.5-flash", {"job": "details"}):
+                pass
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+
+        # An unusable model name fails inside dispatch; the slot must not be taken
+        try:
+            async with scheduler.slot(["not", "hashable"], PRIORITY_BATCH):
+                pass
+            assert False, "Expected TypeError"
+        except TypeError:
+            pass
+
+        order = []
+        await asyncio.gather(*[_call(scheduler, str(i), PRIORITY_BATCH, order, 0) for i in range(3)])
+        return order, scheduler.stats()
+
+    order, stats = asyncio.run(run())
+    print(f"📊 Stats after bad calls: in_flight={stats['in_flight']} queue={stats['queue_depth']}")
+    assert order == ["0", "1", "2"]
+    assert stats["in_flight"] == 0 and stats["queue_depth"] == 0
+    print("✅ Bad calls rejected without leaking a slot")
+
+if __name__ == "__main__":
+    test_in_flight_cap()
+    test_interactive_jumps_queue()
+    test_token_bucket_rate_limit()
+    test_bad_priority_rejected_without_leaking()
+    print("\n🎉 All LLM scheduler tests passed!")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script to verify page-parallel PDF extraction on the process pool.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import fitz  # PyMuPDF
+from utils.pdf_extraction import PDFExtractor, page_ranges
+
+def make_pdf(pages: int) -> bytes:
+    doc = fitz.open()
+    for number in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page {number + 1}: termination requires thirty days notice.")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+def serial_text(data: bytes) -> str:
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        return "".join(page.get_text() for page in doc)
+
+def test_page_ranges():
+    """Test that page partitions are contiguous, balanced and complete"""
+    assert page_ranges(10, 3) == [(0, 4), (4, 7), (7, 10)]
+    assert page_ranges(2, 8) == [(0, 1), (1, 2)]
+    assert page_ranges(0, 4) == [(0, 0)]
+    print("✅ Page ranges partitioned")
+
+def test_parallel_matches_serial():
+    """Test that pooled extraction returns the pages in order, identical to serial extraction"""
+    data = make_pdf(45)
+    extractor = PDFExtractor(workers=2, min_pages=10)
+    try:
+        extractor.warm_up()
+        text = extractor.extract(data)
+        memoryview_text = extractor.extract(memoryview(data))
+    finally:
+        extractor.shutdown()
+    assert text == serial_text(data) == memoryview_text
+    assert text.index("Page 9:") < text.index("Page 10:") < text.index("Page 45:")
+    stats = extractor.stats()
+    print(f"📊 Stats: {stats}")
+    assert stats["parallel_documents"] == 2 and stats["pages"] == 90
+    print("✅ Parallel extraction matches serial")
+
+def test_small_documents_stay_in_process():
+    """Test that short documents skip the pool entirely"""
+    extractor = PDFExtractor(workers=4, min_pages=32)
+    assert extractor.extract(make_pdf(3)).count("Page") == 3
+    assert extractor.stats()["parallel_documents"] == 0 and extractor._pool is None
+    print("✅ Small documents extracted in process")
+
+def test_worker_errors_fall_back_in_process():
+    """Test that any failure on the pool is retried in process instead of failing the upload"""
+    data = make_pdf(40)
+    extractor = PDFExtractor(workers=2, min_pages=10)
+
+    def failing_worker(buffer, page_count, max_chars):
+        raise ValueError("bad type: 'stream'")
+
+    extractor._extract_parallel = failing_worker
+    text = extractor.extract(data)
+    stats = extractor.stats()
+    print(f"📊 Stats: {stats}")
+    assert text == serial_text(data)
+    assert stats["pool_failures"] == 1 and stats["parallel_documents"] == 0
+    print("✅ Worker error fell back to in-process extraction")
+
+def test_budget_stops_loading_pages():
+    """Test that extraction stops once the character budget is met and reports skipped pages"""
+    data = make_pdf(300)
+    page_chars = len(serial_text(make_pdf(1)))
+    budget = page_chars * 10 + 5
+
+    extractor = PDFExtractor(workers=1)
+    text, report = extractor.extract_with_budget(data, budget)
+    print(f"📊 Serial report: {report}")
+    assert len(text) == budget and serial_text(data).startswith(text)
+    assert report == {"pages_total": 300, "pages_processed": 11, "pages_skipped": 289, "truncated": True}
+    assert extractor.stats()["pages"] == 11 and extractor.stats()["pages_skipped"] == 289
+
+    full_text, full_report = extractor.extract_with_budget(data, 0)
+    assert full_text == serial_text(data) and full_report["pages_skipped"] == 0 and not full_report["truncated"]
+
+    pooled = PDFExtractor(workers=2, min_pages=10)
+    try:
+        pooled_text, pooled_report = pooled.extract_with_budget(data, budget)
+    finally:
+        pooled.shutdown()
+    print(f"📊 Pooled report: {pooled_report}")
+    assert pooled_text == text
+    assert pooled_report["pages_processed"] == PDFExtractor.BUDGET_RANGE_PAGES * 2
+    assert pooled_report["pages_skipped"] == 300 - pooled_report["pages_processed"]
+    print("✅ Extraction bounded by the character budget")
+
+if __name__ == "__main__":
+    test_page_ranges()
+    test_parallel_matches_serial()
+    test_small_documents_stay_in_process()
+    test_worker_errors_fall_back_in_process()
+    test_budget_stops_loading_pages()
+    print("\n🎉 All PDF extraction tests passed!")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test script to verify in-place PDF upload ingestion and streaming upload size limits.
+"""
+
+import sys
+import os
+import asyncio
+from tempfile import SpooledTemporaryFile
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import fitz  # PyMuPDF
+from fastapi import FastAPI, UploadFile, File
+from fastapi.testclient import TestClient
+from config import settings
+from utils.pdf_ingestion import (
+    UploadSizeLimitMiddleware,
+    UploadTooLargeError,
+    extract_pdf_text,
+    receive_pdf_upload
+)
+
+def make_pdf(pages: int) -> bytes:
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Clause {number + 1}: The employee shall give notice.")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+def make_upload(data: bytes, spool_max_size: int = 1024 * 1024) -> UploadFile:
+    spool = SpooledTemporaryFile(max_size=spool_max_size)
+    spool.write(data)
+    spool.seek(0)
+    return UploadFile(file=spool, filename="contract.pdf")
+
+def test_small_upload_read_in_memory():
+    """Test that small uploads are read once and extracted from memory"""
+    data = make_pdf(3)
+    upload = asyncio.run(receive_pdf_upload(make_upload(data), max_bytes=10 ** 6, spool_threshold=10 ** 6))
+    with upload:
+        assert not upload.spooled and upload.size == len(data)
+        text = upload.extract_text()
+    assert "Clause 3" in text and text == extract_pdf_text(data)[0]
+    print("✅ Small upload extracted from memory")
+
+def test_large_upload_mapped_from_disk():
+    """Test that uploads above the spool threshold are memory-mapped, not copied"""
+    data = make_pdf(40)
+    upload_file = make_upload(data, spool_max_size=1024)
+    upload = asyncio.run(receive_pdf_upload(upload_file, max_bytes=10 ** 7, spool_threshold=1024))
+    # The mapping outlives the upload file, as in the streamed batch endpoint
+    upload_file.file.close()
+    with upload:
+        assert upload.spooled and isinstance(upload.buffer, memoryview)
+        text = upload.extract_text()
+    assert text == extract_pdf_text(data)[0]
+    print(f"✅ {len(data)}-byte upload extracted from a disk mapping")
+
+def pinned_pymupdf_version() -> str:
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "requirements.txt")) as requirements:
+        for line in requirements:
+            if line.lower().startswith("pymupdf=="):
+                return line.split("==")[1].strip()
+    raise AssertionError("PyMuPDF is not pinned in requirements.txt")
+
+def test_pinned_pymupdf_opens_mapped_uploads():
+    """Test that the pinned PyMuPDF opens an upload over the spool threshold from its mapping"""
+    # Releases before 1.19 only accept bytes for stream= and reject the memoryview
+    assert fitz.VersionBind == pinned_pymupdf_version(), (
+        f"Installed PyMuPDF {fitz.VersionBind} is not the pinned {pinned_pymupdf_version()}"
+    )
+    doc = fitz.open()
+    for number in range(3):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Clause {number + 1}: The employee shall give notice.")
+        side = 512
+        pixmap = fitz.Pixmap(fitz.csRGB, side, side, os.urandom(side * side * 3), False)
+        page.insert_image(fitz.Rect(72, 100, 300, 328), pixmap=pixmap)
+    data = doc.tobytes()
+    doc.close()
+    assert len(data) > settings.UPLOAD_SPOOL_THRESHOLD_BYTES
+
+    upload = asyncio.run(receive_pdf_upload(make_upload(data)))
+    with upload:
+        assert upload.spooled and isinstance(upload.buffer, memoryview)
+        text = upload.extract_text()
+    assert "Clause 3" in text
+    print(f"✅ PyMuPDF {fitz.VersionBind} extracted a {len(data)}-byte mapped upload")
+
+def test_oversized_upload_rejected():
+    """Test the per-file size limit"""
+    try:
+        asyncio.run(receive_pdf_upload(make_upload(make_pdf(5)), max_bytes=100))
+        assert False, "Expected UploadTooLargeError"
+    except UploadTooLargeError:
+        pass
+    print("✅ Oversized upload rejected")
+
+def test_middleware_stops_streaming_body():
+    """Test that the middleware answers 413 for declared and streamed oversized bodies"""
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, limits=[("/upload", 2048)])
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    @app.post("/other")
+    async def other(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    client = TestClient(app)
+    assert client.post("/upload", files={"file": ("a.pdf", b"x" * 100)}).json() == {"size": 100}
+    assert client.post("/upload", files={"file": ("a.pdf", b"x" * 5000)}).status_code == 413
+    assert client.post("/other", files={"file": ("a.pdf", b"x" * 5000)}).status_code == 200
+
+    # A chunked body has no Content-Length, so it is counted while it streams in
+    def chunks():
+        yield b'--b\r\nContent-Disposition: form-data; name="file"; filename="a.pdf"\r\n\r\n'
+        for _ in range(64):
+            yield b"y" * 1024
+        yield b"\r\n--b--\r\n"
+
+    response = client.post("/upload", content=chunks(), headers={"Content-Type": "multipart/form-data; boundary=b"})
+    assert response.status_code == 413
+    print("✅ Middleware limits request bodies")
+
+def test_rejection_carries_cors_headers():
+    """Test that the app's 413 reaches a cross-origin frontend as a readable response"""
+    import main
+
+    origin = settings.FRONTEND_URL
+    response = TestClient(main.app).post(
+        "/api/analyze/contract",
+        content=b"x" * (settings.UPLOAD_MAX_BYTES + 1),
+        headers={"Origin": origin, "Content-Type": "multipart/form-data; boundary=b"}
+    )
+    assert response.status_code == 413
+    assert response.headers.get("access-control-allow-origin") == origin
+    print("✅ 413 responses carry CORS headers")
+
+if __name__ == "__main__":
+    test_small_upload_read_in_memory()
+    test_large_upload_mapped_from_disk()
+    test_pinned_pymupdf_opens_mapped_uploads()
+    test_oversized_upload_rejected()
+    test_middleware_stops_streaming_body()
+    test_rejection_carries_cors_headers()
+    print("\n🎉 All PDF ingestion tests passed!")
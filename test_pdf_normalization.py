@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that repeated page furniture is stripped from extracted PDF text.
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import fitz  # PyMuPDF
+from utils.pdf_extraction import PDFExtractor
+from utils.pdf_normalization import normalize_pages, estimate_tokens
+
+def make_contract(pages: int) -> bytes:
+    doc = fitz.open()
+    for number in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 40), "ACME CORP  -  EMPLOYMENT AGREEMENT    CONFIDENTIAL")
+        page.insert_text((72, 100), f"Section {number + 1}. Notice")
+        page.insert_text((72, 120), f"The employee shall give    {number + 30} days written notice.")
+        page.insert_text((72, 140), "Either party may terminate this agreement for cause.")
+        for line in range(6):
+            page.insert_text((72, 200 + line * 20), f"Term {number + 1}.{line + 1} applies to the employee.")
+        page.insert_text((72, 720), f"Company Confidential | Acme Corp | {number + 1}")
+        page.insert_text((72, 740), "Employee initials: ________")
+        page.insert_text((72, 770), f"Page {number + 1} of {pages}")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+def test_repeated_lines_stripped():
+    """Test that headers, footers, page numbers and initials lines are dropped and body text kept"""
+    pages, _ = PDFExtractor(workers=1).extract_pages(make_contract(12))
+    text, report = normalize_pages(pages)
+    print(f"📊 Report: {report}")
+
+    assert text.count("ACME CORP - EMPLOYMENT AGREEMENT CONFIDENTIAL") == 1
+    assert text.count("Employee initials") == 1
+    assert "Page 3 of 12" not in text
+    assert text.count("Company Confidential | Acme Corp") == 1
+    for number in range(12):
+        assert f"Section {number + 1}. Notice" in text
+        assert f"The employee shall give {number + 30} days written notice." in text
+    assert text.count("Either party may terminate this agreement for cause.") == 12
+    assert "  " not in text and "\n\n\n" not in text
+
+    assert report["repeated_lines_removed"] == 22
+    assert report["signature_lines_removed"] == 11
+    assert report["page_numbers_removed"] == 12
+    assert report["chars_after"] == len(text) and report["chars_saved"] > 0
+    assert report["tokens_saved"] == report["tokens_before"] - estimate_tokens(text)
+    print(f"✅ Saved {report['chars_saved']} characters (~{report['tokens_saved']} tokens, {report['saved_percent']}%)")
+
+def test_short_documents_keep_repeated_lines():
+    """Test that a two-page resume keeps lines that repeat on both pages"""
+    pages = ["Jane Doe\nHR Generalist\n\n\n1\n", "Jane Doe\nReferences on request\n2\n"]
+    text, report = normalize_pages(pages)
+    assert text == "Jane Doe\nHR Generalist\n\nJane Doe\nReferences on request"
+    assert report["repeated_lines_removed"] == 0 and report["page_numbers_removed"] == 2
+    print("✅ Short documents keep their lines")
+
+def test_numbers_that_are_not_page_numbers_kept():
+    """Test that a year or an amount at a page edge is kept unless it follows the page sequence"""
+    resume = ["Jane Doe\nHR Generalist, Acme Corp\nCertified Professional in Human Resources\n2019\n"]
+    text, report = normalize_pages(resume)
+    assert text.endswith("\n2019") and report["page_numbers_removed"] == 0
+
+    statement = [
+        "Payroll Summary\nGross pay for the period\n4500\n",
+        "Deductions\nFederal income tax withheld\n2\n",
+        "Net Pay\nAmount deposited to the employee\n3612\n"
+    ]
+    text, report = normalize_pages(statement)
+    assert "4500" in text and "3612" in text and "\n2\n" not in text
+    assert report["page_numbers_removed"] == 1
+
+    # A cover page shifts the printed numbers by one; the sequence is still recognized
+    offset = ["Employment Agreement\nAcme Corp\n"] + [
+        f"Clause {number}\nThe employee agrees to clause {number}.\n{number}\n" for number in range(1, 6)
+    ]
+    text, report = normalize_pages(offset)
+    assert report["page_numbers_removed"] == 5
+    for number in range(1, 6):
+        assert f"The employee agrees to clause {number}." in text
+    assert not any(line.isdigit() for line in text.splitlines())
+    print("✅ Years and amounts at page edges are kept")
+
+if __name__ == "__main__":
+    test_repeated_lines_stripped()
+    test_short_documents_keep_repeated_lines()
+    test_numbers_that_are_not_page_numbers_kept()
+    print("\n🎉 All PDF normalization tests passed!")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that repeat PDF uploads are served from the extracted-text cache.
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+from tempfile import SpooledTemporaryFile
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import fitz  # PyMuPDF
+from fastapi import UploadFile
+import utils.pdf_ingestion as pdf_ingestion
+from utils.pdf_text_cache import make_extraction_key, content_hash
+from utils.tiered_cache import TieredCache
+
+def make_pdf(text: str) -> bytes:
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+def upload(data: bytes) -> UploadFile:
+    spool = SpooledTemporaryFile()
+    spool.write(data)
+    spool.seek(0)
+    return UploadFile(file=spool, filename="resume.pdf")
+
+def extract(data: bytes, spool_threshold: int = 10 ** 6) -> str:
+    pdf = asyncio.run(pdf_ingestion.receive_pdf_upload(upload(data), max_bytes=10 ** 7, spool_threshold=spool_threshold))
+    with pdf:
+        return pdf.extract_text()
+
+def test_repeat_upload_skips_parsing():
+    """Test that the same bytes are parsed once, in memory or mapped from disk"""
+    cache = TieredCache("pdf_text_test", os.path.join(tempfile.mkdtemp(), "cache.db"))
+    parsed = []
+    original_cache, original_extract = pdf_ingestion.pdf_text_cache, pdf_ingestion.extract_pdf_text
+    pdf_ingestion.pdf_text_cache = cache
+    pdf_ingestion.extract_pdf_text = lambda buffer, max_chars=0: parsed.append(1) or original_extract(buffer, max_chars)
+    try:
+        resume = make_pdf("Jane Doe - HR Generalist")
+        first = extract(resume)
+        second = extract(resume)
+        mapped = extract(resume, spool_threshold=0)
+        other = extract(make_pdf("John Roe - Payroll Specialist"))
+    finally:
+        pdf_ingestion.pdf_text_cache, pdf_ingestion.extract_pdf_text = original_cache, original_extract
+
+    stats = cache.stats()
+    print(f"📊 Stats: {stats}")
+    assert first == second == mapped and "Jane Doe" in first and "John Roe" in other
+    assert len(parsed) == 2
+    assert stats["memory_hits"] == 2 and stats["misses"] == 2 and stats["hit_rate"] == 0.5
+    print("✅ Repeat upload skipped parsing")
+
+def test_key_includes_extractor_version():
+    """Test that a new extractor version never reuses old text"""
+    digest = content_hash(b"%PDF-1.7 same bytes")
+    assert digest == content_hash(memoryview(b"%PDF-1.7 same bytes"))
+    assert make_extraction_key(digest, "v1") != make_extraction_key(digest, "v2")
+    assert make_extraction_key(digest, "v1") != make_extraction_key(digest, "v1", max_chars=1000)
+    print("✅ Extractor version is part of the key")
+
+if __name__ == "__main__":
+    test_repeat_upload_skips_parsing()
+    test_key_includes_extractor_version()
+    print("\n🎉 All PDF text cache tests passed!")
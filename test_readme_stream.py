@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the streaming Auto-Docs endpoint event sequence.
+The clone and the model are faked, so no network or LLM calls are made.
+"""
+
+import sys
+import os
+import json
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import git
+import main
+from fastapi.testclient import TestClient
+
+README_CHUNKS = ["```\n# Payroll Helper\n", "Computes net pay ", "for HR teams.\n", "```"]
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+class FakeAsyncStream:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield FakeResponse(chunk)
+
+class FakeModel:
+    """Streams a fenced README in a few chunks, in either executor mode"""
+
+    model_name = "models/gemini-2.5-flash"
+
+    def __init__(self):
+        self.prompts = []
+
+    def generate_content(self, prompt, stream=False):
+        self.prompts.append(prompt)
+        return [FakeResponse(chunk) for chunk in README_CHUNKS]
+
+    async def generate_content_async(self, prompt, stream=False):
+        self.prompts.append(prompt)
+        return FakeAsyncStream(README_CHUNKS)
+
+def fake_clone(url, to_path, **kwargs):
+    if "missing" in url:
+        raise git.exc.GitCommandError("clone", 128, stderr="repository not found")
+    with open(os.path.join(to_path, "payroll.py"), "w") as source:
+        source.write("def net_pay(gross):\n    return gross * 0.8\n")
+    with open(os.path.join(to_path, "requirements.txt"), "w") as requirements:
+        requirements.write("fastapi\n")
+
+def parse_events(body: str) -> list:
+    events = []
+    for message in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in message.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+def stream_readme(github_url: str, model: FakeModel):
+    saved = []
+    original_clone, original_save = git.Repo.clone_from, main.save_readme_history
+    git.Repo.clone_from = staticmethod(fake_clone)
+    main.save_readme_history = lambda readme_content, url: saved.append(readme_content) or 42
+    main.app.dependency_overrides[main.get_docs_model] = lambda: model
+    try:
+        response = TestClient(main.app).post(
+            "/api/autodocs/generate/stream",
+            json={"github_url": github_url, "project_title": "Payroll Helper"}
+        )
+    finally:
+        git.Repo.clone_from, main.save_readme_history = original_clone, original_save
+        main.app.dependency_overrides.pop(main.get_docs_model, None)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    return parse_events(response.text), saved
+
+def test_event_sequence():
+    """Test progress stages, then chunk events, then done with the cleaned README"""
+    model = FakeModel()
+    events, saved = stream_readme("https://github.com/acme/payroll", model)
+    names = [name for name, _ in events]
+    print(f"📋 Events: {names}")
+
+    stages = [payload["stage"] for name, payload in events if name == "progress"]
+    assert stages == ["cloning", "cloned", "files_scanned", "prompt_ready"]
+    assert names == ["progress"] * 4 + ["chunk"] * len(README_CHUNKS) + ["done"]
+    assert events[2][1]["files"] == 2
+    assert [payload["text"] for name, payload in events if name == "chunk"] == README_CHUNKS
+
+    done = events[-1][1]
+    assert done["readme_content"] == main.clean_readme_content("".join(README_CHUNKS))
+    assert done["readme_content"] == "\n# Payroll Helper\nComputes net pay for HR teams.\n"
+    assert done["history_id"] == 42 and saved == [done["readme_content"]]
+    assert "def net_pay" in model.prompts[0]
+    print("✅ README streamed in order")
+
+def test_clone_failure_emits_error():
+    """Test that a failed clone ends the stream with an error event and no model call"""
+    model = FakeModel()
+    events, saved = stream_readme("https://github.com/acme/missing", model)
+    print(f"📋 Events: {[name for name, _ in events]}")
+    assert [name for name, _ in events] == ["progress", "error"]
+    assert "Failed to clone repository" in events[-1][1]["detail"]
+    assert model.prompts == [] and saved == []
+    print("✅ Clone failure reported as an error event")
+
+if __name__ == "__main__":
+    test_event_sequence()
+    test_clone_failure_emits_error()
+    print("\n🎉 All README streaming tests passed!")
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Test script to verify batch resume screening: the NDJSON endpoint, bounded concurrency,
+cancellation and the bulk history write. A stubbed executor is used, so no LLM calls are made.
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import fitz  # PyMuPDF
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+import main
+import agents.resume_agent as resume_agent_module
+import utils.history_manager as history_manager_module
+from fastapi.testclient import TestClient
+from agents.config import agent_config
+from agents.resume_agent import ResumeIntelligenceAgent
+from models.history import History
+from models.user import Base
+from utils.history_manager import HistoryManager
+from utils.llm_cache import DisabledCache
+
+# Keep fake responses out of the persistent LLM cache
+resume_agent_module.llm_cache = DisabledCache()
+ORIGINAL_EXECUTOR = resume_agent_module.llm_executor
+
+class FakeExecutor:
+    """Scores each resume by its length; content containing FAIL raises"""
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.start_times = {}
+        self.running = 0
+        self.peak = 0
+        self.started = 0
+        self.finished = 0
+        self.cancelled = 0
+
+    async def run_chain(self, chain, priority=None, **inputs):
+        self.start_times[inputs["resume_content"]] = time.perf_counter()
+        self.started += 1
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+        if "FAIL" in inputs["resume_content"]:
+            raise RuntimeError("model unavailable")
+        self.finished += 1
+        return json.dumps({"ats_score": len(inputs["resume_content"]) % 100, "status": "success"})
+
+def make_agent(executor: FakeExecutor) -> ResumeIntelligenceAgent:
+    resume_agent_module.llm_executor = executor
+    return ResumeIntelligenceAgent()
+
+def make_pdf(text: str) -> bytes:
+    doc = fitz.open()
+    doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+def test_concurrency_capped():
+    """Test that at most RESUME_BATCH_CONCURRENCY analyses run at once"""
+    executor = FakeExecutor()
+    agent = make_agent(executor)
+    resumes = [(index, f"Resume {index} for an HR Generalist") for index in range(agent_config.RESUME_BATCH_CONCURRENCY * 3)]
+
+    async def run():
+        return [item async for item in agent.analyze_batch(resumes, "HR Generalist")]
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        resume_agent_module.llm_executor = ORIGINAL_EXECUTOR
+    print(f"📊 Peak concurrency: {executor.peak} (limit {agent_config.RESUME_BATCH_CONCURRENCY})")
+    assert sorted(index for index, _ in results) == list(range(len(resumes)))
+    assert executor.peak == agent_config.RESUME_BATCH_CONCURRENCY
+    print("✅ Batch concurrency capped")
+
+def test_early_stop_cancels_outstanding():
+    """Test that outstanding analyses are cancelled when the consumer stops reading"""
+    executor = FakeExecutor(latency=0.2)
+    agent = make_agent(executor)
+    resumes = [(index, f"Resume {index}") for index in range(12)]
+
+    async def run():
+        batch = agent.analyze_batch(resumes, "HR Generalist", max_concurrency=3)
+        first = await batch.__anext__()
+        await batch.aclose()
+        await asyncio.sleep(0.3)
+        return first
+
+    try:
+        first = asyncio.run(run())
+    finally:
+        resume_agent_module.llm_executor = ORIGINAL_EXECUTOR
+    print(f"📊 Started {executor.started}, finished {executor.finished}, cancelled {executor.cancelled}")
+    assert first[1]["ats_score"] >= 0
+    assert executor.cancelled >= 1 and executor.finished < len(resumes)
+    assert executor.started < len(resumes) and executor.running == 0
+    assert executor.started == executor.finished + executor.cancelled
+    print("✅ Early stop cancelled outstanding analyses")
+
+def test_endpoint_streams_one_line_per_resume():
+    """Test the NDJSON stream: per-file lines (including extraction errors) and a summary"""
+    executor = FakeExecutor(latency=0.01)
+    agent = make_agent(executor)
+    saved = []
+    original_bulk = main.history_manager.save_history_bulk
+    main.history_manager.save_history_bulk = lambda records: saved.append(records) or list(range(len(records)))
+    main.app.dependency_overrides[main.get_resume_agent] = lambda: agent
+    try:
+        files = [
+            ("files", ("a.pdf", make_pdf("Jane Doe - HR Generalist"), "application/pdf")),
+            ("files", ("b.pdf", make_pdf("John Roe - Payroll FAIL"), "application/pdf")),
+            ("files", ("c.txt", b"plain text resume", "text/plain")),
+            ("files", ("d.pdf", b"%PDF-1.7 not really a pdf", "application/pdf")),
+            ("files", ("e.pdf", make_pdf("Ada Lane - Recruiter"), "application/pdf")),
+        ]
+        response = TestClient(main.app).post(
+            "/api/analyze/resume/batch", files=files, data={"job_description": "HR Generalist"}
+        )
+    finally:
+        resume_agent_module.llm_executor = ORIGINAL_EXECUTOR
+        main.history_manager.save_history_bulk = original_bulk
+        main.app.dependency_overrides.pop(main.get_resume_agent, None)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    print(f"📋 Lines: {[(line.get('filename'), line['status']) for line in lines]}")
+    assert len(lines) == 6
+    by_name = {line["filename"]: line for line in lines[:-1]}
+    assert by_name["a.pdf"]["status"] == "success" and by_name["e.pdf"]["status"] == "success"
+    assert by_name["b.pdf"]["status"] == "error" and "model unavailable" in by_name["b.pdf"]["error"]
+    assert by_name["c.txt"]["status"] == "error" and "Only PDF" in by_name["c.txt"]["error"]
+    assert by_name["d.pdf"]["status"] == "error"
+    assert lines[-1] == {"status": "complete", "total": 5, "succeeded": 2, "failed": 3, "history_saved": 2}
+    assert len(saved) == 1 and len(saved[0]) == 2
+    print("✅ Batch endpoint streamed one line per resume plus a summary")
+
+def test_analysis_starts_before_slowest_extraction():
+    """Test that a resume is analyzed and streamed while another PDF is still being extracted"""
+    executor = FakeExecutor(latency=0.01)
+    agent = make_agent(executor)
+    original_extract = main.PDFUpload.extract
+    slow_done = []
+
+    def extract(upload, max_chars=0):
+        text, report = original_extract(upload, max_chars)
+        if "Slow" in text:
+            time.sleep(0.5)
+            slow_done.append(time.perf_counter())
+        return text, report
+
+    main.PDFUpload.extract = extract
+    original_bulk = main.history_manager.save_history_bulk
+    main.history_manager.save_history_bulk = lambda records: list(range(len(records)))
+    main.app.dependency_overrides[main.get_resume_agent] = lambda: agent
+    try:
+        files = [
+            ("files", ("slow.pdf", make_pdf("Slow Scan - Benefits Specialist"), "application/pdf")),
+            ("files", ("fast.pdf", make_pdf("Fast Lane - HR Generalist"), "application/pdf")),
+        ]
+        response = TestClient(main.app).post(
+            "/api/analyze/resume/batch", files=files, data={"job_description": "HR Generalist"}
+        )
+    finally:
+        main.PDFUpload.extract = original_extract
+        resume_agent_module.llm_executor = ORIGINAL_EXECUTOR
+        main.history_manager.save_history_bulk = original_bulk
+        main.app.dependency_overrides.pop(main.get_resume_agent, None)
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line.get("filename") for line in lines] == ["fast.pdf", "slow.pdf", None]
+    fast_start = next(started for content, started in executor.start_times.items() if "Fast Lane" in content)
+    print(f"⏱️ Fast resume analyzed {slow_done[0] - fast_start:.2f}s before the slow extraction finished")
+    assert fast_start < slow_done[0]
+    assert lines[-1]["succeeded"] == 2
+    print("✅ Analyses start as soon as each extraction finishes")
+
+def test_save_history_bulk_single_transaction():
+    """Test that every successful row is written in one commit"""
+    engine = create_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'history.db')}")
+    Base.metadata.create_all(engine, tables=[History.__table__])
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    commits = []
+    event.listen(session_factory, "after_commit", lambda session: commits.append(1))
+
+    original_session = history_manager_module.SessionLocal
+    history_manager_module.SessionLocal = session_factory
+    try:
+        records = [
+            {"user_id": 1, "agent_name": "Resume Analyzer", "summary_text": f"Score: {score}", "full_output": {"ats_score": score}}
+            for score in (70, 80, 90)
+        ]
+        ids = HistoryManager.save_history_bulk(records)
+        assert HistoryManager.save_history_bulk([]) == []
+    finally:
+        history_manager_module.SessionLocal = original_session
+
+    session = session_factory()
+    try:
+        rows = session.query(History).order_by(History.id).all()
+    finally:
+        session.close()
+    assert len(commits) == 1
+    assert ids == [row.id for row in rows] and len(rows) == 3
+    assert [json.loads(row.full_output)["ats_score"] for row in rows] == [70, 80, 90]
+    print("✅ Bulk history write used one transaction")
+
+if __name__ == "__main__":
+    test_concurrency_capped()
+    test_early_stop_cancels_outstanding()
+    test_endpoint_streams_one_line_per_resume()
+    test_analysis_starts_before_slowest_extraction()
+    test_save_history_bulk_single_transaction()
+    print("\n🎉 All resume batch tests passed!")
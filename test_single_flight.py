@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test script to verify single-flight coalescing of identical agent requests.
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from utils.single_flight import SingleFlight, canonical_key
+
+def test_identical_requests_share_one_call():
+    """Test that concurrent identical requests run the work once"""
+    async def run():
+        flight = SingleFlight("test")
+        calls = []
+
+        async def analyze():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"ats_score": 80, "professional_fixes": ["a"]}
+
+        key = canonical_key("resume", {"vibe": "Startup", "jd": "x"})
+        results = await asyncio.gather(*[flight.do(key, analyze) for _ in range(5)])
+        return flight, calls, results
+
+    flight, calls, results = asyncio.run(run())
+    stats = flight.stats()
+    print(f"📊 Stats: {stats}")
+    assert len(calls) == 1
+    assert all(result == {"ats_score": 80, "professional_fixes": ["a"]} for result in results)
+    # Each caller gets its own copy
+    assert results[0] is not results[1]
+    assert stats["coalesced"] == 4
+    assert stats["in_flight"] == 0
+    print("✅ Identical requests coalesced")
+
+def test_canonical_key_ignores_dict_order():
+    """Test that key order in request data does not change the key"""
+    assert canonical_key("route", {"a": 1, "b": 2}) == canonical_key("route", {"b": 2, "a": 1})
+    assert canonical_key("route", {"a": 1}) != canonical_key("route", {"a": 2})
+    print("✅ Canonical keys are order independent")
+
+if __name__ == "__main__":
+    test_identical_requests_share_one_call()
+    test_canonical_key_ignores_dict_order()
+    print("\n🎉 All single-flight tests passed!")
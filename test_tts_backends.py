@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the pluggable TTS backends (offline engine and process pool).
+"""
+
+import sys
+import os
+import io
+import wave
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from utils.tts_backends import OfflineTTSBackend, ProcessPoolTTSBackend, create_tts_backend
+
+def test_offline_engine_renders_wav():
+    """Test that the offline engine produces a deterministic WAV sized to the text"""
+    backend = OfflineTTSBackend()
+    short = backend.synthesize("Tell me about yourself.", "en", "com")
+    long = backend.synthesize("Tell me about a time you led a team through a difficult project.", "en", "com")
+    with wave.open(io.BytesIO(short)) as wav:
+        seconds = wav.getnframes() / wav.getframerate()
+    print(f"🔊 4 words -> {seconds:.2f}s of audio")
+    assert short == backend.synthesize("Tell me about yourself.", "en", "com")
+    assert len(long) > len(short)
+    assert abs(seconds - 4 * (OfflineTTSBackend.WORD_SECONDS + OfflineTTSBackend.GAP_SECONDS)) < 0.01
+    print("✅ Offline engine renders WAV")
+
+def test_process_pool_matches_in_process():
+    """Test that the process pool returns the same audio as in-process synthesis"""
+    backend = create_tts_backend("offline", process_workers=2)
+    assert isinstance(backend, ProcessPoolTTSBackend)
+    assert backend.name == "offline" and backend.media_type == "audio/wav"
+    try:
+        assert backend.synthesize("Why this role?", "en", "com") == OfflineTTSBackend().synthesize("Why this role?", "en", "com")
+    finally:
+        backend.shutdown()
+    print("✅ Process pool output matches")
+
+if __name__ == "__main__":
+    test_offline_engine_renders_wav()
+    test_process_pool_matches_in_process()
+    print("\n🎉 All TTS backend tests passed!")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the content-addressed TTS audio cache.
+A fake TTS backend counts syntheses, so no network calls are made.
+"""
+
+import sys
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+from utils.tts_cache import TTSCache, tts_cache_key
+from utils.audio_store import AudioStore
+from utils.tts_backends import TTSBackend
+
+calls = []
+
+class FakeBackend(TTSBackend):
+    name = "fake"
+
+    def synthesize(self, text, lang, voice):
+        calls.append(text)
+        return f"mp3:{lang}:{voice}:{text}".encode("utf-8")
+
+
+def make_store(audio_dir, max_bytes=10 ** 6, max_files=1000):
+    return AudioStore(audio_dir, max_bytes=max_bytes, max_files=max_files)
+
+def test_each_clip_synthesized_once():
+    """Test that repeated questions reuse one stable clip"""
+    calls.clear()
+    with tempfile.TemporaryDirectory() as audio_dir:
+        cache = TTSCache(make_store(audio_dir), memory_entries=2, backend=FakeBackend())
+        question = "Tell me about yourself."
+        first = cache.get_or_render(question)
+        urls = {cache.get_or_render(question) for _ in range(10)}
+        stats = cache.stats()
+
+        print(f"📊 Stats: {stats}")
+        assert urls == {first}
+        assert len(calls) == 1
+        assert cache.read(first) == b"mp3:en:com:Tell me about yourself."
+        assert stats["synthesis_avoided"] == 10
+        # A new cache over the same directory serves the clip from disk
+        assert TTSCache(make_store(audio_dir), backend=FakeBackend()).get_or_render(question) == first
+        assert len(calls) == 1
+    print("✅ Each clip synthesized once")
+
+def test_key_includes_language_and_voice():
+    """Test that the same text in another language, accent or engine is a different clip"""
+    key = tts_cache_key("Hello", "en", "com")
+    assert key == tts_cache_key("Hello ", "en", "com")
+    assert key != tts_cache_key("Hello", "fr", "com")
+    assert key != tts_cache_key("Hello", "en", "co.uk")
+    assert key != tts_cache_key("Hello", "en", "com", backend="offline")
+    print("✅ Language and voice are part of the key")
+
+def test_concurrent_requests_render_once():
+    """Test that concurrent misses for the same clip share one synthesis"""
+    calls.clear()
+    with tempfile.TemporaryDirectory() as audio_dir:
+        cache = TTSCache(make_store(audio_dir), backend=FakeBackend())
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            filenames = set(pool.map(lambda _: cache.get_or_render("Why this role?"), range(16)))
+        assert len(filenames) == 1
+        assert len(calls) == 1
+    print("✅ Concurrent misses rendered once")
+
+def test_background_render_returns_immediately():
+    """Test that the filename is returned before synthesis finishes and the clip appears later"""
+    calls.clear()
+    with tempfile.TemporaryDirectory() as audio_dir:
+        cache = TTSCache(make_store(audio_dir), backend=FakeBackend(), workers=2)
+        filename = cache.render_in_background("What motivates you?")
+        pending = cache.pending_render(filename)
+        assert cache.render_in_background("What motivates you?") == filename
+        if pending is not None:
+            pending.result(timeout=5)
+        assert cache.read(filename) == b"mp3:en:com:What motivates you?"
+        assert len(calls) == 1
+        assert cache.stats()["background_renders"] == 1
+        cache.shutdown()
+    print("✅ Background render completed")
+
+def test_background_hits_counted():
+    """Test that clips served through render_in_background count towards the hit rate"""
+    calls.clear()
+    released = threading.Event()
+
+    class GatedBackend(FakeBackend):
+        def synthesize(self, text, lang, voice):
+            released.wait(timeout=5)
+            return super().synthesize(text, lang, voice)
+
+    with tempfile.TemporaryDirectory() as audio_dir:
+        cache = TTSCache(make_store(audio_dir), backend=GatedBackend(), workers=1)
+        question = "Describe a difficult conversation with an employee."
+        filename = cache.render_in_background(question)
+        # Still rendering: the repeat request joins the pending render
+        assert cache.render_in_background(question) == filename
+        released.set()
+        cache.pending_render(filename).result(timeout=5)
+        for _ in range(5):
+            assert cache.render_in_background(question) == filename
+        stats = cache.stats()
+
+        # A cache that has not held the clip in memory finds it on disk
+        cold = TTSCache(make_store(audio_dir), backend=FakeBackend())
+        assert cold.render_in_background(question) == filename
+        cold_stats = cold.stats()
+        cache.shutdown()
+
+    print(f"📊 Stats: {stats}")
+    assert len(calls) == 1
+    assert stats["misses"] == 1 and stats["pending_hits"] == 1 and stats["memory_hits"] == 5
+    assert stats["synthesis_avoided"] == 6 and stats["hit_rate"] == round(6 / 7, 4)
+    assert cold_stats["disk_hits"] == 1 and cold_stats["hit_rate"] == 1.0
+    print("✅ Background hits counted")
+
+def test_evicted_clip_is_rendered_again():
+    """Test that a clip evicted by the audio store is synthesized again instead of going missing"""
+    calls.clear()
+    with tempfile.TemporaryDirectory() as audio_dir:
+        store = make_store(audio_dir, max_files=1)
+        cache = TTSCache(store, backend=FakeBackend())
+        first = cache.get_or_render("Question one?")
+        cache.get_or_render("Question two?")
+        store.sweep()
+        assert not store.exists(first)
+        assert cache.get_or_render("Question one?") == first
+        assert store.exists(first)
+        assert calls == ["Question one?", "Question two?", "Question one?"]
+    print("✅ Evicted clip rendered again")
+
+def test_prerendered_questions_need_no_tts():
+    """Test that every templated interview question is rendered up front and pinned"""
+    from agents.human_interview_questions import TEMPLATED_QUESTIONS, first_question, next_question
+    calls.clear()
+    with tempfile.TemporaryDirectory() as audio_dir:
+        store = make_store(audio_dir, max_files=1)
+        cache = TTSCache(store, backend=FakeBackend())
+        filenames = cache.prerender(TEMPLATED_QUESTIONS)
+        for filename in filenames.values():
+            pending = cache.pending_render(filename)
+            if pending is not None:
+                pending.result(timeout=5)
+        rendered = len(calls)
+
+        # Pinned clips survive a sweep even though the store is over its file budget
+        store.sweep()
+        assert all(store.exists(filename) for filename in filenames.values())
+
+        # Interview turns only ever ask templated questions, so nothing new is synthesized
+        for level in ("Beginner", "Intermediate", "Expert"):
+            cache.get_or_render(first_question(level))
+            for answer in ("not sure", "I led the team on a long-term strategy", "it was a problem"):
+                cache.get_or_render(next_question(level, answer))
+        assert rendered == len(set(TEMPLATED_QUESTIONS))
+        assert len(calls) == rendered
+        cache.shutdown()
+    print("✅ Templated questions pre-rendered")
+
+if __name__ == "__main__":
+    test_each_clip_synthesized_once()
+    test_key_includes_language_and_voice()
+    test_concurrent_requests_render_once()
+    test_background_render_returns_immediately()
+    test_background_hits_counted()
+    test_evicted_clip_is_rendered_again()
+    test_prerendered_questions_need_no_tts()
+    print("\n🎉 All TTS cache tests passed!")
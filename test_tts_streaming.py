@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test script to verify sentence-chunked TTS for long LLM-generated questions.
+A backend that "speaks" the text as bytes is used, so no network calls are made.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '.'))
+
+import asyncio
+import main
+from fastapi.testclient import TestClient
+from utils.audio_store import AudioStore
+from utils.tts_cache import TTSCache, split_sentences
+from utils.tts_backends import TTSBackend
+
+class EchoBackend(TTSBackend):
+    name = "echo"
+
+    def synthesize(self, text, lang, voice):
+        return f"[{text}]".encode("utf-8")
+
+tts_cache = TTSCache(
+    AudioStore(tempfile.mkdtemp(prefix="tts_streaming_"), max_bytes=10 ** 6, max_files=100),
+    backend=EchoBackend()
+)
+client = TestClient(main.app)
+
+QUESTION = ("Thanks, that was a thorough answer about onboarding. "
+            "Now imagine a manager asks you to bend a leave policy for a top performer. "
+            "How would you respond?")
+
+def test_split_sentences():
+    """Test sentence splitting and merging of short fragments"""
+    assert split_sentences("Great. Tell me about the last policy you rewrote and why.", 20) == [
+        "Great. Tell me about the last policy you rewrote and why."
+    ]
+    assert split_sentences(QUESTION, 40) == [
+        "Thanks, that was a thorough answer about onboarding.",
+        "Now imagine a manager asks you to bend a leave policy for a top performer. How would you respond?"
+    ]
+    assert split_sentences("Why HR?") == ["Why HR?"]
+    print("✅ Sentences split")
+
+def test_question_streams_sentence_by_sentence():
+    """Test that a long question is served as a progressive stream and a playlist"""
+    main.tts_cache = tts_cache
+    fields = asyncio.run(main.question_audio_fields(QUESTION))
+    print(f"📋 Audio fields: {fields}")
+    assert len(fields["audio_segments"]) == 2
+    assert fields["audio_url"].startswith("/audio/stream/")
+
+    streamed = client.get(fields["audio_url"])
+    assert streamed.status_code == 200
+    assert streamed.content == b"".join(EchoBackend().synthesize(s, "en", "com") for s in split_sentences(QUESTION))
+
+    playlist = client.get(fields["audio_playlist_url"])
+    assert playlist.status_code == 200
+    assert [line for line in playlist.text.splitlines() if line.startswith("/audio/")] == fields["audio_segments"]
+    for url in fields["audio_segments"]:
+        assert client.get(url).status_code == 200
+    print("✅ Question streamed sentence by sentence")
+
+def test_short_question_uses_single_clip():
+    """Test that a one-sentence question points straight at its clip"""
+    main.tts_cache = tts_cache
+    fields = asyncio.run(main.question_audio_fields("What does a good exit interview cover?"))
+    assert fields["audio_url"] == fields["audio_segments"][0]
+    assert client.get("/audio/stream/unknown").status_code == 404
+    print("✅ Short question uses a single clip")
+
+if __name__ == "__main__":
+    test_split_sentences()
+    test_question_streams_sentence_by_sentence()
+    test_short_question_uses_single_clip()
+    print("\n🎉 All TTS streaming tests passed!")
@@ -0,0 +1,346 @@
+import io
+import logging
+import shutil
+import subprocess
+import threading
+import time
+import wave
+from collections import deque
+from typing import BinaryIO, Iterable, Iterator, Tuple
+import numpy as np
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Samples per block read from the input; memory use is bounded by this, not the recording length
+BLOCK_FRAMES = 65536
+
+def _pcm_to_float(raw: bytes, sample_width: int, channels: int) -> np.ndarray:
+    # Little-endian PCM -> mono float32 in [-1, 1]
+    if sample_width == 1:
+        samples = (np.frombuffer(raw, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    elif sample_width == 2:
+        samples = np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
+    elif sample_width == 3:
+        triplets = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = triplets[:, 0] | (triplets[:, 1] << 8) | (triplets[:, 2] << 16)
+        values = np.where(values >= 1 << 23, values - (1 << 24), values)
+        samples = values.astype(np.float32) / float(1 << 23)
+    elif sample_width == 4:
+        samples = np.frombuffer(raw, dtype="<i4").astype(np.float32) / float(1 << 31)
+    else:
+        raise ValueError(f"Unsupported sample width: {sample_width} bytes")
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return samples
+
+def read_wav_blocks(source: BinaryIO, block_frames: int = BLOCK_FRAMES) -> Tuple[int, Iterator[np.ndarray]]:
+    """
+    Decode a PCM WAV stream block by block
+
+    Args:
+        source: Binary file object positioned at the start of the WAV data
+        block_frames: Frames per block
+
+    Returns:
+        (sample_rate, iterator of mono float32 blocks)
+    """
+    reader = wave.open(source, "rb")
+    sample_width = reader.getsampwidth()
+    channels = reader.getnchannels()
+
+    def blocks():
+        with reader:
+            while True:
+                raw = reader.readframes(block_frames)
+                if not raw:
+                    break
+                yield _pcm_to_float(raw, sample_width, channels)
+
+    return reader.getframerate(), blocks()
+
+def read_ffmpeg_blocks(source: BinaryIO, sample_rate: int, block_frames: int = BLOCK_FRAMES) -> Iterator[np.ndarray]:
+    """
+    Decode any container ffmpeg understands (webm/opus, mp3, m4a, ...) to mono float32 blocks
+
+    Requires ffmpeg on PATH. The input is fed to ffmpeg from a thread while its output is
+    read, so neither side is ever held in memory in full.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise ValueError("Only WAV audio can be decoded without ffmpeg installed")
+
+    process = subprocess.Popen(
+        [ffmpeg, "-loglevel", "error", "-i", "pipe:0", "-f", "s16le", "-ac", "1", "-ar", str(sample_rate), "pipe:1"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+
+    def feed():
+        try:
+            for chunk in iter(lambda: source.read(BLOCK_FRAMES), b""):
+                process.stdin.write(chunk)
+        except BrokenPipeError:
+            pass
+        finally:
+            process.stdin.close()
+
+    feeder = threading.Thread(target=feed, name="ffmpeg-feed", daemon=True)
+    feeder.start()
+    try:
+        while True:
+            raw = process.stdout.read(block_frames * 2)
+            if not raw:
+                break
+            if len(raw) % 2:
+                raw = raw[:-1]
+            yield _pcm_to_float(raw, 2, 1)
+    finally:
+        process.stdout.close()
+        process.wait()
+        feeder.join()
+
+class StreamingResampler:
+    """
+    Block-wise sample-rate converter with state carried between blocks.
+
+    Linear interpolation, preceded by a windowed-sinc low-pass filter when downsampling so
+    content above the new Nyquist frequency does not alias into the speech band. Output
+    positions are tracked with integer arithmetic, so the result does not depend on how
+    the input is split into blocks.
+    """
+
+    FILTER_TAPS = 63
+
+    def __init__(self, source_rate: int, target_rate: int):
+        self.source_rate = source_rate
+        self.target_rate = target_rate
+        self._emitted = 0   # output samples produced so far
+        self._offset = 0    # absolute input index of self._tail[0]
+        self._tail = np.zeros(0, dtype=np.float32)
+
+        self._taps = None
+        if source_rate > target_rate:
+            cutoff = 0.45 * target_rate / source_rate
+            n = np.arange(self.FILTER_TAPS) - (self.FILTER_TAPS - 1) / 2
+            taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.hamming(self.FILTER_TAPS)
+            self._taps = (taps / taps.sum()).astype(np.float32)
+            self._filter_state = np.zeros(self.FILTER_TAPS - 1, dtype=np.float32)
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        if self.source_rate == self.target_rate:
+            return block
+        if self._taps is not None:
+            padded = np.concatenate((self._filter_state, block))
+            self._filter_state = padded[-(self.FILTER_TAPS - 1):]
+            block = np.convolve(padded, self._taps, mode="valid").astype(np.float32)
+
+        buffer = np.concatenate((self._tail, block))
+        if len(buffer) < 2:
+            self._tail = buffer
+            return np.zeros(0, dtype=np.float32)
+
+        # Every output sample k sits at input position k * source / target; emit those
+        # that fall before the last buffered sample (which is needed to interpolate)
+        last = self._offset + len(buffer) - 1
+        end = -(-last * self.target_rate // self.source_rate)
+        k = np.arange(self._emitted, end, dtype=np.int64)
+        numerator = k * self.source_rate - self._offset * self.target_rate
+        index = numerator // self.target_rate
+        fraction = (numerator % self.target_rate).astype(np.float32) / self.target_rate
+        output = buffer[index] * (1 - fraction) + buffer[index + 1] * fraction
+
+        # Keep input from the next output sample's left neighbour on (it may lie past this block)
+        consumed = min(end * self.source_rate // self.target_rate - self._offset, len(buffer))
+        self._tail = buffer[consumed:]
+        self._offset += consumed
+        self._emitted = end
+        return output.astype(np.float32)
+
+def _db(power: np.ndarray) -> np.ndarray:
+    return 10 * np.log10(np.maximum(power, 1e-10))
+
+class SpeechPreprocessor:
+    """
+    Streaming cleanup of recorded answers before speech recognition.
+
+    Audio is resampled to a fixed rate and cut into short frames. For each frame:
+
+    - Frame energy is compared with an adaptive noise-floor estimate (voice activity
+      detection, with a short hangover so word endings are not clipped).
+    - Frames without speech are attenuated by the noise gate.
+    - Speech is brought to a target loudness by a slowly adapting gain, with a peak limit.
+    - Leading and trailing silence is dropped and long pauses are shortened to max_pause_ms.
+
+    Sample-level work is vectorized per block; only the per-frame state update runs in
+    Python (50 iterations per second of audio at 20 ms frames). State is carried between
+    blocks, so memory stays constant however long the recording is.
+    """
+
+    def __init__(self, sample_rate: int = 16000, frame_ms: int = 20, target_dbfs: float = -20.0,
+                 max_gain_db: float = 30.0, vad_margin_db: float = 9.0, vad_min_dbfs: float = -55.0,
+                 hangover_ms: int = 200, gate_attenuation_db: float = -30.0, max_pause_ms: int = 400,
+                 loudness_window_ms: int = 1500):
+        self.sample_rate = sample_rate
+        self.frame_len = sample_rate * frame_ms // 1000
+        self.target_dbfs = target_dbfs
+        self.max_gain_db = max_gain_db
+        self.vad_margin_db = vad_margin_db
+        self.vad_min_dbfs = vad_min_dbfs
+        self.hangover_frames = max(1, hangover_ms // frame_ms)
+        self.gate_gain = 10 ** (gate_attenuation_db / 20)
+        self.max_pause_frames = max_pause_ms // frame_ms
+        self.loudness_alpha = min(1.0, frame_ms / loudness_window_ms)
+        # Noise floor rises by at most this much per frame (about 3 dB per second)
+        self.floor_rise_db = 3.0 * frame_ms / 1000
+
+    def process(self, blocks: Iterable[np.ndarray], source_rate: int, stats: dict = None) -> Iterator[np.ndarray]:
+        """
+        Clean a stream of mono float32 blocks
+
+        Args:
+            blocks: Input blocks at source_rate
+            source_rate: Input sample rate
+            stats: Optional dict that is filled with input/output/speech durations
+
+        Yields:
+            Processed float32 blocks at self.sample_rate
+        """
+        resampler = StreamingResampler(source_rate, self.sample_rate)
+        frame_len = self.frame_len
+        remainder = np.zeros(0, dtype=np.float32)
+        ramp = np.linspace(0.0, 1.0, frame_len, dtype=np.float32)
+
+        noise_floor = None
+        speech_level = None
+        hangover = 0
+        gain = np.float32(self.gate_gain)
+        started = False
+        # Most recent non-speech frames; emitted only if speech resumes
+        pause = deque(maxlen=self.max_pause_frames)
+        frames_in = frames_out = speech_frames = 0
+
+        for block in blocks:
+            samples = np.concatenate((remainder, resampler.process(np.asarray(block, dtype=np.float32))))
+            count = len(samples) // frame_len
+            remainder = samples[count * frame_len:]
+            if count == 0:
+                continue
+            frames = samples[:count * frame_len].reshape(count, frame_len)
+            energy_db = _db(np.mean(frames * frames, axis=1))
+            peaks = np.max(np.abs(frames), axis=1)
+
+            # Per-frame state machine: voice activity, noise floor and gain (scalar work only)
+            gains = np.empty(count, dtype=np.float32)
+            speech = np.empty(count, dtype=bool)
+            for i, (level, peak) in enumerate(zip(energy_db.tolist(), peaks.tolist())):
+                if noise_floor is None or level < noise_floor:
+                    noise_floor = level
+                else:
+                    noise_floor = min(level, noise_floor + self.floor_rise_db)
+
+                if level > noise_floor + self.vad_margin_db and level > self.vad_min_dbfs:
+                    hangover = self.hangover_frames
+                    speech_level = level if speech_level is None else (
+                        speech_level + self.loudness_alpha * (level - speech_level))
+                elif hangover:
+                    hangover -= 1
+                speech[i] = hangover > 0
+
+                if speech_level is None:
+                    target_gain = 1.0
+                else:
+                    target_gain = 10 ** (min(self.target_dbfs - speech_level, self.max_gain_db) / 20)
+                if not speech[i]:
+                    target_gain *= self.gate_gain
+                # Limit the gain so the frame does not clip
+                gains[i] = min(target_gain, 0.99 / peak) if peak > 0 else target_gain
+
+            # Ramp each frame from the previous frame's gain to its own, avoiding clicks at gate transitions
+            starts = np.concatenate(([gain], gains[:-1]))
+            frames = frames * (starts[:, None] + (gains - starts)[:, None] * ramp[None, :])
+            gain = gains[-1]
+
+            output = []
+            for i in range(count):
+                if speech[i]:
+                    speech_frames += 1
+                    if started:
+                        output.extend(pause)
+                    pause.clear()
+                    started = True
+                    output.append(frames[i])
+                else:
+                    pause.append(frames[i])
+            frames_in += count
+            frames_out += len(output)
+            if output:
+                yield np.concatenate(output)
+
+        # Trailing silence is dropped with whatever is left in the pause buffer
+        if stats is not None:
+            frame_seconds = frame_len / self.sample_rate
+            stats.update({
+                "input_seconds": round(frames_in * frame_seconds, 3),
+                "output_seconds": round(frames_out * frame_seconds, 3),
+                "speech_seconds": round(speech_frames * frame_seconds, 3),
+                "sample_rate": self.sample_rate
+            })
+
+def write_wav(blocks: Iterable[np.ndarray], destination: BinaryIO, sample_rate: int):
+    """
+    Write float32 blocks as 16-bit mono PCM WAV
+    """
+    with wave.open(destination, "wb") as writer:
+        writer.setnchannels(1)
+        writer.setsampwidth(2)
+        writer.setframerate(sample_rate)
+        for block in blocks:
+            writer.writeframes((np.clip(block, -1.0, 1.0) * 32767).astype("<i2").tobytes())
+
+def create_preprocessor() -> SpeechPreprocessor:
+    return SpeechPreprocessor(
+        sample_rate=settings.AUDIO_PREPROCESS_SAMPLE_RATE,
+        target_dbfs=settings.AUDIO_PREPROCESS_TARGET_DBFS,
+        max_pause_ms=settings.AUDIO_PREPROCESS_MAX_PAUSE_MS
+    )
+
+def preprocess_stream(source: BinaryIO, destination: BinaryIO, preprocessor: SpeechPreprocessor = None) -> dict:
+    """
+    Clean a recorded answer from one file object into another (16-bit mono WAV)
+
+    WAV input is decoded natively; other formats go through ffmpeg when it is installed.
+
+    Returns:
+        Durations before and after processing, and the real-time factor
+    """
+    preprocessor = preprocessor or create_preprocessor()
+    start = time.perf_counter()
+
+    header = source.read(12)
+    source.seek(0)
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        source_rate, blocks = read_wav_blocks(source)
+    else:
+        source_rate, blocks = preprocessor.sample_rate, read_ffmpeg_blocks(source, preprocessor.sample_rate)
+
+    stats = {}
+    write_wav(preprocessor.process(blocks, source_rate, stats), destination, preprocessor.sample_rate)
+    stats["processing_seconds"] = round(time.perf_counter() - start, 4)
+    stats["real_time_factor"] = round(stats["processing_seconds"] / stats["input_seconds"], 5) if stats["input_seconds"] else 0.0
+    return stats
+
+def preprocess_audio(audio_data: bytes) -> bytes:
+    """
+    Clean a recorded answer held in memory
+
+    Args:
+        audio_data: WAV (or, with ffmpeg installed, any common audio format) bytes
+
+    Returns:
+        16-bit mono WAV at AUDIO_PREPROCESS_SAMPLE_RATE with silence trimmed
+    """
+    output = io.BytesIO()
+    stats = preprocess_stream(io.BytesIO(audio_data), output)
+    logger.info(f"Preprocessed {stats['input_seconds']}s of audio to {stats['output_seconds']}s "
+                f"(RTF {stats['real_time_factor']})")
+    return output.getvalue()
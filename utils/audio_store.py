@@ -0,0 +1,269 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+class AudioStore:
+    """
+    Size-bounded, hash-sharded storage for generated audio files.
+
+    Files live at <root>/<aa>/<bb>/<filename>, where aa/bb come from a hash of the
+    filename, so no directory grows beyond a few thousand entries. An in-memory index
+    tracks every file in least-recently-used order; a background sweeper evicts the
+    oldest files once the byte or file-count budget (or the optional maximum age) is
+    exceeded. Files left in the root directory by older versions are indexed too and
+    age out like any other file. Pinned files (e.g. pre-rendered interview questions)
+    are never evicted.
+
+    The files already on disk are indexed by the sweeper thread (or the first sweep),
+    not at startup. A lookup that misses the index checks the file's location on disk,
+    so files written by other workers, or not yet scanned, are found and indexed.
+    """
+
+    def __init__(self, root: str, max_bytes: int, max_files: int, max_age_seconds: int = 0,
+                 sweep_interval: float = 300):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.max_age_seconds = max_age_seconds
+        self.sweep_interval = sweep_interval
+        os.makedirs(root, exist_ok=True)
+
+        # filename -> (path, size, last_access), least recently used first
+        self._index = OrderedDict()
+        self._bytes = 0
+        self._pinned = set()
+        self._lock = threading.Lock()
+        self._scan_lock = threading.Lock()
+        self._scanned = False
+        self._sweeper = None
+        self._stop = threading.Event()
+        self._stats = {
+            "writes": 0,
+            "evicted": 0,
+            "evicted_bytes": 0,
+            "sweeps": 0
+        }
+
+    def path_for(self, filename: str) -> str:
+        """
+        Sharded location of a file
+        """
+        filename = os.path.basename(filename)
+        digest = hashlib.sha256(filename.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest[:2], digest[2:4], filename)
+
+    def _ensure_scanned(self):
+        if self._scanned:
+            return
+        with self._scan_lock:
+            if not self._scanned:
+                self._scan()
+
+    def _scan(self):
+        # Index the files on disk, oldest modification first; files already indexed by a
+        # write or lookup since startup are more recently used and keep their place
+        entries = []
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.endswith(".tmp"):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, filename, path, stat.st_size))
+        entries.sort(reverse=True)
+        with self._lock:
+            for mtime, filename, path, size in entries:
+                if filename in self._index:
+                    continue
+                self._index[filename] = (path, size, mtime)
+                self._index.move_to_end(filename, last=False)
+                self._bytes += size
+            self._scanned = True
+
+    def _locate(self, filename: str) -> Optional[str]:
+        filename = os.path.basename(filename)
+        with self._lock:
+            entry = self._index.get(filename)
+        if entry:
+            return entry[0]
+        if filename.endswith(".tmp"):
+            return None
+
+        # Not indexed yet: written by another worker, or not reached by the scan
+        for path in (self.path_for(filename), os.path.join(self.root, filename)):
+            try:
+                stat = os.stat(path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            with self._lock:
+                if filename not in self._index:
+                    self._index[filename] = (path, stat.st_size, time.time())
+                    self._bytes += stat.st_size
+            return path
+        return None
+
+    def exists(self, filename: str) -> bool:
+        return self._locate(filename) is not None
+
+    def touch(self, filename: str):
+        """
+        Mark a file as recently used so the sweeper keeps it
+        """
+        filename = os.path.basename(filename)
+        with self._lock:
+            entry = self._index.get(filename)
+            if entry is not None:
+                self._index[filename] = (entry[0], entry[1], time.time())
+                self._index.move_to_end(filename)
+
+    def pin(self, filename: str):
+        """
+        Exempt a file from eviction (it may be written later)
+        """
+        with self._lock:
+            self._pinned.add(os.path.basename(filename))
+
+    def write(self, filename: str, data: bytes) -> str:
+        """
+        Atomically store a file and return its path
+        """
+        filename = os.path.basename(filename)
+        path = self.path_for(filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary name first so readers never see a partial file
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            previous = self._index.pop(filename, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._index[filename] = (path, len(data), time.time())
+            self._bytes += len(data)
+            self._stats["writes"] += 1
+        return path
+
+    def read(self, filename: str) -> Optional[bytes]:
+        """
+        Return a file's bytes (marking it recently used), or None if it is not stored
+        """
+        path = self._locate(filename)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            self._drop(os.path.basename(filename))
+            return None
+        self.touch(filename)
+        return data
+
+    def _drop(self, filename: str):
+        with self._lock:
+            entry = self._index.pop(filename, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def sweep(self) -> int:
+        """
+        Evict least recently used files until the store is within budget
+
+        Returns:
+            Number of files evicted
+        """
+        # The budget covers every file on disk, so finish indexing before evicting anything
+        self._ensure_scanned()
+        cutoff = time.time() - self.max_age_seconds if self.max_age_seconds > 0 else None
+        victims = []
+        with self._lock:
+            for filename, (path, size, last_access) in list(self._index.items()):
+                over_budget = self._bytes > self.max_bytes or len(self._index) > self.max_files
+                expired = cutoff is not None and last_access < cutoff
+                if not (over_budget or expired):
+                    break
+                if filename in self._pinned:
+                    continue
+                del self._index[filename]
+                self._bytes -= size
+                victims.append((path, size))
+            self._stats["sweeps"] += 1
+
+        evicted_bytes = 0
+        for path, size in victims:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            evicted_bytes += size
+
+        if victims:
+            with self._lock:
+                self._stats["evicted"] += len(victims)
+                self._stats["evicted_bytes"] += evicted_bytes
+            logger.info(f"Audio store evicted {len(victims)} files ({evicted_bytes} bytes)")
+        return len(victims)
+
+    def start_sweeper(self):
+        """
+        Start the background sweeper thread (idempotent)
+        """
+        if self._sweeper is not None:
+            return
+        self._stop.clear()
+        self._sweeper = threading.Thread(target=self._sweep_loop, name="audio-store-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self):
+        self._stop.set()
+        self._sweeper = None
+
+    def _sweep_loop(self):
+        try:
+            self._ensure_scanned()
+        except Exception as e:
+            logger.error(f"Audio store scan failed: {str(e)}")
+        while not self._stop.wait(self.sweep_interval):
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.error(f"Audio store sweep failed: {str(e)}")
+
+    def stats(self) -> dict:
+        """
+        Report current usage against the configured budget
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["files"] = len(self._index)
+            stats["bytes"] = self._bytes
+            stats["pinned"] = len(self._pinned)
+            stats["scan_complete"] = self._scanned
+        stats["max_files"] = self.max_files
+        stats["max_bytes"] = self.max_bytes
+        stats["max_age_seconds"] = self.max_age_seconds
+        stats["bytes_used_ratio"] = round(stats["bytes"] / self.max_bytes, 4) if self.max_bytes else 0.0
+        stats["files_used_ratio"] = round(stats["files"] / self.max_files, 4) if self.max_files else 0.0
+        return stats
+
+# Create shared store instance
+audio_store = AudioStore(
+    settings.AUDIO_DIR,
+    max_bytes=settings.AUDIO_STORE_MAX_BYTES,
+    max_files=settings.AUDIO_STORE_MAX_FILES,
+    max_age_seconds=settings.AUDIO_STORE_MAX_AGE_SECONDS,
+    sweep_interval=settings.AUDIO_STORE_SWEEP_SECONDS
+)
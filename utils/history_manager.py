@@ -57,6 +57,48 @@ class HistoryManager:
         finally:
             db.close()
     
+    @staticmethod
+    def save_history_bulk(records: list):
+        """
+        Save many history records in a single transaction
+        
+        Args:
+            records: List of dicts with the save_history arguments
+                     (user_id, agent_name, summary_text, full_output, optional action_type)
+            
+        Returns:
+            List of history record IDs if successful, empty list otherwise
+        """
+        if not records:
+            return []
+        
+        db = SessionLocal()
+        try:
+            history_records = []
+            for record in records:
+                full_output = record["full_output"]
+                history_records.append(History(
+                    user_id=record["user_id"],
+                    session_id=str(uuid.uuid4()),
+                    agent_name=record["agent_name"],
+                    summary_text=record["summary_text"],
+                    full_output=full_output if isinstance(full_output, str) else json.dumps(full_output, indent=2),
+                    action_type=record.get("action_type", "analyze")
+                ))
+            
+            # Save to database
+            db.add_all(history_records)
+            db.commit()
+            
+            logger.info(f"Saved {len(history_records)} history records in bulk")
+            return [history_record.id for history_record in history_records]
+        except Exception as e:
+            logger.error(f"Error saving history records in bulk: {e}")
+            db.rollback()
+            return []
+        finally:
+            db.close()
+    
     @staticmethod
     def get_user_history(user_id: int, page: int = 1, limit: int = 20):
         """
@@ -0,0 +1,109 @@
+import hashlib
+from typing import Optional, Tuple
+from fastapi.responses import Response
+
+# Content-addressed clips never change under the same URL
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Other files may be replaced, so clients revalidate with the ETag
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+def strong_etag(data: bytes) -> str:
+    """
+    Strong ETag derived from the content hash
+    """
+    return '"' + hashlib.sha256(data).hexdigest()[:32] + '"'
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison, per RFC 7232)
+    """
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == bare:
+            return True
+    return False
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range "bytes=" Range header
+
+    Returns:
+        (start, end) inclusive, or None to serve the whole body (no header, or a form
+        we do not handle such as multiple ranges)
+
+    Raises:
+        ValueError: The range cannot be satisfied for a body of this size
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    start_text, separator, end_text = header[len("bytes="):].strip().partition("-")
+    valid = separator and (start_text or end_text) and all(
+        part == "" or part.isdigit() for part in (start_text, end_text)
+    )
+    if not valid:
+        # Malformed ranges are ignored (RFC 7233)
+        return None
+
+    if start_text == "":
+        # Suffix range: the last N bytes
+        length = int(end_text)
+        if length == 0 or size == 0:
+            raise ValueError("Range not satisfiable")
+        return max(size - length, 0), size - 1
+
+    start = int(start_text)
+    end = int(end_text) if end_text else size - 1
+    if end_text and end < start:
+        return None
+    if start >= size:
+        raise ValueError("Range not satisfiable")
+    return start, min(end, size - 1)
+
+def media_response(data: bytes, headers, media_type: str, immutable: bool = False) -> Response:
+    """
+    Serve an in-memory file with ETag revalidation and byte-range support
+
+    Args:
+        data: File contents
+        headers: Request headers (If-None-Match, If-Range, Range)
+        media_type: Content type of the file
+        immutable: Whether the URL is content-addressed and may be cached forever
+
+    Returns:
+        A 200, 206, 304 or 416 response
+    """
+    etag = strong_etag(data)
+    response_headers = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL
+    }
+
+    if etag_matches(headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=response_headers)
+
+    # A stale If-Range means the client's partial copy is outdated: send everything
+    range_header = headers.get("range")
+    if_range = headers.get("if-range")
+    if if_range and if_range.strip() != etag:
+        range_header = None
+
+    try:
+        byte_range = parse_range(range_header, len(data))
+    except ValueError:
+        response_headers["Content-Range"] = f"bytes */{len(data)}"
+        return Response(status_code=416, headers=response_headers)
+
+    if byte_range is None:
+        return Response(content=data, media_type=media_type, headers=response_headers)
+
+    start, end = byte_range
+    response_headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+    return Response(content=data[start:end + 1], status_code=206, media_type=media_type, headers=response_headers)
@@ -0,0 +1,113 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from fastapi.responses import Response
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Header added to responses that were served from the replay cache
+REPLAY_HEADER = "Idempotent-Replayed"
+
+class IdempotencyCache:
+    """
+    Replays stored responses for requests retried with the same Idempotency-Key.
+
+    Responses are kept per session in a bounded LRU (max_keys_per_session), and at most
+    max_sessions sessions are remembered. A retry that arrives while the original request
+    is still running waits for it instead of being rejected. Only 2xx responses are
+    stored, so a failed request can be retried for real.
+    """
+
+    def __init__(self, name: str, max_keys_per_session: int = 16, max_sessions: int = 10000):
+        self.name = name
+        self.max_keys_per_session = max_keys_per_session
+        self.max_sessions = max_sessions
+        # session_id -> OrderedDict(idempotency_key -> (status_code, body, media_type))
+        self._sessions = OrderedDict()
+        self._in_flight = {}
+        self._stats = {
+            "requests": 0,
+            "executed": 0,
+            "replayed": 0,
+            "joined_in_flight": 0
+        }
+
+    async def run(self, session_id: str, key: str, func) -> Response:
+        """
+        Run func() once per (session_id, key) and replay its response to retries
+
+        Args:
+            session_id: Session the request belongs to
+            key: Client-supplied Idempotency-Key
+            func: Zero-argument callable returning an awaitable Response
+
+        Returns:
+            The original response, or a replay of it marked with the Idempotent-Replayed header
+        """
+        self._stats["requests"] += 1
+        stored = self._lookup(session_id, key)
+        if stored is not None:
+            self._stats["replayed"] += 1
+            return self._replay(stored)
+
+        task = self._in_flight.get((session_id, key))
+        if task is not None:
+            self._stats["joined_in_flight"] += 1
+            logger.info(f"{self.name}: retry joined in-flight request for session {session_id}")
+            return self._replay(await asyncio.shield(task))
+
+        self._stats["executed"] += 1
+        task = asyncio.ensure_future(self._execute(session_id, key, func))
+        self._in_flight[(session_id, key)] = task
+        task.add_done_callback(lambda _: self._in_flight.pop((session_id, key), None))
+
+        # Shield the task so a client disconnect does not cancel work a retry is waiting for
+        status_code, body, media_type = await asyncio.shield(task)
+        return Response(content=body, status_code=status_code, media_type=media_type)
+
+    async def _execute(self, session_id: str, key: str, func):
+        response = await func()
+        snapshot = (response.status_code, response.body, response.media_type)
+        if 200 <= response.status_code < 300:
+            self._store(session_id, key, snapshot)
+        return snapshot
+
+    def _lookup(self, session_id: str, key: str):
+        responses = self._sessions.get(session_id)
+        if responses is None or key not in responses:
+            return None
+        self._sessions.move_to_end(session_id)
+        responses.move_to_end(key)
+        return responses[key]
+
+    def _store(self, session_id: str, key: str, snapshot: tuple):
+        responses = self._sessions.setdefault(session_id, OrderedDict())
+        self._sessions.move_to_end(session_id)
+        responses[key] = snapshot
+        while len(responses) > self.max_keys_per_session:
+            responses.popitem(last=False)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    @staticmethod
+    def _replay(snapshot: tuple) -> Response:
+        status_code, body, media_type = snapshot
+        return Response(content=body, status_code=status_code, media_type=media_type, headers={REPLAY_HEADER: "true"})
+
+    def stats(self) -> dict:
+        """
+        Report how many retries were answered from the replay cache
+        """
+        stats = dict(self._stats)
+        stats["sessions"] = len(self._sessions)
+        stats["stored_responses"] = sum(len(responses) for responses in self._sessions.values())
+        stats["in_flight"] = len(self._in_flight)
+        return stats
+
+# Create shared replay cache for interview answer submissions
+interview_answer_replays = IdempotencyCache(
+    "interview_answers",
+    max_keys_per_session=settings.IDEMPOTENCY_MAX_KEYS_PER_SESSION,
+    max_sessions=settings.IDEMPOTENCY_MAX_SESSIONS
+)
@@ -0,0 +1,146 @@
+import json
+
+class IncrementalJSONParser:
+    """
+    Parses a JSON object incrementally as LLM output arrives.
+
+    Text before the first "{" (markdown fences, preambles) and after the matching "}" is
+    ignored. feed() returns events for values that closed in the new text:
+
+        ("field", name, value)         a top-level field is complete
+        ("item", name, index, value)   an element of a top-level array field is complete
+
+    Elements of an array field are reported before the field itself.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self.done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        # Top-level key/value tracking
+        self._expecting = "key"
+        self._key_start = None
+        self._key = None
+        self._value_start = None
+        self._value_is_array = False
+        # Element tracking for the current top-level array
+        self._item_start = None
+        self._item_index = 0
+        self._object_start = None
+
+    def feed(self, text: str) -> list:
+        """
+        Consume the next piece of model output
+
+        Returns:
+            Events for every value completed by this text, in document order
+        """
+        self._buffer += text
+        events = []
+        while self._pos < len(self._buffer) and not self.done:
+            self._step(self._buffer[self._pos], self._pos, events)
+            # After the closing brace this leaves _pos just past it, for result()
+            self._pos += 1
+        return events
+
+    def result(self):
+        """
+        The fully parsed object, or None until the closing brace has been seen
+        """
+        if not self.done:
+            return None
+        return json.loads(self._buffer[self._object_start:self._pos])
+
+    def _step(self, char: str, i: int, events: list):
+        if not self._started:
+            if char == "{":
+                self._started = True
+                self._object_start = i
+                self._depth = 1
+            return
+
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._depth == 1 and self._expecting == "key":
+                    self._key = json.loads(self._buffer[self._key_start:i + 1])
+                    self._expecting = "colon"
+            return
+
+        if char.isspace():
+            return
+
+        # Note where values begin before structural characters change the depth
+        if self._depth == 1 and self._expecting == "value" and self._value_start is None:
+            self._value_start = i
+            self._value_is_array = char == "["
+        elif self._depth == 2 and self._value_is_array and self._item_start is None and char not in ",]":
+            self._item_start = i
+
+        if char == '"':
+            self._in_string = True
+            if self._depth == 1 and self._expecting == "key":
+                self._key_start = i
+        elif char == ":" and self._depth == 1 and self._expecting == "colon":
+            self._expecting = "value"
+            self._value_start = None
+        elif char in "{[":
+            self._depth += 1
+            if self._depth == 2 and self._value_is_array:
+                self._item_start = None
+                self._item_index = 0
+        elif char in "}]":
+            if self._depth == 2 and self._value_is_array and char == "]":
+                self._finish_item(i, events)
+            self._depth -= 1
+            if self._depth == 0:
+                self._finish_field(i, events)
+                self.done = True
+        elif char == ",":
+            if self._depth == 2 and self._value_is_array:
+                self._finish_item(i, events)
+            elif self._depth == 1:
+                self._finish_field(i, events)
+
+    def _finish_item(self, end: int, events: list):
+        if self._item_start is None:
+            return
+        try:
+            value = json.loads(self._buffer[self._item_start:end])
+        except ValueError:
+            pass
+        else:
+            events.append(("item", self._key, self._item_index, value))
+        self._item_index += 1
+        self._item_start = None
+
+    def _finish_field(self, end: int, events: list):
+        if self._value_start is not None and self._key is not None:
+            try:
+                value = json.loads(self._buffer[self._value_start:end])
+            except ValueError:
+                pass
+            else:
+                events.append(("field", self._key, value))
+        self._expecting = "key"
+        self._key = None
+        self._value_start = None
+        self._value_is_array = False
+
+def event_payload(event: tuple) -> tuple:
+    """
+    Convert a parser event into an (event_name, payload) pair suitable for SSE
+    """
+    if event[0] == "item":
+        _, name, index, value = event
+        return "item", {"field": name, "index": index, "value": value}
+    _, name, value = event
+    return "field", {"name": name, "value": value}
@@ -0,0 +1,59 @@
+import hashlib
+import json
+from config import settings
+from utils.tiered_cache import TieredCache
+
+def template_version(template: str) -> str:
+    """
+    Version a prompt template by hashing its text, so any edit invalidates old entries
+    """
+    return hashlib.sha256(template.encode("utf-8")).hexdigest()[:16]
+
+def make_cache_key(model_name: str, temperature: float, template: str, prompt: str) -> str:
+    """
+    Build the content-addressed cache key for an LLM call
+
+    Args:
+        model_name: Gemini model name
+        temperature: Sampling temperature
+        template: Unrendered prompt template text
+        prompt: Fully rendered prompt
+
+    Returns:
+        Hex SHA-256 digest of (model, temperature, template version, prompt)
+    """
+    payload = json.dumps(
+        [model_name, temperature, template_version(template), prompt],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class DisabledCache:
+    """Drop-in stand-in used when LLM_CACHE_ENABLED is off"""
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value):
+        pass
+
+    async def aget(self, key):
+        return None
+
+    async def aset(self, key, value):
+        pass
+
+    def stats(self):
+        return {"enabled": False}
+
+# Create shared cache instance
+if settings.LLM_CACHE_ENABLED:
+    llm_cache = TieredCache(
+        "llm_responses",
+        settings.LLM_CACHE_DB_PATH,
+        memory_entries=settings.LLM_CACHE_MEMORY_ENTRIES,
+        max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.LLM_CACHE_TTL_SECONDS
+    )
+else:
+    llm_cache = DisabledCache()
@@ -0,0 +1,266 @@
+import logging
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import List, Tuple, Union
+import fitz  # PyMuPDF
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+def page_ranges(page_count: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split pages into at most parts contiguous, near-equal (start, stop) ranges
+    """
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    ranges = []
+    start = 0
+    for index in range(parts):
+        stop = start + size + (1 if index < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+def _extract_range(shm_name: str, size: int, start: int, stop: int) -> List[str]:
+    # Runs in a worker: attach to the shared PDF bytes and extract the text of each page in one range
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        buffer = shm.buf[:size]
+        try:
+            with fitz.open(stream=buffer, filetype="pdf") as doc:
+                return [doc.load_page(number).get_text() for number in range(start, stop)]
+        finally:
+            buffer.release()
+    finally:
+        shm.close()
+
+def _warm_up(_) -> int:
+    # Importing this module in the worker loads PyMuPDF, which is most of the start-up cost
+    return os.getpid()
+
+class PDFExtractor:
+    """
+    Page-parallel PDF text extraction on a warm process pool.
+
+    Small documents are extracted in the calling thread. Larger ones are copied once
+    into shared memory, their pages are partitioned into contiguous ranges, and each
+    worker process opens the same buffer and extracts its range. Range texts are
+    joined in page order, so the result matches serial extraction exactly.
+    """
+
+    # Pages per range when extracting against a character budget
+    BUDGET_RANGE_PAGES = 8
+
+    def __init__(self, workers: int = 0, min_pages: int = 32, ranges_per_worker: int = 2):
+        self.workers = workers or os.cpu_count() or 1
+        self.min_pages = min_pages
+        self.ranges_per_worker = ranges_per_worker
+        self._pool = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "documents": 0,
+            "parallel_documents": 0,
+            "pages": 0,
+            "pages_skipped": 0,
+            "budget_stops": 0,
+            "pool_failures": 0
+        }
+
+    @property
+    def parallel(self) -> bool:
+        return self.workers > 1
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        # Spawn rather than fork: the server process has live threads
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def warm_up(self):
+        """
+        Start every worker process now, so the first large upload does not pay for it
+        """
+        if self.parallel:
+            list(self.pool.map(_warm_up, range(self.workers)))
+
+    def extract(self, buffer: Union[bytes, memoryview]) -> str:
+        """
+        Extract the text of every page, in order
+
+        Args:
+            buffer: PDF bytes, or a memoryview over them
+
+        Returns:
+            Text of all pages joined in page order
+        """
+        return self.extract_with_budget(buffer)[0]
+
+    def extract_with_budget(self, buffer: Union[bytes, memoryview], max_chars: int = 0) -> Tuple[str, dict]:
+        """
+        Extract page text in order, stopping once max_chars characters have been collected
+
+        Pages after the budget is met are never loaded, so extraction time is bounded by
+        the budget rather than by the document length.
+
+        Args:
+            buffer: PDF bytes, or a memoryview over them
+            max_chars: Character budget (0 extracts everything); about 4 characters per token
+
+        Returns:
+            (text of at most max_chars characters, report with pages_total,
+            pages_processed, pages_skipped and truncated)
+        """
+        pages, report = self.extract_pages(buffer, max_chars)
+        return "".join(pages), report
+
+    def extract_pages(self, buffer: Union[bytes, memoryview], max_chars: int = 0) -> Tuple[List[str], dict]:
+        """
+        Same as extract_with_budget, but keeps the text of each page separate
+
+        Returns:
+            (page texts totalling at most max_chars characters, extraction report)
+        """
+        with fitz.open(stream=buffer, filetype="pdf") as doc:
+            page_count = len(doc)
+            if not self.parallel or page_count < self.min_pages:
+                pages, processed = self._extract_serial(doc, max_chars)
+                self._count(processed, parallel=False)
+                return self._finish(pages, page_count, processed, max_chars)
+
+        try:
+            pages, processed = self._extract_parallel(buffer, page_count, max_chars)
+        except Exception as e:
+            # A dead pool or an error inside a worker: the calling thread can still do the job
+            logger.error(f"PDF extraction pool failed, extracting in process: {str(e)}")
+            with self._lock:
+                self._stats["pool_failures"] += 1
+                if isinstance(e, BrokenProcessPool):
+                    self._pool = None
+            with fitz.open(stream=buffer, filetype="pdf") as doc:
+                pages, processed = self._extract_serial(doc, max_chars)
+            self._count(processed, parallel=False)
+            return self._finish(pages, page_count, processed, max_chars)
+        self._count(processed, parallel=True)
+        return self._finish(pages, page_count, processed, max_chars)
+
+    @staticmethod
+    def _extract_serial(doc, max_chars: int) -> Tuple[List[str], int]:
+        pages = []
+        collected = 0
+        for page in doc:
+            if max_chars and collected >= max_chars:
+                break
+            text = page.get_text()
+            pages.append(text)
+            collected += len(text)
+        return pages, len(pages)
+
+    def _extract_parallel(self, buffer: Union[bytes, memoryview], page_count: int, max_chars: int) -> Tuple[List[str], int]:
+        if max_chars:
+            # Small ranges, at most one per worker in flight, so little work is wasted past the budget
+            ranges = [(start, min(start + self.BUDGET_RANGE_PAGES, page_count))
+                      for start in range(0, page_count, self.BUDGET_RANGE_PAGES)]
+            in_flight = self.workers
+        else:
+            ranges = page_ranges(page_count, self.workers * self.ranges_per_worker)
+            in_flight = len(ranges)
+
+        size = len(buffer)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        pending = deque()
+        try:
+            shm.buf[:size] = buffer
+            remaining = iter(ranges)
+            for start, stop in remaining:
+                pending.append((stop, self.pool.submit(_extract_range, shm.name, size, start, stop)))
+                if len(pending) >= in_flight:
+                    break
+
+            pages = []
+            collected = 0
+            processed = 0
+            while pending:
+                stop, future = pending.popleft()
+                texts = future.result()
+                pages.extend(texts)
+                collected += sum(len(text) for text in texts)
+                processed = stop
+                if max_chars and collected >= max_chars:
+                    break
+                for start, next_stop in remaining:
+                    pending.append((next_stop, self.pool.submit(_extract_range, shm.name, size, start, next_stop)))
+                    break
+            return pages, processed
+        finally:
+            # Ranges past the budget are dropped; wait for running ones before freeing the buffer
+            for _, future in pending:
+                future.cancel()
+            for _, future in pending:
+                if not future.cancelled():
+                    try:
+                        future.result()
+                    except Exception:
+                        pass
+            shm.close()
+            shm.unlink()
+
+    def _finish(self, pages: List[str], page_count: int, processed: int, max_chars: int) -> Tuple[List[str], dict]:
+        if processed < page_count:
+            with self._lock:
+                self._stats["pages_skipped"] += page_count - processed
+                self._stats["budget_stops"] += 1
+        excess = sum(len(text) for text in pages) - max_chars if max_chars else 0
+        truncated = excess > 0
+        while excess > 0:
+            # A pooled range can overshoot by several pages: their text is dropped, but they were processed
+            cut = min(excess, len(pages[-1]))
+            if cut == len(pages[-1]):
+                pages.pop()
+            else:
+                pages[-1] = pages[-1][:-cut]
+            excess -= cut
+        return pages, {
+            "pages_total": page_count,
+            "pages_processed": processed,
+            "pages_skipped": page_count - processed,
+            "truncated": truncated or processed < page_count
+        }
+
+    def _count(self, pages: int, parallel: bool):
+        with self._lock:
+            self._stats["documents"] += 1
+            self._stats["pages"] += pages
+            if parallel:
+                self._stats["parallel_documents"] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["workers"] = self.workers
+        stats["min_pages"] = self.min_pages
+        return stats
+
+    def shutdown(self):
+        """
+        Stop the worker processes (used on application shutdown)
+        """
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+
+# Create shared extractor instance
+pdf_extractor = PDFExtractor(
+    workers=settings.PDF_EXTRACT_WORKERS,
+    min_pages=settings.PDF_PARALLEL_MIN_PAGES
+)
@@ -0,0 +1,209 @@
+import json
+import logging
+import mmap
+from typing import Iterable, Tuple, Union
+from fastapi import UploadFile
+from starlette.responses import JSONResponse
+from config import settings
+from utils.pdf_extraction import pdf_extractor
+from utils.pdf_normalization import normalize_pages
+from utils.pdf_text_cache import content_hash, make_extraction_key, pdf_text_cache
+
+logger = logging.getLogger(__name__)
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the configured maximum size"""
+
+def extract_pdf_text(buffer: Union[bytes, memoryview], max_chars: int = 0) -> Tuple[str, dict]:
+    """
+    Extract text from an in-memory PDF with PyMuPDF, ready for a prompt
+
+    Large documents are split by page across the extraction process pool. Repeated
+    headers, footers, page numbers and extra whitespace are then removed from the
+    page texts (PDF_NORMALIZE_TEXT).
+
+    Args:
+        buffer: PDF bytes, or a memoryview over them (opened in place, without copying)
+        max_chars: Character budget for extraction (0 extracts every page)
+
+    Returns:
+        (text of the pages in order, extraction report)
+    """
+    pages, report = pdf_extractor.extract_pages(buffer, max_chars)
+    if not settings.PDF_NORMALIZE_TEXT:
+        return "".join(pages), report
+    text, report["normalization"] = normalize_pages(pages, min_repeat_ratio=settings.PDF_REPEATED_LINE_MIN_RATIO)
+    return text, report
+
+class PDFUpload:
+    """
+    A size-checked PDF upload, readable in place.
+
+    Uploads up to the spool threshold are read into memory once. Larger uploads are
+    already spooled to disk by the multipart parser; they are memory-mapped instead of
+    read, so the PDF is opened straight from the page cache with no copy in the Python
+    heap and no extra temporary file. The mapping stays valid after the upload itself
+    is closed, so a PDFUpload may outlive its request handler (e.g. in a streamed batch).
+
+    Extracted text is normalized (repeated headers, footers, page numbers and
+    whitespace removed) and cached by the upload's SHA-256, so re-uploading the same
+    file (e.g. while tweaking the job description) skips parsing entirely.
+    """
+
+    def __init__(self, buffer: Union[bytes, memoryview], size: int, spooled: bool, mapping: mmap.mmap = None):
+        self.buffer = buffer
+        self.size = size
+        self.spooled = spooled
+        self._mapping = mapping
+        self._sha256 = None
+
+    @property
+    def sha256(self) -> str:
+        if self._sha256 is None:
+            self._sha256 = content_hash(self.buffer)
+        return self._sha256
+
+    def extract_text(self) -> str:
+        """
+        Text of the PDF, from the extraction cache when this content was seen before
+        """
+        return self.extract()[0]
+
+    def extract(self, max_chars: int = 0) -> Tuple[str, dict]:
+        """
+        Extract at most max_chars characters, loading only the pages needed to fill them
+
+        Args:
+            max_chars: Character budget (0 extracts the whole document)
+
+        Returns:
+            (text, report with pages_total, pages_processed, pages_skipped and truncated,
+            plus the normalization savings when PDF_NORMALIZE_TEXT is on)
+        """
+        key = make_extraction_key(self.sha256, max_chars=max_chars)
+        cached = pdf_text_cache.get(key)
+        if cached is not None:
+            entry = json.loads(cached)
+            return entry["text"], entry["report"]
+
+        text, report = extract_pdf_text(self.buffer, max_chars)
+        pdf_text_cache.set(key, json.dumps({"text": text, "report": report}))
+        return text, report
+
+    def close(self):
+        """
+        Release the memory mapping (the buffer must not be used afterwards)
+        """
+        if self._mapping is not None:
+            self.buffer.release()
+            self._mapping.close()
+            self._mapping = None
+        self.buffer = b""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+async def receive_pdf_upload(upload: UploadFile, max_bytes: int = None, spool_threshold: int = None) -> PDFUpload:
+    """
+    Take a PDF upload for extraction without temporary files or duplicate copies
+
+    Args:
+        upload: The uploaded file
+        max_bytes: Largest accepted upload (defaults to UPLOAD_MAX_BYTES)
+        spool_threshold: Uploads above this size are mapped from disk rather than read
+            into memory (defaults to UPLOAD_SPOOL_THRESHOLD_BYTES)
+
+    Returns:
+        The upload, ready for extract_text()
+
+    Raises:
+        UploadTooLargeError: The upload is larger than max_bytes
+    """
+    max_bytes = max_bytes or settings.UPLOAD_MAX_BYTES
+    spool_threshold = settings.UPLOAD_SPOOL_THRESHOLD_BYTES if spool_threshold is None else spool_threshold
+
+    source = upload.file
+    size = source.seek(0, 2)
+    source.seek(0)
+    if size > max_bytes:
+        raise UploadTooLargeError(f"File is larger than the {max_bytes // (1024 * 1024)} MB limit")
+    if size == 0:
+        return PDFUpload(b"", 0, spooled=False)
+
+    if size <= spool_threshold:
+        return PDFUpload(await upload.read(), size, spooled=False)
+
+    # fileno() moves an in-memory spool to disk if the parser had not done so already
+    mapping = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    return PDFUpload(memoryview(mapping), size, spooled=True, mapping=mapping)
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject request bodies over a size limit while they are still being received.
+
+    Requests that declare a larger Content-Length are refused before any of the body is
+    read; otherwise the body is counted as it streams in, and the request is stopped
+    with 413 as soon as the limit is crossed, so an oversized upload is never spooled
+    in full.
+
+    Args:
+        limits: (path prefix, max bytes) pairs; the first matching prefix applies
+    """
+
+    def __init__(self, app, limits: Iterable[Tuple[str, int]]):
+        self.app = app
+        self.limits = list(limits)
+
+    def _limit_for(self, path: str):
+        for prefix, max_bytes in self.limits:
+            if path.startswith(prefix):
+                return max_bytes
+        return None
+
+    async def __call__(self, scope, receive, send):
+        max_bytes = self._limit_for(scope["path"]) if scope["type"] == "http" else None
+        if max_bytes is None:
+            await self.app(scope, receive, send)
+            return
+
+        too_large = JSONResponse(
+            status_code=413,
+            content={"detail": f"Upload is larger than the {max_bytes // (1024 * 1024)} MB limit"}
+        )
+        headers = dict(scope.get("headers") or [])
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > max_bytes:
+            await too_large(scope, receive, send)
+            return
+
+        received = 0
+        exceeded = False
+
+        async def limited_receive():
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_bytes:
+                    exceeded = True
+                    raise UploadTooLargeError("Request body exceeds the upload limit")
+            return message
+
+        async def guarded_send(message):
+            # Whatever the app answers after the limit was hit is replaced by the 413
+            if not exceeded:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except UploadTooLargeError:
+            pass
+        except Exception:
+            if not exceeded:
+                raise
+        if exceeded:
+            logger.warning(f"Rejected upload to {scope['path']} over {max_bytes} bytes")
+            await too_large(scope, receive, send)
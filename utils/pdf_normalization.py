@@ -0,0 +1,128 @@
+import re
+from collections import Counter
+from typing import List, Tuple
+
+# Rough characters-per-token ratio for Gemini on English prose (used for reporting only)
+CHARS_PER_TOKEN = 4
+
+# Runs of spaces, tabs and other horizontal whitespace inside a line
+HORIZONTAL_SPACE_PATTERN = re.compile(r"[^\S\n]+")
+
+# Stand-alone page numbers: "7", "- 7 -", "Page 7", "Page 7 of 12", "7/12", "p. 7"
+PAGE_NUMBER_PATTERN = re.compile(
+    r"^[\-–—\s]*(?:(?:page|pg\.?|p\.)\s*)?(\d{1,4})(?:\s*(?:of|/)\s*\d{1,4})?[\-–—\s]*$",
+    re.IGNORECASE
+)
+
+# Blank fill-in lines left by signature and initials boxes: "______", "Initials: ____", "Date: ......"
+SIGNATURE_LINE_PATTERN = re.compile(r"(?:_{3,}|\.{5,})")
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate Gemini token count of text
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+def _line_signature(line: str, page_number: int) -> str:
+    # The page's own number at either end of a line ("Acme Corp | 4", "Page 4 - Confidential")
+    # and blank lengths must not stop a footer from matching itself; other numbers must,
+    # or numbered headings ("Clause 4: Notice") would look repeated
+    line = SIGNATURE_LINE_PATTERN.sub("_", line)
+    return re.sub(
+        rf"^((?i:page)\s*)?{page_number}(?!\d)|(?<!\d){page_number}$", "#", line
+    ).lower()
+
+def _page_number_offset(line: str, page_number: int):
+    # How far a stand-alone number is from the page's position (0 when they match),
+    # or None when the line is not a stand-alone number
+    match = PAGE_NUMBER_PATTERN.match(line)
+    return int(match.group(1)) - page_number if match else None
+
+def _edge_indexes(lines: List[str], edge_lines: int) -> set:
+    # Positions of the first and last edge_lines non-blank lines of a page
+    content = [index for index, line in enumerate(lines) if line]
+    return set(content[:edge_lines] + content[-edge_lines:])
+
+def normalize_pages(pages: List[str], edge_lines: int = 3, min_repeat_ratio: float = 0.5) -> Tuple[str, dict]:
+    """
+    Join extracted page texts, dropping page furniture and collapsing whitespace
+
+    Only lines within edge_lines of the top or bottom of a page are candidates, so body
+    text is never removed. An edge line is a running header or footer (including
+    repeated signature or initials lines) when the same line, ignoring the page's own
+    number at either end, sits at the edge of at least min_repeat_ratio of the pages and of at least 3 pages. Its first
+    occurrence is kept, since a running header often carries the document title; later
+    ones are dropped. A stand-alone number at a page edge is dropped only when it is
+    that page's number or keeps a constant offset from the page position on as many
+    pages, so a year or an amount closing a page is kept. Whitespace inside
+    lines is collapsed to single spaces and blank lines to one, so clause and paragraph
+    breaks survive.
+
+    Args:
+        pages: Text of each page, in order
+        edge_lines: Lines at the top and bottom of each page checked for repetition
+        min_repeat_ratio: Share of pages a line must appear on to count as repeated
+
+    Returns:
+        (normalized text, report with character and estimated token savings)
+    """
+    page_lines = [
+        [HORIZONTAL_SPACE_PATTERN.sub(" ", line).strip() for line in page.splitlines()]
+        for page in pages
+    ]
+
+    page_edges = [_edge_indexes(lines, edge_lines) for lines in page_lines]
+    edge_counts = Counter()
+    offset_counts = Counter()
+    for page_number, (lines, edges) in enumerate(zip(page_lines, page_edges), 1):
+        edge_counts.update({_line_signature(lines[index], page_number) for index in edges})
+        offset_counts.update({_page_number_offset(lines[index], page_number) for index in edges} - {None})
+    min_pages = max(3, int(len(pages) * min_repeat_ratio + 0.5))
+    repeated = {signature for signature, count in edge_counts.items() if count >= min_pages}
+    # Numbering that starts after a cover page or continues from an earlier volume
+    # runs at a constant offset from the page position
+    page_offsets = {0} | {offset for offset, count in offset_counts.items() if count >= min_pages}
+
+    seen = set()
+    output = []
+    removed = Counter()
+    for page_number, (lines, edges) in enumerate(zip(page_lines, page_edges), 1):
+        for index, line in enumerate(lines):
+            if not line:
+                if output and output[-1]:
+                    output.append("")
+                continue
+            if index not in edges:
+                output.append(line)
+                continue
+            if _page_number_offset(line, page_number) in page_offsets:
+                removed["page_numbers"] += 1
+                continue
+            signature = _line_signature(line, page_number)
+            if signature in repeated:
+                if signature in seen:
+                    kind = "signature_lines" if SIGNATURE_LINE_PATTERN.search(line) else "repeated_lines"
+                    removed[kind] += 1
+                    continue
+                seen.add(signature)
+            output.append(line)
+
+    while output and not output[-1]:
+        output.pop()
+    text = "\n".join(output)
+
+    raw_chars = sum(len(page) for page in pages)
+    raw_tokens = (raw_chars + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+    tokens = estimate_tokens(text)
+    return text, {
+        "chars_before": raw_chars,
+        "chars_after": len(text),
+        "chars_saved": raw_chars - len(text),
+        "tokens_before": raw_tokens,
+        "tokens_after": tokens,
+        "tokens_saved": raw_tokens - tokens,
+        "saved_percent": round(100 * (raw_chars - len(text)) / raw_chars, 1) if raw_chars else 0.0,
+        "repeated_lines_removed": removed["repeated_lines"],
+        "page_numbers_removed": removed["page_numbers"],
+        "signature_lines_removed": removed["signature_lines"]
+    }
@@ -0,0 +1,45 @@
+import hashlib
+from typing import Union
+import fitz  # PyMuPDF
+from config import settings
+from utils.llm_cache import DisabledCache
+from utils.tiered_cache import TieredCache
+
+# Bump the suffix whenever extraction output changes (e.g. new normalization rules);
+# the PyMuPDF version is included because its text output can differ between releases
+EXTRACTOR_VERSION = f"pymupdf-{fitz.VersionBind}:4" + (
+    f":normalized-{settings.PDF_REPEATED_LINE_MIN_RATIO}" if settings.PDF_NORMALIZE_TEXT else ""
+)
+
+def content_hash(buffer: Union[bytes, memoryview]) -> str:
+    """
+    SHA-256 of an upload, hashed in place (memoryviews are not copied)
+    """
+    return hashlib.sha256(buffer).hexdigest()
+
+def make_extraction_key(digest: str, extractor_version: str = EXTRACTOR_VERSION, max_chars: int = 0) -> str:
+    """
+    Cache key for the extracted text of one upload
+
+    Args:
+        digest: Hex SHA-256 of the upload bytes
+        extractor_version: Version of the extraction pipeline that produced the text
+        max_chars: Character budget the text was extracted under (0 for the full text)
+
+    Returns:
+        Key combining extractor version, content hash and budget
+    """
+    key = f"{extractor_version}:{digest}"
+    return f"{key}:{max_chars}" if max_chars else key
+
+# Create shared cache instance
+if settings.PDF_TEXT_CACHE_ENABLED:
+    pdf_text_cache = TieredCache(
+        "pdf_text",
+        settings.PDF_TEXT_CACHE_DB_PATH,
+        memory_entries=settings.PDF_TEXT_CACHE_MEMORY_ENTRIES,
+        max_entries=settings.PDF_TEXT_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.PDF_TEXT_CACHE_TTL_SECONDS
+    )
+else:
+    pdf_text_cache = DisabledCache()
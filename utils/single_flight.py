@@ -0,0 +1,70 @@
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+def canonical_key(*parts) -> str:
+    """
+    Build a stable key for a request from its inputs (dict key order does not matter)
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class SingleFlight:
+    """
+    Collapses concurrent identical requests into one execution.
+
+    The first caller for a key starts the work; callers that arrive with the same key
+    while it is still running await the same result instead of starting their own.
+    Each caller receives its own deep copy of the result.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight = {}
+        self._stats = {
+            "requests": 0,
+            "executions": 0,
+            "coalesced": 0
+        }
+
+    async def do(self, key: str, func):
+        """
+        Run func() once per key among concurrent callers
+
+        Args:
+            key: Canonical request key (see canonical_key)
+            func: Zero-argument callable returning an awaitable
+
+        Returns:
+            The shared result
+        """
+        self._stats["requests"] += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            self._stats["executions"] += 1
+            task = asyncio.ensure_future(func())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self._stats["coalesced"] += 1
+            logger.info(f"{self.name}: coalesced duplicate request {key[:12]}")
+
+        # Shield the shared task so one caller disconnecting does not cancel it for the others
+        result = await asyncio.shield(task)
+        return copy.deepcopy(result)
+
+    def stats(self) -> dict:
+        """
+        Report how many requests were collapsed into an existing call
+        """
+        stats = dict(self._stats)
+        stats["in_flight"] = len(self._in_flight)
+        stats["coalesce_rate"] = round(stats["coalesced"] / stats["requests"], 4) if stats["requests"] else 0.0
+        return stats
+
+# Create shared instance for agent requests
+agent_request_flight = SingleFlight("agent_requests")
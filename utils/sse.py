@@ -0,0 +1,21 @@
+import json
+
+def format_sse(event: str, data) -> str:
+    """
+    Format one Server-Sent Events message
+
+    Args:
+        event: Event name (e.g., "progress", "chunk", "done", "error")
+        data: JSON-serializable payload
+
+    Returns:
+        The wire-format message, terminated by a blank line
+    """
+    # json.dumps never emits raw newlines, so the payload always fits on one data line
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+# Headers that stop proxies from buffering the stream
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no"
+}
@@ -0,0 +1,234 @@
+import asyncio
+import sqlite3
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+class TieredCache:
+    """
+    Two-tier string cache: an in-process LRU in front of a SQLite table.
+
+    The SQLite file can be shared by several uvicorn workers. Entries expire after
+    ttl_seconds and the table is trimmed to max_entries (least recently used first).
+
+    aget() and aset() are the variants for async code: memory hits are answered on the
+    event loop, SQLite reads, writes and sweeps run in a worker thread.
+    """
+
+    # Run a size/TTL sweep of the SQLite tier every this many writes
+    SWEEP_EVERY = 100
+
+    def __init__(self, name: str, db_path: str, memory_entries: int = 256,
+                 max_entries: int = 10000, ttl_seconds: int = 7 * 24 * 3600):
+        self.name = name
+        self.db_path = db_path
+        self.memory_entries = memory_entries
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._writes = 0
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "expired": 0,
+            "evicted": 0
+        }
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per thread; sqlite3 connections are not thread-safe
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_db(self):
+        conn = self._connect()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "cache_name TEXT NOT NULL, "
+            "cache_key TEXT NOT NULL, "
+            "value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL, "
+            "PRIMARY KEY (cache_name, cache_key))"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_cache_entries_accessed "
+            "ON cache_entries (cache_name, accessed_at)"
+        )
+        conn.commit()
+
+    def _remember(self, key: str, value: str, created_at: float):
+        with self._lock:
+            self._memory[key] = (value, created_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look a key up in memory, then in SQLite
+
+        Returns:
+            The cached value, or None on a miss or an expired entry
+        """
+        value = self._get_memory(key)
+        if value is None:
+            value = self._get_disk(key)
+        return value
+
+    async def aget(self, key: str) -> Optional[str]:
+        """
+        Non-blocking variant of get for use on the event loop
+        """
+        value = self._get_memory(key)
+        if value is None:
+            value = await asyncio.to_thread(self._get_disk, key)
+        return value
+
+    def _get_memory(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, created_at = entry
+                if now - created_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+                self._stats["expired"] += 1
+        return None
+
+    def _get_disk(self, key: str) -> Optional[str]:
+        now = time.time()
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, created_at FROM cache_entries WHERE cache_name = ? AND cache_key = ?",
+                (self.name, key)
+            ).fetchone()
+            if row is not None:
+                value, created_at = row
+                if now - created_at <= self.ttl_seconds:
+                    conn.execute(
+                        "UPDATE cache_entries SET accessed_at = ? WHERE cache_name = ? AND cache_key = ?",
+                        (now, self.name, key)
+                    )
+                    conn.commit()
+                    self._remember(key, value, created_at)
+                    with self._lock:
+                        self._stats["disk_hits"] += 1
+                    return value
+                conn.execute(
+                    "DELETE FROM cache_entries WHERE cache_name = ? AND cache_key = ?",
+                    (self.name, key)
+                )
+                conn.commit()
+                with self._lock:
+                    self._stats["expired"] += 1
+        except sqlite3.Error as e:
+            logger.warning(f"{self.name} cache read failed: {e}")
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def set(self, key: str, value: str):
+        """
+        Store a value in both tiers
+        """
+        now = time.time()
+        self._remember(key, value, now)
+        self._set_disk(key, value, now)
+
+    async def aset(self, key: str, value: str):
+        """
+        Non-blocking variant of set for use on the event loop
+        """
+        now = time.time()
+        self._remember(key, value, now)
+        await asyncio.to_thread(self._set_disk, key, value, now)
+
+    def _set_disk(self, key: str, value: str, now: float):
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (cache_name, cache_key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.name, key, value, now, now)
+            )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"{self.name} cache write failed: {e}")
+            return
+
+        with self._lock:
+            self._stats["writes"] += 1
+            self._writes += 1
+            sweep = self._writes % self.SWEEP_EVERY == 0
+        if sweep:
+            self.sweep()
+
+    def sweep(self):
+        """
+        Drop expired rows and trim the SQLite tier to max_entries
+        """
+        try:
+            conn = self._connect()
+            expired = conn.execute(
+                "DELETE FROM cache_entries WHERE cache_name = ? AND created_at < ?",
+                (self.name, time.time() - self.ttl_seconds)
+            ).rowcount
+            evicted = conn.execute(
+                "DELETE FROM cache_entries WHERE cache_name = ? AND cache_key IN ("
+                "SELECT cache_key FROM cache_entries WHERE cache_name = ? "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.name, self.name, self.max_entries)
+            ).rowcount
+            conn.commit()
+            with self._lock:
+                self._stats["expired"] += expired
+                self._stats["evicted"] += evicted
+        except sqlite3.Error as e:
+            logger.warning(f"{self.name} cache sweep failed: {e}")
+
+    def clear(self):
+        """
+        Remove every entry from both tiers
+        """
+        with self._lock:
+            self._memory.clear()
+        conn = self._connect()
+        conn.execute("DELETE FROM cache_entries WHERE cache_name = ?", (self.name,))
+        conn.commit()
+
+    def stats(self) -> dict:
+        """
+        Return hit/miss counters and current tier sizes
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        try:
+            stats["disk_entries"] = self._connect().execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE cache_name = ?", (self.name,)
+            ).fetchone()[0]
+        except sqlite3.Error:
+            stats["disk_entries"] = None
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
@@ -0,0 +1,139 @@
+import hashlib
+import io
+import math
+import multiprocessing
+import wave
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from gtts import gTTS
+
+class TTSBackend:
+    """
+    Interface for text-to-speech engines used by the TTS cache.
+
+    Implementations must be picklable so they can run inside a process pool.
+    """
+
+    # Short identifier; part of every clip's cache key
+    name = "base"
+    extension = ".mp3"
+    media_type = "audio/mpeg"
+    # Whether clips can be played back-to-back as one byte stream (MP3 frames can, WAV files cannot)
+    concatenable = True
+
+    def synthesize(self, text: str, lang: str, voice: str) -> bytes:
+        """
+        Render text to audio bytes in this backend's format
+        """
+        raise NotImplementedError
+
+    def shutdown(self):
+        pass
+
+class GTTSBackend(TTSBackend):
+    """Google Translate TTS (needs network access; voice is the accent's top-level domain)"""
+
+    name = "gtts"
+
+    def synthesize(self, text: str, lang: str, voice: str) -> bytes:
+        buffer = io.BytesIO()
+        gTTS(text, lang=lang, tld=voice).write_to_fp(buffer)
+        return buffer.getvalue()
+
+class OfflineTTSBackend(TTSBackend):
+    """
+    Local stand-in engine that needs no network.
+
+    Renders one tone per word, with pitch derived from the word, into a 16-bit mono WAV
+    whose length tracks speaking time. Output is deterministic and the work is CPU-bound,
+    so it is suitable for offline development and for benchmarking the synthesis path.
+    """
+
+    name = "offline"
+    extension = ".wav"
+    media_type = "audio/wav"
+    concatenable = False
+
+    SAMPLE_RATE = 16000
+    WORD_SECONDS = 0.3
+    GAP_SECONDS = 0.05
+
+    def synthesize(self, text: str, lang: str, voice: str) -> bytes:
+        samples = array("h")
+        word_samples = int(self.SAMPLE_RATE * self.WORD_SECONDS)
+        gap = array("h", [0]) * int(self.SAMPLE_RATE * self.GAP_SECONDS)
+        for word in text.split():
+            digest = hashlib.md5(f"{lang}:{voice}:{word.lower()}".encode("utf-8")).digest()
+            frequency = 180 + digest[0] * 2
+            step = 2 * math.pi * frequency / self.SAMPLE_RATE
+            samples.extend(int(8000 * math.sin(step * i)) for i in range(word_samples))
+            samples.extend(gap)
+
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.SAMPLE_RATE)
+            wav.writeframes(samples.tobytes())
+        return buffer.getvalue()
+
+def _synthesize_in_process(backend: TTSBackend, text: str, lang: str, voice: str) -> bytes:
+    return backend.synthesize(text, lang, voice)
+
+class ProcessPoolTTSBackend(TTSBackend):
+    """
+    Runs another backend in a pool of worker processes.
+
+    CPU-bound engines then synthesize in parallel without holding the GIL, and the pool
+    size caps synthesis throughput independently of request concurrency.
+    """
+
+    def __init__(self, backend: TTSBackend, workers: int):
+        self.backend = backend
+        self.workers = workers
+        self.name = backend.name
+        self.extension = backend.extension
+        self.media_type = backend.media_type
+        self.concatenable = backend.concatenable
+        self._pool = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        # Spawn rather than fork: the server process has live threads
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def synthesize(self, text: str, lang: str, voice: str) -> bytes:
+        return self.pool.submit(_synthesize_in_process, self.backend, text, lang, voice).result()
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+TTS_BACKENDS = {
+    GTTSBackend.name: GTTSBackend,
+    OfflineTTSBackend.name: OfflineTTSBackend
+}
+
+def create_tts_backend(name: str, process_workers: int = 0) -> TTSBackend:
+    """
+    Build a TTS backend by name
+
+    Args:
+        name: "gtts" or "offline"
+        process_workers: When positive, run synthesis in this many worker processes
+
+    Returns:
+        The configured backend
+    """
+    if name not in TTS_BACKENDS:
+        raise ValueError(f"Unsupported TTS backend: {name}")
+    backend = TTS_BACKENDS[name]()
+    if process_workers > 0:
+        backend = ProcessPoolTTSBackend(backend, process_workers)
+    return backend
@@ -0,0 +1,334 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Tuple
+from config import settings
+from utils.audio_store import AudioStore, audio_store
+from utils.tts_backends import TTSBackend, GTTSBackend, create_tts_backend
+
+logger = logging.getLogger(__name__)
+
+# Sentence boundary: terminal punctuation (optionally closed by a quote or bracket) followed by whitespace
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|(?<=[.!?]['\")\]])\s+")
+
+def split_sentences(text: str, min_chars: int = 40) -> List[str]:
+    """
+    Split text into sentence chunks for incremental synthesis
+
+    Sentences shorter than min_chars are merged into the following one (or the previous
+    one at the end of the text), so short openers like "Great." do not become clips of
+    their own.
+
+    Args:
+        text: Text to split
+        min_chars: Minimum chunk length
+
+    Returns:
+        Non-empty chunks in reading order
+    """
+    chunks = []
+    pending = ""
+    for sentence in SENTENCE_BOUNDARY.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        pending = f"{pending} {sentence}" if pending else sentence
+        if len(pending) >= min_chars:
+            chunks.append(pending)
+            pending = ""
+    if pending:
+        if chunks:
+            chunks[-1] = f"{chunks[-1]} {pending}"
+        else:
+            chunks.append(pending)
+    return chunks
+
+def tts_cache_key(text: str, lang: str, voice: str, backend: str = "gtts") -> str:
+    """
+    Content-addressed key for one synthesized clip
+
+    Surrounding whitespace is ignored, so "Hello " and "Hello" share a clip. The backend
+    name is part of the key, so switching engines never serves another engine's clips.
+    """
+    payload = json.dumps([text.strip(), lang, voice, backend], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+class TTSCache:
+    """
+    Content-addressed cache of synthesized interview audio.
+
+    Each distinct (text, language, voice) clip is synthesized once by the configured
+    TTS backend and stored as tts_<sha256>.<ext> in the audio store, so its URL is stable across sessions.
+    The most recently served clips are also kept in memory. A clip the store has
+    evicted is synthesized again on its next request.
+
+    render_in_background() returns a clip's filename immediately and synthesizes it on a
+    bounded worker pool; /audio waits for the pending render via pending_render().
+    render_sentences() does the same per sentence, so long texts render in parallel and
+    playback can start as soon as the first sentence is ready.
+    """
+
+    FILENAME_PREFIX = "tts_"
+
+    def __init__(self, store: AudioStore, memory_entries: int = 64, lang: str = "en", voice: str = "com",
+                 workers: int = 4, backend: TTSBackend = None, playlist_entries: int = 1024):
+        self.store = store
+        self.backend = backend or GTTSBackend()
+        self.memory_entries = memory_entries
+        self.lang = lang
+        self.voice = voice
+        self.workers = workers
+        self.playlist_entries = playlist_entries
+
+        self._pool = None
+        # Background renders in progress, by clip filename
+        self._pending = {}
+
+        self._memory = OrderedDict()
+        # playlist_id -> [(clip filename, sentence)], most recently used last
+        self._playlists = OrderedDict()
+        self._lock = threading.Lock()
+        # One lock per key being synthesized, so concurrent requests for a clip render it once
+        self._render_locks = {}
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            # Requests for a clip whose background render was already under way
+            "pending_hits": 0,
+            "misses": 0,
+            "synthesis_errors": 0,
+            "background_renders": 0,
+            "sentence_playlists": 0
+        }
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        # Create the pool lazily so importing this module never starts threads
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tts")
+        return self._pool
+
+    def filename_for(self, key: str) -> str:
+        return f"{self.FILENAME_PREFIX}{key}{self.backend.extension}"
+
+    def filename_for_text(self, text: str, lang: str = None, voice: str = None) -> str:
+        return self.filename_for(tts_cache_key(text, lang or self.lang, voice or self.voice, self.backend.name))
+
+    def is_cache_file(self, filename: str) -> bool:
+        return filename.startswith(self.FILENAME_PREFIX) and filename.endswith(self.backend.extension)
+
+    def get_or_render(self, text: str, lang: str = None, voice: str = None) -> str:
+        """
+        Return the filename of the clip for text, synthesizing it only on a cache miss
+
+        Args:
+            text: Text to speak
+            lang: Language code (defaults to TTS_LANGUAGE)
+            voice: Voice or accent, as understood by the backend (defaults to TTS_VOICE)
+
+        Returns:
+            The clip filename, served at /audio/<filename>
+        """
+        lang = lang or self.lang
+        voice = voice or self.voice
+        key = tts_cache_key(text, lang, voice, self.backend.name)
+        filename = self.filename_for(key)
+
+        in_store = self.store.exists(filename)
+        with self._lock:
+            if key in self._memory and in_store:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                hit = True
+            else:
+                hit = False
+                render_lock = self._render_locks.setdefault(key, threading.Lock())
+        if hit:
+            self.store.touch(filename)
+            return filename
+
+        with render_lock:
+            try:
+                if self.store.exists(filename):
+                    self.store.touch(filename)
+                    with self._lock:
+                        self._stats["disk_hits"] += 1
+                    return filename
+
+                try:
+                    audio = self.backend.synthesize(text.strip(), lang, voice)
+                except Exception as e:
+                    logger.error(f"Text-to-speech synthesis failed: {str(e)}")
+                    with self._lock:
+                        self._stats["synthesis_errors"] += 1
+                    raise
+
+                self.store.write(filename, audio)
+                with self._lock:
+                    self._stats["misses"] += 1
+            finally:
+                with self._lock:
+                    self._render_locks.pop(key, None)
+
+        self._remember(key, audio)
+        return filename
+
+    def render_in_background(self, text: str, lang: str = None, voice: str = None) -> str:
+        """
+        Return the clip filename immediately and synthesize it on the worker pool if needed
+
+        Cached clips (and clips already being rendered) are not submitted again.
+        """
+        key = tts_cache_key(text, lang or self.lang, voice or self.voice, self.backend.name)
+        filename = self.filename_for(key)
+
+        with self._lock:
+            if filename in self._pending:
+                self._stats["pending_hits"] += 1
+                return filename
+        if self.store.exists(filename):
+            self.store.touch(filename)
+            with self._lock:
+                self._stats["memory_hits" if key in self._memory else "disk_hits"] += 1
+            return filename
+
+        with self._lock:
+            if filename in self._pending:
+                self._stats["pending_hits"] += 1
+                return filename
+            future = self.pool.submit(self.get_or_render, text, lang, voice)
+            self._pending[filename] = future
+            self._stats["background_renders"] += 1
+        future.add_done_callback(lambda _: self._forget_pending(filename))
+        return filename
+
+    def _forget_pending(self, filename: str):
+        with self._lock:
+            self._pending.pop(filename, None)
+
+    def render_sentences(self, text: str, min_chars: int = 40) -> Tuple[str, List[str]]:
+        """
+        Split text into sentences and render each one in the background, in reading order
+
+        Args:
+            text: Text to speak
+            min_chars: Minimum sentence chunk length (see split_sentences)
+
+        Returns:
+            (playlist_id, clip filenames in playback order); the id is content-addressed,
+            so the same text always maps to the same playlist
+        """
+        playlist_id = tts_cache_key(text, self.lang, self.voice, f"{self.backend.name}:sentences")
+        segments = [
+            (self.render_in_background(sentence), sentence)
+            for sentence in split_sentences(text, min_chars)
+        ]
+        with self._lock:
+            self._playlists[playlist_id] = segments
+            self._playlists.move_to_end(playlist_id)
+            while len(self._playlists) > self.playlist_entries:
+                self._playlists.popitem(last=False)
+            self._stats["sentence_playlists"] += 1
+        return playlist_id, [filename for filename, _ in segments]
+
+    def playlist(self, playlist_id: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        The (clip filename, sentence) segments of a playlist, or None if it is unknown
+        """
+        with self._lock:
+            segments = self._playlists.get(playlist_id)
+            if segments is not None:
+                self._playlists.move_to_end(playlist_id)
+        return segments
+
+    def prerender(self, texts) -> dict:
+        """
+        Render a known set of clips ahead of time and pin them in the audio store
+
+        Clips already on disk cost nothing, so this is cheap on every start after the first.
+
+        Returns:
+            Mapping of text to clip filename
+        """
+        filenames = {}
+        for text in texts:
+            filename = self.filename_for_text(text)
+            self.store.pin(filename)
+            filenames[text] = self.render_in_background(text)
+        return filenames
+
+    def pending_render(self, filename: str) -> Optional[Future]:
+        """
+        The future of an in-progress background render of filename, if any
+        """
+        with self._lock:
+            return self._pending.get(filename)
+
+    def read(self, filename: str) -> Optional[bytes]:
+        """
+        Return the bytes of a cached clip from memory or disk, or None if it is not cached
+        """
+        if not self.is_cache_file(filename):
+            return None
+        key = os.path.splitext(filename)[0][len(self.FILENAME_PREFIX):]
+
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+        if audio is not None:
+            self.store.touch(filename)
+            return audio
+
+        audio = self.store.read(filename)
+        if audio is not None:
+            self._remember(key, audio)
+        return audio
+
+    def _remember(self, key: str, audio: bytes):
+        with self._lock:
+            self._memory[key] = audio
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def stats(self) -> dict:
+        """
+        Report hit rates and how many synthesis calls the cache avoided
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["memory_bytes"] = sum(len(audio) for audio in self._memory.values())
+            stats["pending_renders"] = len(self._pending)
+            stats["playlists"] = len(self._playlists)
+        stats["backend"] = self.backend.name
+        hits = stats["memory_hits"] + stats["disk_hits"] + stats["pending_hits"]
+        lookups = hits + stats["misses"]
+        stats["synthesis_avoided"] = hits
+        stats["hit_rate"] = round(hits / lookups, 4) if lookups else 0.0
+        return stats
+
+    def shutdown(self):
+        """
+        Release the worker pool and the backend (used on application shutdown)
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        self.backend.shutdown()
+
+# Create shared cache instance
+tts_cache = TTSCache(
+    audio_store,
+    memory_entries=settings.TTS_CACHE_MEMORY_ENTRIES,
+    lang=settings.TTS_LANGUAGE,
+    voice=settings.TTS_VOICE,
+    workers=settings.TTS_WORKERS,
+    backend=create_tts_backend(settings.TTS_BACKEND, settings.TTS_PROCESS_WORKERS)
+)